@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# 수동 벤치마크: 실행 중인 서버(기본 http://localhost:8000)에 요청을 보내 측정하며 pytest 대상이 아님
+# 사용법: python bench_concurrency.py --rounds 5 --base-url http://localhost:8000
+
+import argparse
+import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BASE_URL = "http://localhost:8000"
+
+# 동시에 보낼 요청 묶음 (반 조회 + 채팅)
+REQUESTS = [
+    ("GET", "/api/classes", None),
+    ("POST", "/api/chat", {"message": "오늘 일정 알려줘", "user_id": 1}),
+    ("GET", "/api/classes?academic_year=2025", None),
+    ("POST", "/api/chat", {"message": "전체 학생 수 알려줘", "user_id": 1}),
+]
+
+
+def send_request(method, path, body):
+    """단일 요청 전송 후 소요 시간(초) 반환"""
+    started = time.perf_counter()
+    if method == "GET":
+        response = requests.get(f"{BASE_URL}{path}", timeout=120)
+    else:
+        response = requests.post(f"{BASE_URL}{path}", json=body, timeout=120)
+    elapsed = time.perf_counter() - started
+    return response.status_code, elapsed
+
+
+def bench_concurrent_requests(rounds: int = 5):
+    """/api/classes 와 /api/chat 동시 요청이 직렬화되지 않는지 순차/동시 실행 시간을 비교 (동시/순차 비율 반환)"""
+    
+    # 1. 순차 실행 기준 시간 측정
+    print("=== 1. 순차 요청 기준 측정 ===")
+    serial_total = 0.0
+    for method, path, body in REQUESTS * rounds:
+        status, elapsed = send_request(method, path, body)
+        serial_total += elapsed
+        print(f"  {method} {path} -> {status} ({elapsed * 1000:.0f}ms)")
+    print(f"순차 실행 총 소요 시간: {serial_total:.2f}초")
+    
+    # 2. 동시 실행 측정
+    print("\n=== 2. 동시 요청 측정 ===")
+    batch = REQUESTS * rounds
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(batch)) as pool:
+        results = list(pool.map(lambda req: send_request(*req), batch))
+    concurrent_wall = time.perf_counter() - started
+    
+    failed = [status for status, _ in results if status != 200]
+    slowest = max(elapsed for _, elapsed in results)
+    print(f"동시 실행 벽시계 시간: {concurrent_wall:.2f}초 (가장 느린 요청 {slowest:.2f}초)")
+    print(f"실패한 요청 수: {len(failed)}")
+    
+    # 3. 직렬화 여부 판단
+    # 요청들이 이벤트 루프에서 직렬화된다면 동시 실행 시간이 순차 실행 시간에 가까워짐
+    ratio = concurrent_wall / serial_total if serial_total > 0 else 0
+    print(f"\n=== 3. 결과 ===")
+    print(f"동시/순차 시간 비율: {ratio:.2f}")
+    
+    if not failed and ratio < 0.5:
+        print("✅ 동시 요청이 직렬화되지 않고 병렬로 처리됩니다.")
+    else:
+        print("❌ 동시 요청이 직렬화되고 있습니다. DB 스레드 풀 설정을 확인하세요.")
+    
+    return ratio
+
+
+def main():
+    global BASE_URL
+    parser = argparse.ArgumentParser(description="/api/classes, /api/chat 동시 요청 직렬화 여부 수동 벤치마크")
+    parser.add_argument("--rounds", type=int, default=5, help="요청 묶음 반복 횟수")
+    parser.add_argument("--base-url", default=BASE_URL, help="벤치마크할 서버 주소")
+    args = parser.parse_args()
+    BASE_URL = args.base_url
+    bench_concurrent_requests(args.rounds)
+
+
+if __name__ == "__main__":
+    main()
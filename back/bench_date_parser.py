@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import re
+import timeit
+from datetime import date, datetime, timedelta
+from services.date_parser import date_parser, COMMAND_CREATE, COMMAND_DELETE
+
+# 캘린더 챗봇에 실제로 들어오는 형태의 메시지
+MESSAGES = [
+    ("내일 오후 3시 학부모 상담 등록해줘", COMMAND_CREATE),
+    ("8월 6일 10시 교직원 회의 추가해줘", COMMAND_CREATE),
+    ("다음 주 수요일 3시 반 동아리 발표회 등록해줘", COMMAND_CREATE),
+    ("12/24 종업식 등록", COMMAND_CREATE),
+    ("내일 학부모 상담 삭제해줘", COMMAND_DELETE),
+    ("8월 6일 교직원 회의 취소해줘", COMMAND_DELETE),
+    ("8월 6일 일정 알려줘", None),
+    ("금요일 일정", None),
+]
+
+
+def legacy_parse(message: str, delete: bool):
+    """기존 방식 (날짜 패턴별 re.search 반복 + 제목 정리용 re.sub 연쇄), 비교 기준용"""
+    today = date.today()
+    target_date = today
+    if "오늘" in message:
+        target_date = today
+    elif "내일" in message:
+        target_date = today + timedelta(days=1)
+    elif "모레" in message:
+        target_date = today + timedelta(days=2)
+    elif "글피" in message:
+        target_date = today + timedelta(days=3)
+
+    for pattern in [r'(\d+)월\s*(\d+)일', r'(\d+)/(\d+)', r'(\d+)\s+(\d+)']:
+        match = re.search(pattern, message)
+        if match:
+            month, day = map(int, match.groups())
+            try:
+                target_date = date(2025, month, day)
+            except ValueError:
+                pass
+            break
+
+    time_pattern = r'(\d{1,2})시\s*(\d{0,2})?분?'
+    time_match = re.search(time_pattern, message)
+    start_time = None
+    if time_match:
+        hour = int(time_match.group(1))
+        minute = int(time_match.group(2)) if time_match.group(2) else 0
+        start_time = datetime.strptime(f"{hour:02d}:{minute:02d}", "%H:%M").time()
+
+    title = re.sub(time_pattern, '', message)
+    title = re.sub(r'오늘|내일|모레|글피', '', title)
+    title = re.sub(r'(\d+)월\s*(\d+)일', '', title)
+    title = re.sub(r'(\d+)/(\d+)', '', title)
+    if delete:
+        title = re.sub(r'삭제해줘|삭제|취소해줘|취소|일정\s*삭제|일정\s*취소', '', title)
+    else:
+        title = re.sub(r'등록해줘|등록|추가해줘|추가|일정\s*등록|일정\s*추가', '', title)
+    title = re.sub(r'에\s*', '', title)
+    title = re.sub(r'일정을\s*', '', title)
+    if delete:
+        for pattern in (r'일정이\s*', r'일정\s*', r'을\s*', r'이\s*', r'가\s*'):
+            title = re.sub(pattern, '', title)
+    return target_date, start_time, title.strip()
+
+
+def run_legacy():
+    for message, command in MESSAGES:
+        legacy_parse(message, command == COMMAND_DELETE)
+
+
+def run_parser():
+    for message, command in MESSAGES:
+        date_parser.parse(message, command=command)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="캘린더 챗봇 날짜/시간 파서 마이크로벤치마크")
+    parser.add_argument("--number", type=int, default=2000, help="반복당 실행 횟수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    calls = args.number * len(MESSAGES)
+    print(f"=== 메시지 {len(MESSAGES)}개 x {args.number}회, {args.repeat}회 반복 중 최솟값 ===")
+    results = {}
+    for name, func in (("기존 (re.search + re.sub 연쇄)", run_legacy), ("date_parser (단일 패스)", run_parser)):
+        best = min(timeit.repeat(func, number=args.number, repeat=args.repeat))
+        results[name] = best
+        print(f"  {name:<30} {best / calls * 1e6:>7.2f}us/메시지")
+    legacy, compiled = results.values()
+    print(f"속도 향상: {legacy / compiled:.2f}배")
+
+    print()
+    print("=== 파싱 결과 ===")
+    for message, command in MESSAGES:
+        parsed = date_parser.parse(message, command=command)
+        print(f"  {message}")
+        print(f"    날짜: {parsed.date_range}  시간: {parsed.time_range}  제목: '{parsed.title}'")
+
+
+if __name__ == "__main__":
+    main()
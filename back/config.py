@@ -1,4 +1,5 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -16,6 +17,61 @@ DB_NAME = os.getenv("DB_NAME", "last-pjt-31")
 
 DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
+# Database Pool Configuration
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+# 블로킹 DB 작업을 실행할 스레드 풀 크기 (커넥션 풀과 별도로 설정)
+DB_THREAD_POOL_SIZE = int(os.getenv("DB_THREAD_POOL_SIZE", "16"))
+# 한 요청 안에서 여러 조회를 병렬 실행할 스레드 풀 크기 (DB 스레드 풀 작업이 다시 제출하므로 별도 풀 사용)
+DB_FANOUT_POOL_SIZE = int(os.getenv("DB_FANOUT_POOL_SIZE", "8"))
+
+# Async Database Configuration (선택 사항 - USE_ASYNC_DB=true일 때만 사용)
+# 테스트에서는 "sqlite+aiosqlite:///./test.db" 같은 URL 사용 가능
+USE_ASYNC_DB = os.getenv("USE_ASYNC_DB", "False").lower() == "true"
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    f"mysql+aiomysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+)
+
+# Chat Context Cache Configuration (챗봇 컨텍스트 스냅샷 유지 시간, 초)
+CONTEXT_CACHE_TTL = int(os.getenv("CONTEXT_CACHE_TTL", "300"))
+
+# Chat Answer Cache Configuration (일정/출결/성적 챗봇 응답 캐시, 관련 데이터 쓰기 시 무효화)
+ANSWER_CACHE_ENABLED = os.getenv("ANSWER_CACHE_ENABLED", "True").lower() == "true"
+ANSWER_CACHE_MAX_SIZE = int(os.getenv("ANSWER_CACHE_MAX_SIZE", "512"))
+ANSWER_CACHE_TTL = int(os.getenv("ANSWER_CACHE_TTL", "600"))  # 초 (무효화 누락 대비 상한)
+
+# FAQ Router Configuration (사용법/기능 안내 질문을 LLM 호출 없이 로컬 매칭으로 답변)
+FAQ_ROUTER_ENABLED = os.getenv("FAQ_ROUTER_ENABLED", "True").lower() == "true"
+FAQ_MATCH_THRESHOLD = float(os.getenv("FAQ_MATCH_THRESHOLD", "0.65"))  # 코사인 유사도 임계값 (사용법 표현을 뺀 주제어 기준)
+FAQ_VECTOR_DIM = int(os.getenv("FAQ_VECTOR_DIM", "4096"))  # 문자 n-gram 해시 차원
+FAQ_FILE = os.getenv("FAQ_FILE", "")  # [{"questions": [...], "answer": "..."}] 형식의 추가 FAQ JSON 파일 (선택)
+
+# Event Title Index Configuration (날짜 없이 제목만 말한 일정 삭제용 사용자별 제목 2-gram 색인)
+EVENT_TITLE_INDEX_MAX_USERS = int(os.getenv("EVENT_TITLE_INDEX_MAX_USERS", "1000"))  # 초과 시 가장 오래 사용하지 않은 사용자부터 제거
+EVENT_TITLE_INDEX_TTL = int(os.getenv("EVENT_TITLE_INDEX_TTL", "300"))  # 다른 워커의 변경 반영을 위한 재적재 주기 (초)
+EVENT_TITLE_MIN_COVERAGE = float(os.getenv("EVENT_TITLE_MIN_COVERAGE", "0.6"))  # 말한 제목의 2-gram 중 일치해야 하는 비율
+
+# Chat State Configuration (후속 질문용 사용자별 대화 상태)
+CHAT_STATE_MAX_USERS = int(os.getenv("CHAT_STATE_MAX_USERS", "1000"))  # 초과 시 가장 오래 사용하지 않은 사용자부터 제거
+CHAT_STATE_IDLE_TTL = int(os.getenv("CHAT_STATE_IDLE_TTL", "1800"))  # 유휴 시간 초과 시 상태 만료 (초)
+CHAT_STATE_TURNS = int(os.getenv("CHAT_STATE_TURNS", "5"))  # 사용자별로 보관하는 최근 턴 수
+
+# Chat History Configuration (AI 응답에 전달하는 최근 대화 + 누적 요약)
+CHAT_HISTORY_ENABLED = os.getenv("CHAT_HISTORY_ENABLED", "True").lower() == "true"
+CHAT_HISTORY_TURNS = int(os.getenv("CHAT_HISTORY_TURNS", "4"))  # 원문 그대로 유지하는 최근 질문/답변 쌍 수
+CHAT_SUMMARY_MAX_TOKENS = int(os.getenv("CHAT_SUMMARY_MAX_TOKENS", "300"))  # 이전 대화 요약의 최대 토큰 수
+
+# Student Summary Configuration (학생별 성적/출결 종합 요약 일괄 생성, generate_student_summaries.py)
+STUDENT_SUMMARY_ENABLED = os.getenv("STUDENT_SUMMARY_ENABLED", "True").lower() == "true"  # 챗봇에서 저장된 요약 사용 여부
+STUDENT_SUMMARY_CONCURRENCY = int(os.getenv("STUDENT_SUMMARY_CONCURRENCY", "4"))  # 일괄 생성 시 동시 LLM 요청 수
+
+# AI Prompt Context Configuration (기본 AI 응답 시스템 프롬프트의 토큰 예산)
+AI_CONTEXT_TOKEN_BUDGET = int(os.getenv("AI_CONTEXT_TOKEN_BUDGET", "400"))
+AI_CONTEXT_MAX_TEACHERS = int(os.getenv("AI_CONTEXT_MAX_TEACHERS", "30"))
+AI_CONTEXT_MAX_CLASSES = int(os.getenv("AI_CONTEXT_MAX_CLASSES", "30"))
+AI_CONTEXT_SAMPLE_STUDENTS = int(os.getenv("AI_CONTEXT_SAMPLE_STUDENTS", "10"))
+
 # Server Configuration
 HOST = os.getenv("HOST", "0.0.0.0")
 PORT = int(os.getenv("PORT", "8000"))
@@ -33,30 +89,88 @@ GOOGLE_REDIRECT_URI = os.getenv("GOOGLE_REDIRECT_URI", "http://localhost:8000/au
 
 # AI Configuration
 AI_PROVIDER = os.getenv("AI_PROVIDER", "openai")  # openai 또는 gemini
+# 다중 제공자 모드: 우선순위 순서의 제공자 목록 (예: "openai,gemini"), 미설정 시 AI_PROVIDER만 사용
+AI_PROVIDERS = [name.strip().lower() for name in os.getenv("AI_PROVIDERS", AI_PROVIDER).split(",") if name.strip()]
 
 # OpenAI Configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 OPENAI_MAX_TOKENS = int(os.getenv("OPENAI_MAX_TOKENS", "500"))
 OPENAI_TEMPERATURE = float(os.getenv("OPENAI_TEMPERATURE", "0.7"))
+OPENAI_RPM = int(os.getenv("OPENAI_RPM", "500"))  # 분당 요청 수 한도 (0이면 제한 없음)
+OPENAI_TPM = int(os.getenv("OPENAI_TPM", "200000"))  # 분당 토큰 수 한도 (0이면 제한 없음)
 
 # Gemini Configuration
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
 GEMINI_MAX_TOKENS = int(os.getenv("GEMINI_MAX_TOKENS", "500"))
 GEMINI_TEMPERATURE = float(os.getenv("GEMINI_TEMPERATURE", "0.7"))
+GEMINI_RPM = int(os.getenv("GEMINI_RPM", "60"))
+GEMINI_TPM = int(os.getenv("GEMINI_TPM", "1000000"))
+
+# AI Client Configuration (비동기 클라이언트 연결 풀 / 동시 요청 제한 / 타임아웃)
+AI_MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", "8"))  # 동시에 진행 가능한 LLM 요청 수
+AI_REQUEST_TIMEOUT = float(os.getenv("AI_REQUEST_TIMEOUT", "30"))  # LLM 요청당 타임아웃 (초)
+AI_HTTP_MAX_CONNECTIONS = int(os.getenv("AI_HTTP_MAX_CONNECTIONS", "20"))
+AI_HTTP_MAX_KEEPALIVE = int(os.getenv("AI_HTTP_MAX_KEEPALIVE", "10"))
+
+# AI Scheduler Configuration (제공자별 RPM/TPM 토큰 버킷 + 우선순위 대기열)
+AI_SCHEDULER_MAX_WAIT = float(os.getenv("AI_SCHEDULER_MAX_WAIT", "20"))  # 이보다 오래 기다려야 하면 예상 대기 시간 안내
+
+# AI Tool Calling Configuration (LLM이 성적/출결/일정 조회 함수를 직접 호출하는 모드)
+AI_TOOLS_ENABLED = os.getenv("AI_TOOLS_ENABLED", "False").lower() == "true"
+AI_TOOL_MAX_ROUNDS = int(os.getenv("AI_TOOL_MAX_ROUNDS", "3"))  # 한 질문에서 허용하는 도구 호출 왕복 횟수
+AI_TOOL_MAX_ROWS = int(os.getenv("AI_TOOL_MAX_ROWS", "20"))  # 도구 결과 목록당 최대 행 수
+
+# AI Failover Configuration (헤지 요청 / 서킷 브레이커)
+AI_HEDGE_DELAY = float(os.getenv("AI_HEDGE_DELAY", "4.0"))  # 1순위 제공자의 p95 지연 예산 (초), 초과 시 다음 제공자에 헤지 요청
+AI_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("AI_CIRCUIT_FAILURE_THRESHOLD", "3"))  # 연속 오류 횟수
+AI_CIRCUIT_RESET_SECONDS = float(os.getenv("AI_CIRCUIT_RESET_SECONDS", "30"))  # 차단 후 재시도까지 대기 시간 (초)
+
+# AI Response Cache Configuration (LRU + TTL)
+AI_CACHE_ENABLED = os.getenv("AI_CACHE_ENABLED", "True").lower() == "true"
+AI_CACHE_MAX_SIZE = int(os.getenv("AI_CACHE_MAX_SIZE", "256"))
+AI_CACHE_TTL = int(os.getenv("AI_CACHE_TTL", "600"))  # 초
+AI_CACHE_MAX_TEMPERATURE = float(os.getenv("AI_CACHE_MAX_TEMPERATURE", "0.7"))  # 이보다 높은 temperature는 캐시하지 않음
+
+# Fake AI Configuration (AI_PROVIDER=fake, 네트워크 없는 부하/지연 테스트용)
+FAKE_AI_MODEL = os.getenv("FAKE_AI_MODEL", "fake-local")
+FAKE_AI_RESPONSE = os.getenv("FAKE_AI_RESPONSE", "안녕하세요! 학교 관리 시스템 AI 어시스턴트입니다. 무엇을 도와드릴까요?")
+FAKE_AI_ANSWERS_FILE = os.getenv("FAKE_AI_ANSWERS_FILE", "")  # {"키워드": "답변"} 형식의 JSON 파일 (선택)
+FAKE_AI_LATENCY_DIST = os.getenv("FAKE_AI_LATENCY_DIST", "fixed").lower()  # fixed, uniform, normal, lognormal
+FAKE_AI_LATENCY_MEAN = float(os.getenv("FAKE_AI_LATENCY_MEAN", "0"))  # 응답(첫 조각)까지 평균 지연 (초)
+FAKE_AI_LATENCY_STDDEV = float(os.getenv("FAKE_AI_LATENCY_STDDEV", "0"))
+FAKE_AI_LATENCY_MAX = float(os.getenv("FAKE_AI_LATENCY_MAX", "30"))
+FAKE_AI_ERROR_RATE = float(os.getenv("FAKE_AI_ERROR_RATE", "0"))  # 0~1, 장애 상황 재현용
+FAKE_AI_SEED = int(os.getenv("FAKE_AI_SEED", "42"))  # 같은 시드면 같은 지연/오류 순서 재현
+FAKE_AI_CHUNK_DELAY = float(os.getenv("FAKE_AI_CHUNK_DELAY", "0.05"))  # 스트리밍 조각 간격 (초)
+FAKE_AI_CHUNK_WORDS = int(os.getenv("FAKE_AI_CHUNK_WORDS", "1"))  # 스트리밍 조각당 어절 수
+FAKE_AI_RPM = int(os.getenv("FAKE_AI_RPM", "0"))
+FAKE_AI_TPM = int(os.getenv("FAKE_AI_TPM", "0"))
 
 # Database engine
 engine = create_engine(
     DATABASE_URL,
     echo=True,  # SQL 쿼리 로그 출력
     pool_pre_ping=True,   # 연결 상태 확인
-    pool_recycle=300      # 5분마다 연결 재생성
+    pool_recycle=300,     # 5분마다 연결 재생성
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW
 )
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async database engine (USE_ASYNC_DB=true일 때만 생성)
+async_engine = None
+AsyncSessionLocal = None
+if USE_ASYNC_DB:
+    async_engine_options = {"echo": True, "pool_pre_ping": True, "pool_recycle": 300}
+    if not ASYNC_DATABASE_URL.startswith("sqlite"):
+        async_engine_options.update(pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW)
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, **async_engine_options)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # Base class for models
 Base = declarative_base()
 
@@ -66,4 +180,12 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+# Dependency to get async database session (비활성화 시 None)
+async def get_async_db():
+    if AsyncSessionLocal is None:
+        yield None
+        return
+    async with AsyncSessionLocal() as db:
+        yield db
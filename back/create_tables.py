@@ -1,5 +1,5 @@
 from config import engine
-from models import AttendanceType, AttendanceReason, Attendance, MonthlyAttendance, YearlyAttendance, CalendarEvent
+from models import AttendanceType, AttendanceReason, Attendance, MonthlyAttendance, YearlyAttendance, CalendarEvent, StudentSummary
 
 def create_attendance_type_table():
     """AttendanceType 테이블 생성"""
@@ -61,10 +61,21 @@ def create_calendar_event_table():
         print(f"❌ CalendarEvent 테이블 생성 실패: {e}")
         return False
 
+def create_student_summary_table():
+    """StudentSummary 테이블 생성"""
+    try:
+        StudentSummary.__table__.create(engine, checkfirst=True)
+        print("✅ StudentSummary 테이블 생성 완료!")
+        return True
+    except Exception as e:
+        print(f"❌ StudentSummary 테이블 생성 실패: {e}")
+        return False
+
 if __name__ == "__main__":
     create_attendance_type_table()
     create_attendance_reason_table()
     create_attendance_table()
     create_monthly_attendance_table()
     create_yearly_attendance_table()
-    create_calendar_event_table() 
\ No newline at end of file
+    create_calendar_event_table()
+    create_student_summary_table() 
\ No newline at end of file
@@ -1,8 +1,12 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+import asyncio
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import func, select
 from models import User, Class, Student, Grade, Subject, Exam, AttendanceType, AttendanceReason, Attendance, MonthlyAttendance, YearlyAttendance
-from config import SessionLocal
-from typing import List, Dict, Optional
+from config import SessionLocal, AsyncSessionLocal
+from services.context_cache import invalidate_database_context
+from services.answer_cache import invalidate_grade_answers, invalidate_attendance_answers
+from db_executor import run_parallel
+from typing import Any, Awaitable, Callable, List, Dict, Optional
 
 class DatabaseService:
     """기본 데이터베이스 서비스 클래스"""
@@ -11,6 +15,21 @@ class DatabaseService:
     def get_session():
         return SessionLocal()
     
+    @staticmethod
+    def fan_out(*queries: Callable[[Session], Any]) -> List[Any]:
+        """서로 독립적인 읽기 쿼리들을 각자의 세션(커넥션 풀의 별도 연결)에서 병렬 실행
+        각 쿼리는 세션을 받아 결과를 모두 읽은 값(.all() 등)을 반환해야 하며, 결과는 입력 순서대로 반환
+        """
+        def with_session(query):
+            def call():
+                session = SessionLocal()
+                try:
+                    return query(session)
+                finally:
+                    session.close()
+            return call
+        return run_parallel([with_session(query) for query in queries])
+    
     @staticmethod
     def test_connection() -> bool:
         """데이터베이스 연결 테스트"""
@@ -183,6 +202,7 @@ class DatabaseService:
             db.add(new_class)
             db.commit()
             
+            invalidate_database_context()
             print(f"{academic_year}년 {grade}학년 {class_num}반이 성공적으로 생성되었습니다.")
             return True
             
@@ -211,6 +231,7 @@ class DatabaseService:
             db.add(new_student)
             db.commit()
             
+            invalidate_database_context()
             print(f"학생 '{name}'이(가) 성공적으로 생성되었습니다.")
             return True
             
@@ -317,6 +338,7 @@ class DatabaseService:
             db.add(new_grade)
             db.commit()
             
+            invalidate_grade_answers()
             print(f"성적이 성공적으로 생성되었습니다.")
             return True
             
@@ -407,6 +429,7 @@ class DatabaseService:
                 )
                 session.add(new_attendance_type)
                 session.commit()
+                invalidate_attendance_answers()
                 return True
         except Exception as e:
             print(f"출결 유형 생성 실패: {e}")
@@ -450,6 +473,7 @@ class DatabaseService:
                         session.add(new_type)
                 
                 session.commit()
+                invalidate_attendance_answers()
                 print("✅ 기본 출결 유형 초기화 완료!")
                 return True
         except Exception as e:
@@ -468,6 +492,7 @@ class DatabaseService:
                 )
                 session.add(new_attendance_reason)
                 session.commit()
+                invalidate_attendance_answers()
                 return True
         except Exception as e:
             print(f"결석 사유 생성 실패: {e}")
@@ -511,6 +536,7 @@ class DatabaseService:
                         session.add(new_reason)
                 
                 session.commit()
+                invalidate_attendance_answers()
                 print("✅ 기본 결석 사유 초기화 완료!")
                 return True
         except Exception as e:
@@ -532,6 +558,7 @@ class DatabaseService:
                 )
                 session.add(new_attendance)
                 session.commit()
+                invalidate_attendance_answers()
                 return True
         except Exception as e:
             print(f"출결 기록 생성 실패: {e}")
@@ -634,6 +661,7 @@ class DatabaseService:
                     session.add(new_monthly)
                 
                 session.commit()
+                invalidate_attendance_answers()
                 return True
         except Exception as e:
             print(f"월별 출결 통계 생성 실패: {e}")
@@ -693,7 +721,7 @@ class DatabaseService:
                 late_days = len([a for a in attendances if a.type_id == 3])     # 지각
                 early_leave_days = len([a for a in attendances if a.type_id == 4])  # 조퇴
                 
-                # 월별 통계 생성/업데이트
+                # 월별 통계 생성/업데이트 (커밋 후 출결 답변 캐시 무효화 포함)
                 return DatabaseService.create_monthly_attendance(
                     student_id=student_id,
                     year=year,
@@ -748,6 +776,7 @@ class DatabaseService:
                     session.add(new_yearly)
                 
                 session.commit()
+                invalidate_attendance_answers()
                 return True
         except Exception as e:
             print(f"연도별 출결 통계 생성 실패: {e}")
@@ -803,7 +832,7 @@ class DatabaseService:
                 late_days = len([a for a in attendances if a.type_id == 3])     # 지각
                 early_leave_days = len([a for a in attendances if a.type_id == 4])  # 조퇴
                 
-                # 연도별 통계 생성/업데이트
+                # 연도별 통계 생성/업데이트 (커밋 후 출결 답변 캐시 무효화 포함)
                 return DatabaseService.create_yearly_attendance(
                     student_id=student_id,
                     year=year,
@@ -817,5 +846,407 @@ class DatabaseService:
         except Exception as e:
             print(f"연도별 출결 통계 계산 실패: {e}")
             return False
+
+
+class AsyncDatabaseService:
+    """비동기 데이터베이스 서비스 클래스 (USE_ASYNC_DB=true일 때 사용)"""
+    
+    @staticmethod
+    def get_session():
+        if AsyncSessionLocal is None:
+            raise RuntimeError("비동기 DB 엔진이 활성화되지 않았습니다. USE_ASYNC_DB=true로 설정하세요.")
+        return AsyncSessionLocal()
+    
+    @staticmethod
+    async def fan_out(*queries: Callable[[Any], Awaitable[Any]]) -> List[Any]:
+        """서로 독립적인 읽기 쿼리들을 각자의 AsyncSession에서 동시에 실행 (한 세션은 동시 쿼리를 지원하지 않음)"""
+        async def with_session(query):
+            async with AsyncDatabaseService.get_session() as session:
+                return await query(session)
+        return list(await asyncio.gather(*(with_session(query) for query in queries)))
+    
+    # 반 관련 기능들
+    @staticmethod
+    async def get_all_classes(academic_year: int = 2024) -> List[Dict]:
+        """모든 반 정보 조회"""
+        try:
+            async with AsyncDatabaseService.get_session() as session:
+                result = await session.execute(
+                    select(Class)
+                    .options(selectinload(Class.teacher))
+                    .where(Class.academic_year == academic_year)
+                )
+                classes = result.scalars().all()
+                
+                return [
+                    {
+                        "id": class_obj.id,
+                        "academic_year": class_obj.academic_year,
+                        "grade": class_obj.grade,
+                        "class_num": class_obj.class_num,
+                        "teacher_name": class_obj.teacher.name if class_obj.teacher else None,
+                        "teacher_id": class_obj.teacher_id
+                    }
+                    for class_obj in classes
+                ]
+        except Exception as e:
+            print(f"반 정보 조회 오류: {e}")
+            return []
+    
+    @staticmethod
+    async def get_classes_by_teacher(teacher_id: int, academic_year: int = 2024) -> List[Dict]:
+        """특정 선생님이 담당하는 모든 반 조회"""
+        try:
+            async with AsyncDatabaseService.get_session() as session:
+                result = await session.execute(
+                    select(Class).where(
+                        Class.teacher_id == teacher_id,
+                        Class.academic_year == academic_year
+                    )
+                )
+                classes = result.scalars().all()
+                
+                return [
+                    {
+                        "id": class_obj.id,
+                        "academic_year": class_obj.academic_year,
+                        "grade": class_obj.grade,
+                        "class_num": class_obj.class_num
+                    }
+                    for class_obj in classes
+                ]
+        except Exception as e:
+            print(f"선생님 반 조회 오류: {e}")
+            return []
+    
+    @staticmethod
+    async def get_all_teachers() -> List[Dict]:
+        """모든 선생님 조회"""
+        try:
+            async with AsyncDatabaseService.get_session() as session:
+                result = await session.execute(
+                    select(User)
+                    .options(selectinload(User.classes))
+                    .where(User.is_active == True)
+                )
+                users = result.scalars().all()
+                
+                return [
+                    {
+                        "id": user.id,
+                        "name": user.name,
+                        "login_id": user.login_id,
+                        "classes": [
+                            {
+                                "academic_year": class_obj.academic_year,
+                                "grade": class_obj.grade,
+                                "class_num": class_obj.class_num
+                            }
+                            for class_obj in user.classes
+                        ]
+                    }
+                    for user in users
+                ]
+        except Exception as e:
+            print(f"선생님 조회 오류: {e}")
+            return []
     
- 
\ No newline at end of file
+    @staticmethod
+    async def get_homeroom_teacher(grade: int, class_num: int, academic_year: int = 2024) -> Optional[Dict]:
+        """특정 반의 담임선생님 조회"""
+        try:
+            async with AsyncDatabaseService.get_session() as session:
+                result = await session.execute(
+                    select(Class)
+                    .options(selectinload(Class.teacher))
+                    .where(
+                        Class.academic_year == academic_year,
+                        Class.grade == grade,
+                        Class.class_num == class_num
+                    )
+                )
+                class_obj = result.scalars().first()
+                
+                if not class_obj or not class_obj.teacher:
+                    return None
+                
+                teacher = class_obj.teacher
+                return {
+                    "id": teacher.id,
+                    "name": teacher.name,
+                    "login_id": teacher.login_id,
+                    "grade": class_obj.grade,
+                    "class_num": class_obj.class_num,
+                    "academic_year": class_obj.academic_year
+                }
+        except Exception as e:
+            print(f"담임선생님 조회 오류: {e}")
+            return None
+    
+    @staticmethod
+    async def create_class(grade: int, class_num: int, teacher_id: int, academic_year: int = 2024) -> bool:
+        """새로운 반 생성"""
+        try:
+            async with AsyncDatabaseService.get_session() as session:
+                # 이미 존재하는지 확인
+                result = await session.execute(
+                    select(Class.id).where(
+                        Class.academic_year == academic_year,
+                        Class.grade == grade,
+                        Class.class_num == class_num
+                    )
+                )
+                if result.first():
+                    print(f"{academic_year}년 {grade}학년 {class_num}반이 이미 존재합니다.")
+                    return False
+                
+                # 새 반 생성
+                session.add(Class(academic_year=academic_year, grade=grade, class_num=class_num, teacher_id=teacher_id))
+                await session.commit()
+                
+                invalidate_database_context()
+                print(f"{academic_year}년 {grade}학년 {class_num}반이 성공적으로 생성되었습니다.")
+                return True
+        except Exception as e:
+            print(f"반 생성 오류: {e}")
+            return False
+    
+    # 학생 관련 기능들
+    @staticmethod
+    async def create_student(name: str, class_id: int, academic_year: int = 2024) -> bool:
+        """새로운 학생 생성"""
+        try:
+            async with AsyncDatabaseService.get_session() as session:
+                # 반이 존재하는지 확인
+                class_obj = await session.get(Class, class_id)
+                if not class_obj:
+                    print(f"반 ID {class_id}가 존재하지 않습니다.")
+                    return False
+                
+                # 새 학생 생성
+                session.add(Student(name=name, class_id=class_id, academic_year=academic_year))
+                await session.commit()
+                
+                invalidate_database_context()
+                print(f"학생 '{name}'이(가) 성공적으로 생성되었습니다.")
+                return True
+        except Exception as e:
+            print(f"학생 생성 오류: {e}")
+            return False
+    
+    @staticmethod
+    async def get_students_by_class(class_id: int, academic_year: int = 2024) -> List[Dict]:
+        """특정 반의 학생들 조회"""
+        try:
+            async with AsyncDatabaseService.get_session() as session:
+                result = await session.execute(
+                    select(Student).where(
+                        Student.class_id == class_id,
+                        Student.academic_year == academic_year
+                    )
+                )
+                students = result.scalars().all()
+                
+                return [
+                    {
+                        "id": student.id,
+                        "name": student.name,
+                        "academic_year": student.academic_year,
+                        "class_id": student.class_id
+                    }
+                    for student in students
+                ]
+        except Exception as e:
+            print(f"학생 조회 오류: {e}")
+            return []
+    
+    @staticmethod
+    async def get_all_students(academic_year: int = 2024) -> List[Dict]:
+        """모든 학생 조회"""
+        try:
+            async with AsyncDatabaseService.get_session() as session:
+                result = await session.execute(
+                    select(Student)
+                    .options(selectinload(Student.class_info))
+                    .where(Student.academic_year == academic_year)
+                )
+                students = result.scalars().all()
+                
+                return [
+                    {
+                        "id": student.id,
+                        "name": student.name,
+                        "academic_year": student.academic_year,
+                        "class_id": student.class_id,
+                        "class_info": f"{student.class_info.grade}학년 {student.class_info.class_num}반" if student.class_info else None
+                    }
+                    for student in students
+                ]
+        except Exception as e:
+            print(f"전체 학생 조회 오류: {e}")
+            return []
+    
+    # 성적 관련 기능들
+    @staticmethod
+    async def create_grade(student_id: int, subject_id: int, exam_id: int, score: int, academic_year: int = 2024) -> bool:
+        """새로운 성적 생성"""
+        try:
+            async with AsyncDatabaseService.get_session() as session:
+                # 학생/과목/시험이 존재하는지 확인
+                if not await session.get(Student, student_id):
+                    print(f"학생 ID {student_id}가 존재하지 않습니다.")
+                    return False
+                if not await session.get(Subject, subject_id):
+                    print(f"과목 ID {subject_id}가 존재하지 않습니다.")
+                    return False
+                if not await session.get(Exam, exam_id):
+                    print(f"시험 ID {exam_id}가 존재하지 않습니다.")
+                    return False
+                
+                # 이미 동일한 성적이 있는지 확인
+                result = await session.execute(
+                    select(Grade.id).where(
+                        Grade.student_id == student_id,
+                        Grade.subject_id == subject_id,
+                        Grade.exam_id == exam_id,
+                        Grade.academic_year == academic_year
+                    )
+                )
+                if result.first():
+                    print(f"이미 동일한 성적이 존재합니다.")
+                    return False
+                
+                # 새 성적 생성
+                session.add(Grade(
+                    student_id=student_id,
+                    subject_id=subject_id,
+                    exam_id=exam_id,
+                    score=score,
+                    academic_year=academic_year
+                ))
+                await session.commit()
+                
+                invalidate_grade_answers()
+                print(f"성적이 성공적으로 생성되었습니다.")
+                return True
+        except Exception as e:
+            print(f"성적 생성 오류: {e}")
+            return False
+    
+    @staticmethod
+    async def get_student_grades(student_id: int, academic_year: int = 2024) -> List[Dict]:
+        """특정 학생의 성적 조회"""
+        try:
+            async with AsyncDatabaseService.get_session() as session:
+                result = await session.execute(
+                    select(
+                        Grade.score,
+                        Subject.name.label('subject_name'),
+                        Exam.name.label('exam_name')
+                    ).join(
+                        Subject, Grade.subject_id == Subject.id
+                    ).join(
+                        Exam, Grade.exam_id == Exam.id
+                    ).where(
+                        Grade.student_id == student_id,
+                        Grade.academic_year == academic_year
+                    )
+                )
+                
+                return [
+                    {
+                        "subject": grade.subject_name,
+                        "exam": grade.exam_name,
+                        "score": grade.score
+                    }
+                    for grade in result.all()
+                ]
+        except Exception as e:
+            print(f"학생 성적 조회 오류: {e}")
+            return []
+    
+    @staticmethod
+    async def get_class_grades(class_id: int, academic_year: int = 2024) -> List[Dict]:
+        """특정 반의 모든 성적 조회"""
+        try:
+            async with AsyncDatabaseService.get_session() as session:
+                result = await session.execute(
+                    select(
+                        Student.name.label('student_name'),
+                        Subject.name.label('subject_name'),
+                        Exam.name.label('exam_name'),
+                        Grade.score
+                    ).join(
+                        Student, Grade.student_id == Student.id
+                    ).join(
+                        Subject, Grade.subject_id == Subject.id
+                    ).join(
+                        Exam, Grade.exam_id == Exam.id
+                    ).where(
+                        Student.class_id == class_id,
+                        Grade.academic_year == academic_year
+                    )
+                )
+                
+                return [
+                    {
+                        "student_name": grade.student_name,
+                        "subject": grade.subject_name,
+                        "exam": grade.exam_name,
+                        "score": grade.score
+                    }
+                    for grade in result.all()
+                ]
+        except Exception as e:
+            print(f"반 성적 조회 오류: {e}")
+            return []
+    
+    # 출결 관련 기능들
+    @staticmethod
+    async def create_attendance(student_id: int, type_id: int, date: str, reason_id: int = None, reason_detail: str = None, note: str = None) -> bool:
+        """출결 기록 생성"""
+        try:
+            async with AsyncDatabaseService.get_session() as session:
+                session.add(Attendance(
+                    student_id=student_id,
+                    type_id=type_id,
+                    reason_id=reason_id,
+                    date=date,
+                    reason_detail=reason_detail,
+                    note=note
+                ))
+                await session.commit()
+                invalidate_attendance_answers()
+                return True
+        except Exception as e:
+            print(f"출결 기록 생성 실패: {e}")
+            return False
+    
+    @staticmethod
+    async def get_student_attendances(student_id: int, start_date: str = None, end_date: str = None):
+        """학생별 출결 기록 조회"""
+        try:
+            async with AsyncDatabaseService.get_session() as session:
+                query = select(Attendance).where(Attendance.student_id == student_id)
+                
+                if start_date:
+                    query = query.where(Attendance.date >= start_date)
+                if end_date:
+                    query = query.where(Attendance.date <= end_date)
+                
+                result = await session.execute(query.order_by(Attendance.date.desc()))
+                return [
+                    {
+                        "id": a.id,
+                        "student_id": a.student_id,
+                        "type_id": a.type_id,
+                        "reason_id": a.reason_id,
+                        "date": a.date.strftime("%Y-%m-%d"),
+                        "reason_detail": a.reason_detail,
+                        "note": a.note,
+                        "created_at": a.created_at.strftime("%Y-%m-%d %H:%M:%S")
+                    } for a in result.scalars().all()
+                ]
+        except Exception as e:
+            print(f"학생 출결 기록 조회 실패: {e}")
+            return []
@@ -0,0 +1,55 @@
+"""
+블로킹 DB 작업 실행기
+동기 SQLAlchemy 작업을 이벤트 루프 밖의 제한된 스레드 풀에서 실행하는 기능
+"""
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, List
+from config import DB_THREAD_POOL_SIZE, DB_FANOUT_POOL_SIZE, USE_ASYNC_DB
+
+# 전역 DB 스레드 풀 (커넥션 풀 크기와 별도로 설정)
+db_executor = ThreadPoolExecutor(max_workers=DB_THREAD_POOL_SIZE, thread_name_prefix="db-worker")
+
+# 요청 내 병렬 조회용 스레드 풀 (db_executor 작업이 제출해도 교착되지 않도록 분리)
+fanout_executor = ThreadPoolExecutor(max_workers=DB_FANOUT_POOL_SIZE, thread_name_prefix="db-fanout")
+
+
+async def run_db(func, *args, **kwargs):
+    """동기 DB 함수를 스레드 풀에서 실행하고 결과를 기다림
+    (요청 범위 메모 등 contextvars가 작업 스레드에서도 보이도록 현재 컨텍스트를 복사해 실행)
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(db_executor, partial(context.run, func, *args, **kwargs))
+
+
+async def run_db_service(method, *args, **kwargs):
+    """DatabaseService 메서드 실행 (USE_ASYNC_DB=true이고 비동기 버전이 있으면 비동기 엔진 사용)"""
+    if USE_ASYNC_DB:
+        from database_service import AsyncDatabaseService
+        async_method = getattr(AsyncDatabaseService, method.__name__, None)
+        if async_method is not None:
+            return await async_method(*args, **kwargs)
+    return await run_db(method, *args, **kwargs)
+
+
+def run_parallel(calls: List[Callable[[], Any]]) -> List[Any]:
+    """독립적인 동기 작업들을 병렬 실행하고 입력 순서대로 결과 반환 (전체 시간 = 가장 느린 작업)
+    각 작업은 자체 세션을 사용해야 하며, 작업이 하나뿐이면 현재 스레드에서 바로 실행
+    """
+    # 병렬 작업 안에서 다시 호출된 경우 같은 풀을 기다리며 교착되지 않도록 현재 스레드에서 순차 실행
+    if len(calls) <= 1 or threading.current_thread().name.startswith("db-fanout"):
+        return [call() for call in calls]
+    futures = [fanout_executor.submit(contextvars.copy_context().run, call) for call in calls[1:]]
+    first = calls[0]()
+    return [first] + [future.result() for future in futures]
+
+
+def shutdown_db_executor():
+    """DB 스레드 풀 종료"""
+    db_executor.shutdown(wait=False)
+    fanout_executor.shutdown(wait=False)
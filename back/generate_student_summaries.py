@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import asyncio
+import time
+from datetime import date
+from config import STUDENT_SUMMARY_CONCURRENCY
+from db_executor import shutdown_db_executor
+from services.ai_service import ai_service
+from services.student_summary_service import generate_student_summaries
+
+# 야간 cron 등에서 실행: 학년도 전체 학생의 종합 요약을 생성하고, 데이터가 바뀐 학생만 새 버전으로 저장
+# 예) 0 2 * * * cd /app/back && python generate_student_summaries.py --year 2025
+
+
+async def run(academic_year: int, concurrency: int, force: bool):
+    try:
+        return await generate_student_summaries(academic_year, concurrency, force)
+    finally:
+        await ai_service.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="학생별 종합 요약 일괄 생성")
+    parser.add_argument("--year", type=int, default=date.today().year, help="대상 학년도")
+    parser.add_argument("--concurrency", type=int, default=STUDENT_SUMMARY_CONCURRENCY, help="동시 LLM 요청 수")
+    parser.add_argument("--force", action="store_true", help="데이터 변경 여부와 관계없이 모두 재생성")
+    args = parser.parse_args()
+
+    print(f"=== {args.year}학년도 학생 요약 생성 (동시 요청 {args.concurrency}개) ===")
+    started = time.monotonic()
+    try:
+        stats = asyncio.run(run(args.year, args.concurrency, args.force))
+    finally:
+        shutdown_db_executor()
+
+    print(f"대상 학생: {stats['students']}명")
+    print(f"  생성: {stats['generated']}명")
+    print(f"  변경 없음: {stats['unchanged']}명")
+    print(f"  데이터 없음: {stats['empty']}명")
+    print(f"  실패: {stats['failed']}명")
+    print(f"소요 시간: {time.monotonic() - started:.1f}초")
+
+
+if __name__ == "__main__":
+    main()
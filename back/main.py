@@ -1,15 +1,21 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from config import get_async_db
 from database_service import DatabaseService
+from db_executor import run_db, run_db_service, shutdown_db_executor
 from simple_auth import get_db, get_all_users, initialize_users
 import simple_auth
 from services.user_service import get_teacher_list, get_student_list, get_teacher_students, get_class_students
 from services.grade_service import get_student_grades, get_class_grades_summary, get_subject_analysis, get_top_students, get_bottom_students, get_grade_bottom_students, get_exam_analysis, get_subject_exam_analysis
-from services.calendar_service import CalendarService
+from services.calendar_service import CalendarService, AsyncCalendarService
 from pydantic import BaseModel
 from typing import List, Optional
-from datetime import date
+from datetime import date, time
+import json
 
 app = FastAPI(title="학교 관리 시스템 API", version="1.0.0")
 
@@ -76,7 +82,7 @@ async def health_check():
 async def get_system_status():
     """시스템 상태 조회"""
     try:
-        db_status = DatabaseService.test_connection()
+        db_status = await run_db_service(DatabaseService.test_connection)
         return {
             "status": "running",
             "database": "connected" if db_status else "disconnected",
@@ -109,7 +115,7 @@ async def get_auth_info():
 async def get_all_classes(academic_year: int = 2024):
     """모든 반 정보 조회"""
     try:
-        classes = DatabaseService.get_all_classes(academic_year)
+        classes = await run_db_service(DatabaseService.get_all_classes, academic_year)
         return {
             "success": True,
             "data": classes,
@@ -123,7 +129,7 @@ async def get_all_classes(academic_year: int = 2024):
 async def get_teacher_classes(teacher_id: int, academic_year: int = 2024):
     """특정 선생님이 담당하는 모든 반 조회"""
     try:
-        classes = DatabaseService.get_classes_by_teacher(teacher_id, academic_year)
+        classes = await run_db_service(DatabaseService.get_classes_by_teacher, teacher_id, academic_year)
         return {
             "success": True,
             "data": classes,
@@ -138,7 +144,7 @@ async def get_teacher_classes(teacher_id: int, academic_year: int = 2024):
 async def get_all_teachers():
     """모든 선생님 조회"""
     try:
-        teachers = DatabaseService.get_all_teachers()
+        teachers = await run_db_service(DatabaseService.get_all_teachers)
         return {
             "success": True,
             "data": teachers,
@@ -151,7 +157,7 @@ async def get_all_teachers():
 async def get_homeroom_teacher(grade: int, class_num: int, academic_year: int = 2024):
     """특정 반의 담임선생님 조회"""
     try:
-        teacher = DatabaseService.get_homeroom_teacher(grade, class_num, academic_year)
+        teacher = await run_db_service(DatabaseService.get_homeroom_teacher, grade, class_num, academic_year)
         if not teacher:
             raise HTTPException(status_code=404, detail="담임선생님을 찾을 수 없습니다.")
         
@@ -168,7 +174,7 @@ async def get_homeroom_teacher(grade: int, class_num: int, academic_year: int =
 async def create_class(grade: int, class_num: int, teacher_id: int, academic_year: int = 2024):
     """새로운 반 생성"""
     try:
-        success = DatabaseService.create_class(grade, class_num, teacher_id, academic_year)
+        success = await run_db_service(DatabaseService.create_class, grade, class_num, teacher_id, academic_year)
         if not success:
             raise HTTPException(status_code=400, detail="반 생성에 실패했습니다.")
         
@@ -186,7 +192,7 @@ async def create_class(grade: int, class_num: int, teacher_id: int, academic_yea
 async def create_student(request: StudentCreateRequest):
     """새로운 학생 생성"""
     try:
-        success = DatabaseService.create_student(
+        success = await run_db_service(DatabaseService.create_student,
             request.name, 
             request.class_id, 
             request.academic_year
@@ -207,7 +213,7 @@ async def create_student(request: StudentCreateRequest):
 async def get_all_students(academic_year: int = 2024):
     """모든 학생 조회"""
     try:
-        students = DatabaseService.get_all_students(academic_year)
+        students = await run_db_service(DatabaseService.get_all_students, academic_year)
         return {
             "success": True,
             "data": students,
@@ -221,7 +227,7 @@ async def get_all_students(academic_year: int = 2024):
 async def get_students_by_class(class_id: int, academic_year: int = 2024):
     """특정 반의 학생들 조회"""
     try:
-        students = DatabaseService.get_students_by_class(class_id, academic_year)
+        students = await run_db_service(DatabaseService.get_students_by_class, class_id, academic_year)
         return {
             "success": True,
             "data": students,
@@ -237,7 +243,7 @@ async def get_students_by_class(class_id: int, academic_year: int = 2024):
 async def create_grade(request: GradeCreateRequest):
     """새로운 성적 생성"""
     try:
-        success = DatabaseService.create_grade(
+        success = await run_db_service(DatabaseService.create_grade,
             request.student_id,
             request.subject_id,
             request.exam_id,
@@ -260,7 +266,7 @@ async def create_grade(request: GradeCreateRequest):
 async def get_student_grades_api(student_id: int, academic_year: int = 2024):
     """특정 학생의 성적 조회"""
     try:
-        grades = DatabaseService.get_student_grades(student_id, academic_year)
+        grades = await run_db_service(DatabaseService.get_student_grades, student_id, academic_year)
         return {
             "success": True,
             "data": grades,
@@ -275,7 +281,7 @@ async def get_student_grades_api(student_id: int, academic_year: int = 2024):
 async def get_class_grades_api(class_id: int, academic_year: int = 2024):
     """특정 반의 모든 성적 조회"""
     try:
-        grades = DatabaseService.get_class_grades(class_id, academic_year)
+        grades = await run_db_service(DatabaseService.get_class_grades, class_id, academic_year)
         return {
             "success": True,
             "data": grades,
@@ -291,7 +297,7 @@ async def get_class_grades_api(class_id: int, academic_year: int = 2024):
 async def get_all_tables():
     """데이터베이스의 모든 테이블 목록 조회"""
     try:
-        tables = DatabaseService.get_all_tables()
+        tables = await run_db_service(DatabaseService.get_all_tables)
         return {
             "success": True,
             "tables": tables,
@@ -305,13 +311,16 @@ app.include_router(simple_auth.router, prefix="/api", tags=["인증"])
 
 # 채팅 관련 엔드포인트
 @app.post("/api/chat")
-async def chat_endpoint(chat_request: ChatRequest, db: Session = Depends(get_db)):
+async def chat_endpoint(chat_request: ChatRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
     """채팅 메시지 처리 (새로운 서비스 사용)"""
     try:
-        from services.chat_router import process_chat_message
+        from services.chat_router import process_chat_message_async
+        from services.chat_history import chat_history
         # 사용자 ID 설정 (요청에서 받거나 기본값 1)
         user_id = chat_request.user_id if chat_request.user_id else 1
-        response = process_chat_message(chat_request, db, user_id)
+        response = await process_chat_message_async(chat_request, db, user_id)
+        # 오래된 대화 요약은 응답 반환 후 생성
+        background_tasks.add_task(chat_history.summarize_pending, user_id)
         return {
             "success": True,
             "response": response
@@ -319,12 +328,69 @@ async def chat_endpoint(chat_request: ChatRequest, db: Session = Depends(get_db)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"채팅 처리 실패: {str(e)}")
 
+def format_sse_event(event: str, data: dict) -> str:
+    """Server-Sent Events 형식의 메시지 생성"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@app.post("/api/chat/stream")
+async def chat_stream_endpoint(chat_request: ChatRequest, db: Session = Depends(get_db)):
+    """채팅 메시지 스트리밍 처리 (Server-Sent Events)
+    DB 기반 결정적 응답은 message 이벤트 한 번, AI 응답은 delta 이벤트로 토큰을 전달한 뒤 done 이벤트로 종료
+    """
+    from services.chat_router import stream_chat_message
+    from services.chat_history import chat_history
+    user_id = chat_request.user_id if chat_request.user_id else 1
+    
+    def event_stream():
+        try:
+            for event, content in stream_chat_message(chat_request, db, user_id):
+                yield format_sse_event(event, {"content": content})
+        except Exception as e:
+            print(f"채팅 스트리밍 오류: {e}")
+            yield format_sse_event("error", {"detail": f"채팅 처리 실패: {str(e)}"})
+        yield format_sse_event("done", {})
+    
+    # 동기 제너레이터는 Starlette 스레드 풀에서 순회되므로 이벤트 루프를 막지 않음
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # 스트림 전송이 끝난 뒤 오래된 대화 요약 생성
+        background=BackgroundTask(chat_history.summarize_pending, user_id)
+    )
+
+@app.get("/api/ai/stats")
+async def get_ai_stats():
+    """AI 서비스 통계 조회 (응답 캐시 적중률 등)"""
+    try:
+        from services.ai_service import ai_service
+        from services.prompt_builder import prompt_builder
+        from services.chat_state import chat_state_store
+        from services.chat_history import chat_history
+        from services.answer_cache import answer_cache
+        from services.entity_memo import entity_memo
+        from services.faq_router import faq_router
+        from services.event_title_index import event_title_index
+        return {
+            "success": True,
+            "data": ai_service.get_stats(),
+            "prompt_context_tokens": prompt_builder.last_token_count,
+            "chat_state": chat_state_store.get_stats(),
+            "chat_history": chat_history.get_stats(),
+            "answer_cache": answer_cache.get_stats(),
+            "entity_memo": entity_memo.get_stats(),
+            "faq_router": faq_router.get_stats(),
+            "event_title_index": event_title_index.get_stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"AI 통계 조회 실패: {str(e)}")
+
 # 기존 서비스 함수들 (호환성 유지)
 @app.get("/api/teacher-list")
 async def get_teacher_list_api(db: Session = Depends(get_db)):
     """선생님 명단 조회 (기존 호환성)"""
     try:
-        teacher_list = get_teacher_list(db)
+        teacher_list = await run_db(get_teacher_list, db)
         return {
             "success": True,
             "teachers": teacher_list
@@ -336,7 +402,7 @@ async def get_teacher_list_api(db: Session = Depends(get_db)):
 async def get_student_list_api(db: Session = Depends(get_db)):
     """전체 학생 명단 조회 (기존 호환성)"""
     try:
-        student_list = get_student_list(db)
+        student_list = await run_db(get_student_list, db)
         return {
             "success": True,
             "students": student_list
@@ -349,7 +415,7 @@ async def get_student_list_api(db: Session = Depends(get_db)):
 async def get_all_attendance_types():
     """모든 출결 유형 조회"""
     try:
-        attendance_types = DatabaseService.get_all_attendance_types()
+        attendance_types = await run_db_service(DatabaseService.get_all_attendance_types)
         return {
             "success": True,
             "data": attendance_types,
@@ -362,7 +428,7 @@ async def get_all_attendance_types():
 async def initialize_attendance_types():
     """기본 출결 유형 초기화"""
     try:
-        success = DatabaseService.initialize_attendance_types()
+        success = await run_db_service(DatabaseService.initialize_attendance_types)
         if not success:
             raise HTTPException(status_code=500, detail="출결 유형 초기화에 실패했습니다.")
         
@@ -380,7 +446,7 @@ async def initialize_attendance_types():
 async def get_all_attendance_reasons():
     """모든 결석 사유 조회"""
     try:
-        attendance_reasons = DatabaseService.get_all_attendance_reasons()
+        attendance_reasons = await run_db_service(DatabaseService.get_all_attendance_reasons)
         return {
             "success": True,
             "data": attendance_reasons,
@@ -393,7 +459,7 @@ async def get_all_attendance_reasons():
 async def initialize_attendance_reasons():
     """기본 결석 사유 초기화"""
     try:
-        success = DatabaseService.initialize_attendance_reasons()
+        success = await run_db_service(DatabaseService.initialize_attendance_reasons)
         if not success:
             raise HTTPException(status_code=500, detail="결석 사유 초기화에 실패했습니다.")
         
@@ -411,7 +477,7 @@ async def initialize_attendance_reasons():
 async def create_attendance(student_id: int, type_id: int, date: str, reason_id: int = None, reason_detail: str = None, note: str = None):
     """출결 기록 생성"""
     try:
-        success = DatabaseService.create_attendance(
+        success = await run_db_service(DatabaseService.create_attendance,
             student_id=student_id,
             type_id=type_id,
             date=date,
@@ -435,7 +501,7 @@ async def create_attendance(student_id: int, type_id: int, date: str, reason_id:
 async def get_student_attendance(student_id: int, start_date: str = None, end_date: str = None):
     """학생별 출결 기록 조회"""
     try:
-        attendances = DatabaseService.get_student_attendances(student_id, start_date, end_date)
+        attendances = await run_db_service(DatabaseService.get_student_attendances, student_id, start_date, end_date)
         return {
             "success": True,
             "data": attendances,
@@ -449,7 +515,7 @@ async def get_student_attendance(student_id: int, start_date: str = None, end_da
 async def get_class_attendance(class_id: int, date: str = None):
     """반별 출결 기록 조회"""
     try:
-        attendances = DatabaseService.get_class_attendances(class_id, date)
+        attendances = await run_db_service(DatabaseService.get_class_attendances, class_id, date)
         return {
             "success": True,
             "data": attendances,
@@ -464,7 +530,7 @@ async def get_class_attendance(class_id: int, date: str = None):
 async def get_student_monthly_attendance(student_id: int, year: int = None):
     """학생별 월별 출결 통계 조회"""
     try:
-        monthly_attendances = DatabaseService.get_student_monthly_attendance(student_id, year)
+        monthly_attendances = await run_db_service(DatabaseService.get_student_monthly_attendance, student_id, year)
         return {
             "success": True,
             "data": monthly_attendances,
@@ -478,7 +544,7 @@ async def get_student_monthly_attendance(student_id: int, year: int = None):
 async def calculate_monthly_attendance(student_id: int, year: int, month: int):
     """학생 월별 출결 통계 계산"""
     try:
-        success = DatabaseService.calculate_monthly_attendance(student_id, year, month)
+        success = await run_db_service(DatabaseService.calculate_monthly_attendance, student_id, year, month)
         if not success:
             raise HTTPException(status_code=500, detail="월별 출결 통계 계산에 실패했습니다.")
         
@@ -496,7 +562,7 @@ async def calculate_monthly_attendance(student_id: int, year: int, month: int):
 async def get_student_yearly_attendance(student_id: int, year: int = None):
     """학생별 연도별 출결 통계 조회"""
     try:
-        yearly_attendances = DatabaseService.get_student_yearly_attendance(student_id, year)
+        yearly_attendances = await run_db_service(DatabaseService.get_student_yearly_attendance, student_id, year)
         return {
             "success": True,
             "data": yearly_attendances,
@@ -510,7 +576,7 @@ async def get_student_yearly_attendance(student_id: int, year: int = None):
 async def calculate_yearly_attendance(student_id: int, year: int):
     """학생 연도별 출결 통계 계산"""
     try:
-        success = DatabaseService.calculate_yearly_attendance(student_id, year)
+        success = await run_db_service(DatabaseService.calculate_yearly_attendance, student_id, year)
         if not success:
             raise HTTPException(status_code=500, detail="연도별 출결 통계 계산에 실패했습니다.")
         
@@ -524,37 +590,56 @@ async def calculate_yearly_attendance(student_id: int, year: int):
         raise HTTPException(status_code=500, detail=f"연도별 출결 통계 계산 실패: {str(e)}")
 
 # 캘린더 관련 API 엔드포인트들
+def _serialize_event(event) -> dict:
+    """캘린더 이벤트를 JSON 직렬화 가능한 형태로 변환 (세션이 열려 있는 스레드에서 호출)"""
+    return {
+        "id": event.id,
+        "user_id": event.user_id,
+        "title": event.title,
+        "description": event.description,
+        "start_date": event.start_date.isoformat() if event.start_date else None,
+        "end_date": event.end_date.isoformat() if event.end_date else None,
+        "start_time": event.start_time.isoformat() if event.start_time else None,
+        "end_time": event.end_time.isoformat() if event.end_time else None,
+        "event_type": event.event_type,
+        "color": event.color,
+        "is_all_day": event.is_all_day,
+        "location": event.location,
+        "created_at": event.created_at.isoformat() if event.created_at else None,
+        "updated_at": event.updated_at.isoformat() if event.updated_at else None
+    }
+
 @app.get("/api/calendar/events")
-async def get_calendar_events(user_id: int, year: Optional[int] = None, month: Optional[int] = None, db: Session = Depends(get_db)):
+async def get_calendar_events(user_id: int, year: Optional[int] = None, month: Optional[int] = None, db: Session = Depends(get_db), async_db: Optional[AsyncSession] = Depends(get_async_db)):
     """사용자의 캘린더 이벤트 조회"""
     try:
-        calendar_service = CalendarService(db)
+        if async_db is not None:
+            # 비동기 엔진 사용 (USE_ASYNC_DB=true)
+            async_calendar_service = AsyncCalendarService(async_db)
+            if year and month:
+                events = await async_calendar_service.get_events_by_month(user_id, year, month)
+            else:
+                events = await async_calendar_service.get_events_by_user(user_id)
+            events_data = [_serialize_event(event) for event in events]
+            return {
+                "success": True,
+                "data": events_data,
+                "user_id": user_id,
+                "count": len(events_data)
+            }
         
-        if year and month:
-            events = calendar_service.get_events_by_month(user_id, year, month)
-        else:
-            events = calendar_service.get_events_by_user(user_id)
+        def load_events():
+            calendar_service = CalendarService(db)
+            
+            if year and month:
+                events = calendar_service.get_events_by_month(user_id, year, month)
+            else:
+                events = calendar_service.get_events_by_user(user_id)
+            
+            # 이벤트를 JSON 직렬화 가능한 형태로 변환
+            return [_serialize_event(event) for event in events]
         
-        # 이벤트를 JSON 직렬화 가능한 형태로 변환
-        events_data = []
-        for event in events:
-            event_data = {
-                "id": event.id,
-                "user_id": event.user_id,
-                "title": event.title,
-                "description": event.description,
-                "start_date": event.start_date.isoformat() if event.start_date else None,
-                "end_date": event.end_date.isoformat() if event.end_date else None,
-                "start_time": event.start_time.isoformat() if event.start_time else None,
-                "end_time": event.end_time.isoformat() if event.end_time else None,
-                "event_type": event.event_type,
-                "color": event.color,
-                "is_all_day": event.is_all_day,
-                "location": event.location,
-                "created_at": event.created_at.isoformat() if event.created_at else None,
-                "updated_at": event.updated_at.isoformat() if event.updated_at else None
-            }
-            events_data.append(event_data)
+        events_data = await run_db(load_events)
         
         return {
             "success": True,
@@ -566,31 +651,23 @@ async def get_calendar_events(user_id: int, year: Optional[int] = None, month: O
         raise HTTPException(status_code=500, detail=f"캘린더 이벤트 조회 실패: {str(e)}")
 
 @app.get("/api/calendar/events/{event_id}")
-async def get_calendar_event(event_id: int, user_id: int, db: Session = Depends(get_db)):
+async def get_calendar_event(event_id: int, user_id: int, db: Session = Depends(get_db), async_db: Optional[AsyncSession] = Depends(get_async_db)):
     """특정 캘린더 이벤트 조회"""
     try:
-        calendar_service = CalendarService(db)
-        event = calendar_service.get_event_by_id(event_id, user_id)
+        def load_event():
+            calendar_service = CalendarService(db)
+            event = calendar_service.get_event_by_id(event_id, user_id)
+            return _serialize_event(event) if event else None
         
-        if not event:
-            raise HTTPException(status_code=404, detail="이벤트를 찾을 수 없습니다.")
+        if async_db is not None:
+            # 비동기 엔진 사용 (USE_ASYNC_DB=true)
+            event = await AsyncCalendarService(async_db).get_event_by_id(event_id, user_id)
+            event_data = _serialize_event(event) if event else None
+        else:
+            event_data = await run_db(load_event)
         
-        event_data = {
-            "id": event.id,
-            "user_id": event.user_id,
-            "title": event.title,
-            "description": event.description,
-            "start_date": event.start_date.isoformat() if event.start_date else None,
-            "end_date": event.end_date.isoformat() if event.end_date else None,
-            "start_time": event.start_time.isoformat() if event.start_time else None,
-            "end_time": event.end_time.isoformat() if event.end_time else None,
-            "event_type": event.event_type,
-            "color": event.color,
-            "is_all_day": event.is_all_day,
-            "location": event.location,
-            "created_at": event.created_at.isoformat() if event.created_at else None,
-            "updated_at": event.updated_at.isoformat() if event.updated_at else None
-        }
+        if not event_data:
+            raise HTTPException(status_code=404, detail="이벤트를 찾을 수 없습니다.")
         
         return {
             "success": True,
@@ -605,8 +682,6 @@ async def get_calendar_event(event_id: int, user_id: int, db: Session = Depends(
 async def create_calendar_event(request: CalendarEventCreateRequest, user_id: int, db: Session = Depends(get_db)):
     """새로운 캘린더 이벤트 생성"""
     try:
-        calendar_service = CalendarService(db)
-        
         # 요청 데이터를 딕셔너리로 변환
         event_data = {
             "user_id": user_id,
@@ -622,21 +697,21 @@ async def create_calendar_event(request: CalendarEventCreateRequest, user_id: in
         
         # 시간이 있는 경우 추가
         if request.start_time:
-            from datetime import time
             event_data["start_time"] = time.fromisoformat(request.start_time)
         if request.end_time:
-            from datetime import time
             event_data["end_time"] = time.fromisoformat(request.end_time)
         
-        event = calendar_service.create_event(event_data)
+        def save_event():
+            calendar_service = CalendarService(db)
+            event = calendar_service.create_event(event_data)
+            return {"id": event.id, "title": event.title}
+        
+        created = await run_db(save_event)
         
         return {
             "success": True,
             "message": "캘린더 이벤트가 성공적으로 생성되었습니다.",
-            "data": {
-                "id": event.id,
-                "title": event.title
-            }
+            "data": created
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"캘린더 이벤트 생성 실패: {str(e)}")
@@ -645,8 +720,6 @@ async def create_calendar_event(request: CalendarEventCreateRequest, user_id: in
 async def update_calendar_event(event_id: int, request: CalendarEventUpdateRequest, user_id: int, db: Session = Depends(get_db)):
     """캘린더 이벤트 수정"""
     try:
-        calendar_service = CalendarService(db)
-        
         # 요청 데이터를 딕셔너리로 변환 (None이 아닌 값만)
         event_data = {}
         if request.title is not None:
@@ -668,24 +741,24 @@ async def update_calendar_event(event_id: int, request: CalendarEventUpdateReque
         
         # 시간이 있는 경우 추가
         if request.start_time is not None:
-            from datetime import time
             event_data["start_time"] = time.fromisoformat(request.start_time)
         if request.end_time is not None:
-            from datetime import time
             event_data["end_time"] = time.fromisoformat(request.end_time)
         
-        event = calendar_service.update_event(event_id, user_id, event_data)
+        def save_event():
+            calendar_service = CalendarService(db)
+            event = calendar_service.update_event(event_id, user_id, event_data)
+            return {"id": event.id, "title": event.title} if event else None
         
-        if not event:
+        updated = await run_db(save_event)
+        
+        if not updated:
             raise HTTPException(status_code=404, detail="이벤트를 찾을 수 없습니다.")
         
         return {
             "success": True,
             "message": "캘린더 이벤트가 성공적으로 수정되었습니다.",
-            "data": {
-                "id": event.id,
-                "title": event.title
-            }
+            "data": updated
         }
     except HTTPException:
         raise
@@ -697,7 +770,7 @@ async def delete_calendar_event(event_id: int, user_id: int, db: Session = Depen
     """캘린더 이벤트 삭제"""
     try:
         calendar_service = CalendarService(db)
-        success = calendar_service.delete_event(event_id, user_id)
+        success = await run_db(calendar_service.delete_event, event_id, user_id)
         
         if not success:
             raise HTTPException(status_code=404, detail="이벤트를 찾을 수 없습니다.")
@@ -711,6 +784,13 @@ async def delete_calendar_event(event_id: int, user_id: int, db: Session = Depen
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"캘린더 이벤트 삭제 실패: {str(e)}")
 
+# 서버 종료 시 DB 스레드 풀 및 AI 연결 풀 정리
+@app.on_event("shutdown")
+async def shutdown_event():
+    shutdown_db_executor()
+    from services.ai_service import ai_service
+    await ai_service.aclose()
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8000)
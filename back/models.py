@@ -61,6 +61,7 @@ class Student(BaseModel):
     attendances = relationship("Attendance", back_populates="student")
     monthly_attendances = relationship("MonthlyAttendance", back_populates="student")
     yearly_attendances = relationship("YearlyAttendance", back_populates="student")
+    summaries = relationship("StudentSummary", back_populates="student")
 
 class Grade(BaseModel):
     __tablename__ = "grades"
@@ -177,6 +178,20 @@ class YearlyAttendance(BaseModel):
     # 관계 설정
     student = relationship("Student", back_populates="yearly_attendances")
 
+class StudentSummary(BaseModel):
+    __tablename__ = "student_summaries"
+    
+    student_id = Column(Integer, ForeignKey("students.id"), nullable=False, index=True)
+    academic_year = Column(Integer, nullable=False)  # 요약 생성 기준 학년도
+    version = Column(Integer, nullable=False, default=1)  # 학생별 버전 (원본 데이터가 바뀔 때마다 1씩 증가)
+    summary = Column(Text, nullable=False)
+    source_hash = Column(String(64), nullable=False)  # 요약에 사용한 성적/출결 데이터의 SHA-256
+    model = Column(String(100), nullable=True)  # 생성에 사용한 AI 모델
+    created_at = Column(TIMESTAMP, default=func.now(), nullable=False)
+    
+    # 관계 설정
+    student = relationship("Student", back_populates="summaries")
+
 class CalendarEvent(BaseModel):
     __tablename__ = "calendar_events"
     
@@ -0,0 +1,458 @@
+"""
+AI 제공자 레지스트리
+제공자 이름으로 클라이언트 구현을 등록/생성하고
+네트워크 없이 동작하는 가짜(fake) 제공자를 제공하는 기능
+(openai, google.generativeai 등 SDK는 무거우므로 제공자 생성 시점에 import)
+"""
+
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type
+from config import (
+    AI_REQUEST_TIMEOUT, AI_HTTP_MAX_CONNECTIONS, AI_HTTP_MAX_KEEPALIVE, AI_TOOL_MAX_ROUNDS,
+    OPENAI_API_KEY, OPENAI_MODEL, OPENAI_MAX_TOKENS, OPENAI_TEMPERATURE, OPENAI_RPM, OPENAI_TPM,
+    GEMINI_API_KEY, GEMINI_MODEL, GEMINI_MAX_TOKENS, GEMINI_TEMPERATURE, GEMINI_RPM, GEMINI_TPM,
+    FAKE_AI_MODEL, FAKE_AI_RESPONSE, FAKE_AI_ANSWERS_FILE,
+    FAKE_AI_LATENCY_DIST, FAKE_AI_LATENCY_MEAN, FAKE_AI_LATENCY_STDDEV, FAKE_AI_LATENCY_MAX,
+    FAKE_AI_ERROR_RATE, FAKE_AI_SEED, FAKE_AI_CHUNK_DELAY, FAKE_AI_CHUNK_WORDS, FAKE_AI_RPM, FAKE_AI_TPM
+)
+
+
+# 도구 호출 후 모델이 텍스트 답변을 내지 않은 경우의 응답
+TOOL_FALLBACK_MESSAGE = "요청하신 정보를 조회했지만 답변을 만들지 못했습니다. 질문을 조금 더 구체적으로 말씀해주세요."
+
+
+class AIProvider:
+    """AI 제공자 공통 인터페이스"""
+
+    name = ""
+    rpm = 0  # 분당 요청 수 한도 (0이면 제한 없음)
+    tpm = 0  # 분당 토큰 수 한도 (0이면 제한 없음)
+    # (프롬프트 토큰 수, 접두사 캐시 적중 토큰 수)를 기록하는 함수 (AIService가 클라이언트 생성 시 설정)
+    usage_observer: Optional[Callable[[int, int], None]] = None
+
+    @classmethod
+    def describe(cls) -> Dict:
+        """제공자 정보 (클라이언트 생성 없이 설정값만으로 반환)"""
+        return {"provider": "Unknown"}
+
+    def complete(self, system_prompt: str, user_message: str) -> str:
+        """응답 생성"""
+        raise NotImplementedError
+
+    async def complete_async(self, system_prompt: str, user_message: str) -> str:
+        """비동기 응답 생성 (기본 구현은 스레드에서 동기 호출)"""
+        return await asyncio.to_thread(self.complete, system_prompt, user_message)
+
+    def stream(self, system_prompt: str, user_message: str) -> Iterator[str]:
+        """스트리밍 응답 생성 (기본 구현은 전체 응답을 한 번에 전송)"""
+        yield self.complete(system_prompt, user_message)
+
+    async def complete_with_tools_async(self, system_prompt: str, user_message: str, toolkit) -> str:
+        """도구 호출 모드 응답 생성 (도구를 지원하지 않는 제공자는 일반 응답)"""
+        return await self.complete_async(system_prompt, user_message)
+
+    async def aclose(self):
+        """클라이언트 연결 정리"""
+
+    def _report_usage(self, usage: Tuple[int, int]):
+        """응답의 프롬프트/캐시 적중 토큰 수 전달 (사용량 정보가 없는 응답은 무시)"""
+        if self.usage_observer is not None and usage[0]:
+            self.usage_observer(*usage)
+
+
+def openai_prompt_usage(response) -> Tuple[int, int]:
+    """OpenAI 응답의 (프롬프트 토큰, 캐시 적중 토큰) (SDK 버전에 따라 필드가 없을 수 있어 getattr 사용)"""
+    usage = getattr(response, "usage", None)
+    details = getattr(usage, "prompt_tokens_details", None)
+    return getattr(usage, "prompt_tokens", 0) or 0, getattr(details, "cached_tokens", 0) or 0
+
+
+def gemini_prompt_usage(response) -> Tuple[int, int]:
+    """Gemini 응답의 (프롬프트 토큰, 캐시 적중 토큰)"""
+    usage = getattr(response, "usage_metadata", None)
+    return getattr(usage, "prompt_token_count", 0) or 0, getattr(usage, "cached_content_token_count", 0) or 0
+
+
+PROVIDER_REGISTRY: Dict[str, Type[AIProvider]] = {}
+
+
+def register_provider(name: str):
+    """제공자 클래스를 레지스트리에 등록하는 데코레이터"""
+    def decorator(cls: Type[AIProvider]) -> Type[AIProvider]:
+        cls.name = name
+        PROVIDER_REGISTRY[name] = cls
+        return cls
+    return decorator
+
+
+def create_provider(name: str) -> AIProvider:
+    """이름으로 제공자 인스턴스 생성"""
+    provider_class = PROVIDER_REGISTRY.get(name)
+    if provider_class is None:
+        raise ValueError(f"지원하지 않는 AI 제공자입니다: {name}")
+    return provider_class()
+
+
+def describe_provider(name: str) -> Dict:
+    """이름으로 제공자 정보 조회"""
+    provider_class = PROVIDER_REGISTRY.get(name)
+    return provider_class.describe() if provider_class else {"provider": "Unknown"}
+
+
+def provider_rate_limits(name: str) -> Tuple[int, int]:
+    """이름으로 제공자의 (RPM, TPM) 한도 조회"""
+    provider_class = PROVIDER_REGISTRY.get(name)
+    return (provider_class.rpm, provider_class.tpm) if provider_class else (0, 0)
+
+
+@register_provider("openai")
+class OpenAIProvider(AIProvider):
+    """OpenAI 제공자 (동기/비동기 클라이언트가 keep-alive 연결 풀 공유 설정 사용)"""
+
+    rpm = OPENAI_RPM
+    tpm = OPENAI_TPM
+
+    def __init__(self):
+        if not OPENAI_API_KEY:
+            raise ValueError("OpenAI API 키가 설정되지 않았습니다.")
+        import httpx
+        import openai
+        limits = httpx.Limits(
+            max_connections=AI_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=AI_HTTP_MAX_KEEPALIVE
+        )
+        self.client = openai.OpenAI(
+            api_key=OPENAI_API_KEY,
+            timeout=AI_REQUEST_TIMEOUT,
+            http_client=httpx.Client(limits=limits, timeout=AI_REQUEST_TIMEOUT)
+        )
+        self.async_client = openai.AsyncOpenAI(
+            api_key=OPENAI_API_KEY,
+            timeout=AI_REQUEST_TIMEOUT,
+            http_client=httpx.AsyncClient(limits=limits, timeout=AI_REQUEST_TIMEOUT)
+        )
+
+    @classmethod
+    def describe(cls) -> Dict:
+        return {
+            "provider": "OpenAI",
+            "model": OPENAI_MODEL,
+            "max_tokens": OPENAI_MAX_TOKENS,
+            "temperature": OPENAI_TEMPERATURE
+        }
+
+    @staticmethod
+    def _messages(system_prompt: str, user_message: str) -> List[Dict]:
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message}
+        ]
+
+    def complete(self, system_prompt: str, user_message: str) -> str:
+        """OpenAI 응답 생성"""
+        response = self.client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=self._messages(system_prompt, user_message),
+            max_tokens=OPENAI_MAX_TOKENS,
+            temperature=OPENAI_TEMPERATURE
+        )
+        self._report_usage(openai_prompt_usage(response))
+        return response.choices[0].message.content
+
+    async def complete_async(self, system_prompt: str, user_message: str) -> str:
+        """OpenAI 비동기 응답 생성"""
+        response = await self.async_client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=self._messages(system_prompt, user_message),
+            max_tokens=OPENAI_MAX_TOKENS,
+            temperature=OPENAI_TEMPERATURE
+        )
+        self._report_usage(openai_prompt_usage(response))
+        return response.choices[0].message.content
+
+    async def complete_with_tools_async(self, system_prompt: str, user_message: str, toolkit) -> str:
+        """OpenAI 도구 호출 모드 (모델이 요청한 함수만 실행해 결과를 돌려주고 최종 답변 생성)"""
+        messages = self._messages(system_prompt, user_message)
+        tools = toolkit.openai_specs()
+        for round_index in range(AI_TOOL_MAX_ROUNDS + 1):
+            response = await self.async_client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=messages,
+                tools=tools,
+                # 마지막 왕복에서는 더 이상 도구를 호출하지 않고 답변하도록 강제
+                tool_choice="none" if round_index == AI_TOOL_MAX_ROUNDS else "auto",
+                max_tokens=OPENAI_MAX_TOKENS,
+                temperature=OPENAI_TEMPERATURE
+            )
+            self._report_usage(openai_prompt_usage(response))
+            message = response.choices[0].message
+            if not message.tool_calls:
+                return message.content
+            messages.append({
+                "role": "assistant",
+                "content": message.content,
+                "tool_calls": [
+                    {
+                        "id": call.id,
+                        "type": "function",
+                        "function": {"name": call.function.name, "arguments": call.function.arguments}
+                    } for call in message.tool_calls
+                ]
+            })
+            for call in message.tool_calls:
+                messages.append({
+                    "role": "tool",
+                    "tool_call_id": call.id,
+                    "content": await toolkit.execute_async(call.function.name, call.function.arguments)
+                })
+        return message.content or ""
+
+    def stream(self, system_prompt: str, user_message: str) -> Iterator[str]:
+        """OpenAI 스트리밍 응답 생성"""
+        stream = self.client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=self._messages(system_prompt, user_message),
+            max_tokens=OPENAI_MAX_TOKENS,
+            temperature=OPENAI_TEMPERATURE,
+            stream=True
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def aclose(self):
+        await self.async_client.close()
+        self.client.close()
+
+
+@register_provider("gemini")
+class GeminiProvider(AIProvider):
+    """Gemini 제공자"""
+
+    rpm = GEMINI_RPM
+    tpm = GEMINI_TPM
+
+    def __init__(self):
+        if not GEMINI_API_KEY:
+            raise ValueError("Gemini API 키가 설정되지 않았습니다.")
+        import google.generativeai as genai
+        self._genai = genai
+        genai.configure(api_key=GEMINI_API_KEY)
+        self.model = genai.GenerativeModel(GEMINI_MODEL)
+
+    @classmethod
+    def describe(cls) -> Dict:
+        return {
+            "provider": "Gemini",
+            "model": GEMINI_MODEL,
+            "max_tokens": GEMINI_MAX_TOKENS,
+            "temperature": GEMINI_TEMPERATURE
+        }
+
+    @staticmethod
+    def _full_prompt(system_prompt: str, user_message: str) -> str:
+        # Gemini는 system prompt를 지원하지 않으므로 user message에 포함 (고정 접두사가 앞에 오도록 질문은 맨 뒤)
+        return f"{system_prompt}\n\n사용자 질문: {user_message}"
+
+    def _generation_config(self):
+        return self._genai.types.GenerationConfig(
+            max_output_tokens=GEMINI_MAX_TOKENS,
+            temperature=GEMINI_TEMPERATURE
+        )
+
+    def complete(self, system_prompt: str, user_message: str) -> str:
+        """Gemini 응답 생성"""
+        response = self.model.generate_content(
+            self._full_prompt(system_prompt, user_message),
+            generation_config=self._generation_config()
+        )
+        self._report_usage(gemini_prompt_usage(response))
+        return response.text
+
+    async def complete_async(self, system_prompt: str, user_message: str) -> str:
+        """Gemini 비동기 응답 생성"""
+        response = await self.model.generate_content_async(
+            self._full_prompt(system_prompt, user_message),
+            generation_config=self._generation_config()
+        )
+        self._report_usage(gemini_prompt_usage(response))
+        return response.text
+
+    @staticmethod
+    def _tool_config(final: bool) -> Dict:
+        # 마지막 왕복에서는 더 이상 함수를 호출하지 않고 답변하도록 강제 (OpenAI의 tool_choice="none"과 동일)
+        return {"function_calling_config": {"mode": "NONE" if final else "AUTO"}}
+
+    @staticmethod
+    def _parts(response) -> list:
+        return list(response.candidates[0].content.parts) if response.candidates else []
+
+    @classmethod
+    def _response_text(cls, response) -> str:
+        """텍스트 조각만 이어 붙인 답변 (function_call 조각이 남아 있으면 response.text가 예외를 내므로 직접 조합)"""
+        text = "".join(part.text for part in cls._parts(response) if getattr(part, "text", ""))
+        return text or TOOL_FALLBACK_MESSAGE
+
+    async def complete_with_tools_async(self, system_prompt: str, user_message: str, toolkit) -> str:
+        """Gemini 도구 호출 모드 (function_call 응답마다 함수를 실행해 function_response로 전달)"""
+        import google.ai.generativelanguage as glm
+        model = self._genai.GenerativeModel(GEMINI_MODEL, tools=toolkit.gemini_specs())
+        chat = model.start_chat()
+        response = await chat.send_message_async(
+            self._full_prompt(system_prompt, user_message),
+            generation_config=self._generation_config(),
+            tool_config=self._tool_config(AI_TOOL_MAX_ROUNDS == 0)
+        )
+        self._report_usage(gemini_prompt_usage(response))
+        for round_index in range(1, AI_TOOL_MAX_ROUNDS + 1):
+            calls = [part.function_call for part in self._parts(response) if part.function_call.name]
+            if not calls:
+                break
+            parts = []
+            for call in calls:
+                result = await toolkit.execute_async(call.name, dict(call.args))
+                parts.append(glm.Part(function_response=glm.FunctionResponse(name=call.name, response={"result": result})))
+            response = await chat.send_message_async(
+                glm.Content(parts=parts),
+                generation_config=self._generation_config(),
+                tool_config=self._tool_config(round_index == AI_TOOL_MAX_ROUNDS)
+            )
+            self._report_usage(gemini_prompt_usage(response))
+        return self._response_text(response)
+
+    def stream(self, system_prompt: str, user_message: str) -> Iterator[str]:
+        """Gemini 스트리밍 응답 생성"""
+        response = self.model.generate_content(
+            self._full_prompt(system_prompt, user_message),
+            generation_config=self._generation_config(),
+            stream=True
+        )
+        for chunk in response:
+            if chunk.text:
+                yield chunk.text
+        # 스트림 마지막 조각에 사용량이 포함된 SDK 버전에서만 기록됨
+        self._report_usage(gemini_prompt_usage(response))
+
+
+@register_provider("fake")
+class FakeProvider(AIProvider):
+    """가짜 제공자 (고정 시드의 지연 분포, 조각 전송 간격, 키워드별 준비된 답변으로 결정적으로 동작)"""
+
+    rpm = FAKE_AI_RPM
+    tpm = FAKE_AI_TPM
+
+    def __init__(
+        self,
+        answers: Optional[Dict[str, str]] = None,
+        default_answer: str = FAKE_AI_RESPONSE,
+        latency_dist: str = FAKE_AI_LATENCY_DIST,
+        latency_mean: float = FAKE_AI_LATENCY_MEAN,
+        latency_stddev: float = FAKE_AI_LATENCY_STDDEV,
+        latency_max: float = FAKE_AI_LATENCY_MAX,
+        error_rate: float = FAKE_AI_ERROR_RATE,
+        seed: int = FAKE_AI_SEED,
+        chunk_delay: float = FAKE_AI_CHUNK_DELAY,
+        chunk_words: int = FAKE_AI_CHUNK_WORDS
+    ):
+        if latency_dist not in ("fixed", "uniform", "normal", "lognormal"):
+            raise ValueError(f"지원하지 않는 지연 분포입니다: {latency_dist}")
+        self.answers = answers if answers is not None else self._load_answers(FAKE_AI_ANSWERS_FILE)
+        self.default_answer = default_answer
+        self.latency_dist = latency_dist
+        self.latency_mean = latency_mean
+        self.latency_stddev = latency_stddev
+        self.latency_max = latency_max
+        self.error_rate = error_rate
+        self.chunk_delay = chunk_delay
+        self.chunk_words = max(1, chunk_words)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def describe(cls) -> Dict:
+        return {
+            "provider": "Fake",
+            "model": FAKE_AI_MODEL,
+            "max_tokens": None,
+            "temperature": None,
+            "latency": {
+                "distribution": FAKE_AI_LATENCY_DIST,
+                "mean": FAKE_AI_LATENCY_MEAN,
+                "stddev": FAKE_AI_LATENCY_STDDEV
+            }
+        }
+
+    @staticmethod
+    def _load_answers(path: str) -> Dict[str, str]:
+        """키워드별 답변 JSON 파일 로드"""
+        if not path:
+            return {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                return {str(keyword): str(answer) for keyword, answer in json.load(f).items()}
+        except Exception as e:
+            print(f"가짜 AI 답변 파일 로드 오류: {e}")
+            return {}
+
+    def sample_latency(self) -> float:
+        """설정된 분포에서 응답 지연 시간 추출 (0 ~ 최대값 사이로 제한)"""
+        mean, stddev = self.latency_mean, self.latency_stddev
+        with self._lock:
+            if self.latency_dist == "uniform":
+                value = self._random.uniform(mean - stddev, mean + stddev)
+            elif self.latency_dist == "normal":
+                value = self._random.gauss(mean, stddev)
+            elif self.latency_dist == "lognormal" and mean > 0:
+                # 평균/표준편차가 실제 지연 분포의 값이 되도록 로그 정규 분포 모수 변환
+                sigma2 = math.log(1 + (stddev / mean) ** 2)
+                value = self._random.lognormvariate(math.log(mean) - sigma2 / 2, math.sqrt(sigma2))
+            else:
+                value = mean
+        return min(max(value, 0.0), self.latency_max)
+
+    def _maybe_fail(self):
+        """설정된 오류율에 따라 업스트림 장애 재현"""
+        if self.error_rate <= 0:
+            return
+        with self._lock:
+            failed = self._random.random() < self.error_rate
+        if failed:
+            raise RuntimeError("가짜 AI 제공자 오류 (FAKE_AI_ERROR_RATE)")
+
+    def answer_for(self, user_message: str) -> str:
+        """질문에 포함된 키워드의 준비된 답변 반환 (없으면 기본 답변)"""
+        for keyword, answer in self.answers.items():
+            if keyword in user_message:
+                return answer
+        return self.default_answer
+
+    def _chunks(self, text: str) -> List[str]:
+        words = text.split(" ")
+        return [
+            ("" if i == 0 else " ") + " ".join(words[i:i + self.chunk_words])
+            for i in range(0, len(words), self.chunk_words)
+        ]
+
+    def complete(self, system_prompt: str, user_message: str) -> str:
+        time.sleep(self.sample_latency())
+        self._maybe_fail()
+        return self.answer_for(user_message)
+
+    async def complete_async(self, system_prompt: str, user_message: str) -> str:
+        await asyncio.sleep(self.sample_latency())
+        self._maybe_fail()
+        return self.answer_for(user_message)
+
+    def stream(self, system_prompt: str, user_message: str) -> Iterator[str]:
+        """첫 조각까지 추출한 지연 후, 설정된 간격으로 어절 묶음 단위 전송"""
+        time.sleep(self.sample_latency())
+        self._maybe_fail()
+        for i, chunk in enumerate(self._chunks(self.answer_for(user_message))):
+            if i > 0 and self.chunk_delay > 0:
+                time.sleep(self.chunk_delay)
+            yield chunk
@@ -0,0 +1,237 @@
+"""
+AI 요청 스케줄러
+제공자별 분당 요청 수(RPM)/토큰 수(TPM)를 토큰 버킷으로 제한하고
+우선순위 대기열로 대화형 요청을 백그라운드 작업보다 먼저 처리하는 기능
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from config import AI_SCHEDULER_MAX_WAIT
+from services.ai_providers import provider_rate_limits
+
+# 우선순위 (값이 작을수록 먼저 처리)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+
+# 대기 중인 호출자가 대기열 변화를 확인하는 최대 간격 (초)
+POLL_INTERVAL = 0.1
+
+
+class RateLimitWait(Exception):
+    """예상 대기 시간이 허용 범위를 넘어 요청을 대기열에 넣지 않은 경우"""
+
+    def __init__(self, provider: str, estimated_wait: float):
+        super().__init__(f"{provider} 요청 한도 초과 (예상 대기 {estimated_wait:.1f}초)")
+        self.provider = provider
+        self.estimated_wait = estimated_wait
+
+
+class TokenBucket:
+    """토큰 버킷 (분당 한도를 초당 비율로 채움, 한도 0이면 제한 없음)"""
+
+    def __init__(self, per_minute: int, now: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = now
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount 만큼 사용하려면 기다려야 하는 시간 (버킷 용량보다 큰 요청은 가득 찰 때까지)"""
+        if self.unlimited:
+            return 0.0
+        self._refill(now)
+        needed = min(amount, self.capacity) - self.tokens
+        return max(0.0, needed / self.rate)
+
+    def consume(self, amount: float):
+        if not self.unlimited:
+            self.tokens -= min(amount, self.capacity)
+
+    def drain(self, seconds: float, now: float):
+        """제공자가 한도 초과(429)를 알려온 경우 지정 시간 동안 사용하지 않도록 비움"""
+        if not self.unlimited:
+            self._refill(now)
+            self.tokens = min(self.tokens, -seconds * self.rate)
+
+
+class _Ticket:
+    __slots__ = ("priority", "seq", "tokens", "enqueued")
+
+    def __init__(self, priority: int, seq: int, tokens: int, enqueued: float):
+        self.priority = priority
+        self.seq = seq
+        self.tokens = tokens
+        self.enqueued = enqueued
+
+    def __lt__(self, other: "_Ticket") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class _ProviderQueue:
+    """제공자별 버킷과 우선순위 대기열"""
+
+    def __init__(self, rpm: int, tpm: int, now: float):
+        self.requests = TokenBucket(rpm, now)
+        self.tokens = TokenBucket(tpm, now)
+        self.heap: List[_Ticket] = []
+        self.granted = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+
+
+class AIScheduler:
+    """제공자별 RPM/TPM 한도 안에서 우선순위 순서대로 LLM 호출 허가
+    (rate_limits는 제공자 이름 → (RPM, TPM), clock은 단조 시계이며 테스트에서 교체 가능)
+    """
+
+    def __init__(
+        self,
+        max_wait: float = AI_SCHEDULER_MAX_WAIT,
+        rate_limits: Callable[[str], Tuple[int, int]] = provider_rate_limits,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_wait = max_wait
+        self.rate_limits = rate_limits
+        self.clock = clock
+        self._queues: Dict[str, _ProviderQueue] = {}
+        self._seq = itertools.count()
+        self._condition = threading.Condition()
+
+    def _queue(self, provider: str) -> _ProviderQueue:
+        queue = self._queues.get(provider)
+        if queue is None:
+            rpm, tpm = self.rate_limits(provider)
+            queue = self._queues[provider] = _ProviderQueue(rpm, tpm, self.clock())
+        return queue
+
+    def _estimate_wait(self, queue: _ProviderQueue, ticket: Optional[_Ticket], tokens: int, now: float) -> float:
+        """앞선 대기 요청들과 자신의 요청이 모두 허가될 때까지의 예상 시간"""
+        ahead = [t for t in queue.heap if ticket is None or t < ticket]
+        request_wait = queue.requests.wait_time(len(ahead) + 1, now)
+        token_wait = queue.tokens.wait_time(sum(t.tokens for t in ahead) + tokens, now)
+        return max(request_wait, token_wait)
+
+    def _try_grant(self, provider: str, ticket: _Ticket) -> Optional[float]:
+        """대기열 맨 앞이고 버킷에 여유가 있으면 허가(None), 아니면 다시 확인할 때까지의 시간 반환"""
+        with self._condition:
+            queue = self._queue(provider)
+            now = self.clock()
+            if queue.heap[0] is not ticket:
+                return POLL_INTERVAL
+            wait = max(queue.requests.wait_time(1, now), queue.tokens.wait_time(ticket.tokens, now))
+            if wait > 0:
+                return min(wait, POLL_INTERVAL)
+            heapq.heappop(queue.heap)
+            queue.requests.consume(1)
+            queue.tokens.consume(ticket.tokens)
+            queue.granted += 1
+            queue.total_wait += now - ticket.enqueued
+            self._condition.notify_all()
+            return None
+
+    def _enqueue(self, provider: str, tokens: int, priority: int) -> _Ticket:
+        """예상 대기 시간이 허용 범위 안이면 대기열에 추가 (넘으면 RateLimitWait)"""
+        with self._condition:
+            queue = self._queue(provider)
+            now = self.clock()
+            ticket = _Ticket(priority, next(self._seq), tokens, now)
+            estimated = self._estimate_wait(queue, ticket, tokens, now)
+            if estimated > self.max_wait:
+                queue.rejected += 1
+                raise RateLimitWait(provider, estimated)
+            heapq.heappush(queue.heap, ticket)
+            return ticket
+
+    def _cancel(self, provider: str, ticket: _Ticket):
+        with self._condition:
+            queue = self._queue(provider)
+            if ticket in queue.heap:
+                queue.heap.remove(ticket)
+                heapq.heapify(queue.heap)
+                self._condition.notify_all()
+
+    def acquire(self, provider: str, tokens: int, priority: int = PRIORITY_INTERACTIVE):
+        """호출 허가를 받을 때까지 대기 (동기 경로)"""
+        ticket = self._enqueue(provider, tokens, priority)
+        try:
+            while True:
+                wait = self._try_grant(provider, ticket)
+                if wait is None:
+                    return
+                with self._condition:
+                    self._condition.wait(timeout=wait)
+        except BaseException:
+            self._cancel(provider, ticket)
+            raise
+
+    async def acquire_async(self, provider: str, tokens: int, priority: int = PRIORITY_INTERACTIVE):
+        """호출 허가를 받을 때까지 이벤트 루프를 막지 않고 대기 (비동기 경로)"""
+        ticket = self._enqueue(provider, tokens, priority)
+        try:
+            while True:
+                wait = self._try_grant(provider, ticket)
+                if wait is None:
+                    return
+                await asyncio.sleep(wait)
+        except BaseException:
+            self._cancel(provider, ticket)
+            raise
+
+    def penalize(self, provider: str, retry_after: float):
+        """제공자 한도 초과 응답을 받은 경우 retry_after 동안 새 요청 허가 중단"""
+        with self._condition:
+            queue = self._queue(provider)
+            queue.requests.drain(retry_after, self.clock())
+
+    def estimate_wait(self, provider: str, tokens: int) -> float:
+        """지금 요청하면 예상되는 대기 시간"""
+        with self._condition:
+            return self._estimate_wait(self._queue(provider), None, tokens, self.clock())
+
+    def get_stats(self) -> Dict:
+        """제공자별 대기열/버킷 통계 반환"""
+        with self._condition:
+            now = self.clock()
+            stats = {}
+            for provider, queue in self._queues.items():
+                queue.requests._refill(now)
+                queue.tokens._refill(now)
+                stats[provider] = {
+                    "queued": len(queue.heap),
+                    "granted": queue.granted,
+                    "rejected": queue.rejected,
+                    "avg_wait_seconds": round(queue.total_wait / queue.granted, 3) if queue.granted else 0.0,
+                    "rpm_limit": int(queue.requests.capacity),
+                    "tpm_limit": int(queue.tokens.capacity),
+                    "requests_available": None if queue.requests.unlimited else round(queue.requests.tokens, 1),
+                    "tokens_available": None if queue.tokens.unlimited else round(queue.tokens.tokens, 1),
+                }
+            return {"max_wait": self.max_wait, "providers": stats}
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """제공자 오류가 한도 초과(HTTP 429)면 재시도까지의 시간 반환"""
+    if getattr(error, "status_code", None) != 429 and getattr(error, "code", None) != 429:
+        return None
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after", 10))
+    except (TypeError, ValueError):
+        return 10.0
+
+
+# 전역 AI 스케줄러 인스턴스
+ai_scheduler = AIScheduler()
@@ -1,91 +1,711 @@
-import openai
-import google.generativeai as genai
-from typing import Dict, List
+import asyncio
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
 from config import (
-    AI_PROVIDER, 
-    OPENAI_API_KEY, OPENAI_MODEL, OPENAI_MAX_TOKENS, OPENAI_TEMPERATURE,
-    GEMINI_API_KEY, GEMINI_MODEL, GEMINI_MAX_TOKENS, GEMINI_TEMPERATURE
+    AI_PROVIDER, AI_PROVIDERS,
+    AI_HEDGE_DELAY, AI_CIRCUIT_FAILURE_THRESHOLD, AI_CIRCUIT_RESET_SECONDS,
+    AI_MAX_CONCURRENCY, AI_REQUEST_TIMEOUT, AI_TOOLS_ENABLED, AI_TOOL_MAX_ROUNDS,
+    AI_CACHE_ENABLED, AI_CACHE_MAX_SIZE, AI_CACHE_TTL, AI_CACHE_MAX_TEMPERATURE
 )
+from services.ai_providers import AIProvider, create_provider, describe_provider
+from services.ai_scheduler import ai_scheduler, RateLimitWait, PRIORITY_INTERACTIVE, retry_after_seconds
+from services.prompt_builder import count_tokens
+
+NO_PROVIDER_MESSAGE = "사용 가능한 AI 제공자가 없습니다. (모든 제공자 차단됨)"
+
+class CompletionCache:
+    """LLM 응답 캐시 (LRU 제거 + TTL 만료, 적중/실패 카운터 포함)"""
+    
+    def __init__(self, max_size: int = AI_CACHE_MAX_SIZE, ttl_seconds: int = AI_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def normalize(text: str) -> str:
+        """공백/대소문자/끝 문장부호 차이를 무시하도록 정규화"""
+        return re.sub(r"\s+", " ", text).strip().lower().rstrip("?!.~ ")
+    
+    @classmethod
+    def make_key(cls, provider: str, model: str, temperature: float, system_prompt: str, user_message: str) -> Tuple:
+        """제공자, 모델, temperature, 정규화된 프롬프트 해시로 캐시 키 생성"""
+        prompt = f"{cls.normalize(system_prompt)}\x00{cls.normalize(user_message)}"
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        return (provider, model, temperature, digest)
+    
+    def get(self, key: Tuple) -> Optional[str]:
+        """캐시 조회 (만료된 항목은 제거)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: Tuple, value: str):
+        """캐시 저장 (최대 크기 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict:
+        """캐시 통계 반환"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0
+        }
+
+class SingleFlight:
+    """동일 프롬프트 동시 요청 병합 (진행 중인 호출 하나의 결과를 대기자들이 공유)"""
+    
+    class _Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error: Optional[BaseException] = None
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Tuple, "SingleFlight._Call"] = {}
+        self._async_calls: Dict[Tuple, asyncio.Future] = {}
+        self.executed = 0  # 실제 업스트림 호출 수
+        self.collapsed = 0  # 병합되어 생략된 호출 수
+    
+    def do(self, key: Tuple, func: Callable[[], str]) -> str:
+        """동기 호출 병합 (같은 키의 호출이 진행 중이면 그 결과를 기다림)"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.collapsed += 1
+                leader = False
+            else:
+                call = self._Call()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+        
+        if not leader:
+            call.done.wait()
+        else:
+            try:
+                call.result = func()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    self._calls.pop(key, None)
+                call.done.set()
+        
+        if call.error is not None:
+            raise call.error
+        return call.result
+    
+    async def do_async(self, key: Tuple, func: Callable[[], Awaitable[str]]) -> str:
+        """비동기 호출 병합 (같은 키의 코루틴이 진행 중이면 그 Future를 함께 대기)"""
+        future = self._async_calls.get(key)
+        if future is not None:
+            self.collapsed += 1
+            # 대기자 하나가 취소되어도 공유 호출은 취소되지 않도록 보호
+            return await asyncio.shield(future)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._async_calls[key] = future
+        self.executed += 1
+        try:
+            result = await func()
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+            # 대기자가 없을 때 "Future exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._async_calls.pop(key, None)
+    
+    def get_stats(self) -> Dict:
+        """병합 통계 반환"""
+        total = self.executed + self.collapsed
+        return {
+            "in_flight": len(self._calls) + len(self._async_calls),
+            "executed": self.executed,
+            "collapsed": self.collapsed,
+            "collapse_rate": round(self.collapsed / total, 3) if total else 0.0
+        }
+
+class CircuitBreaker:
+    """제공자별 서킷 브레이커 (연속 오류 시 일정 시간 차단 후 한 번 시험 호출 허용)"""
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int = AI_CIRCUIT_FAILURE_THRESHOLD, reset_seconds: float = AI_CIRCUIT_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.open_count = 0
+        self._trial_in_flight = False
+        self._trial_started = 0.0
+        self._lock = threading.Lock()
+    
+    def available(self) -> bool:
+        """상태를 바꾸지 않고 호출 가능성만 확인 (차단 중이거나 시험 호출이 진행 중이면 False)"""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == self.OPEN:
+                return now - self.opened_at >= self.reset_seconds
+            if self.state == self.HALF_OPEN:
+                return not self._trial_in_flight or now - self._trial_started >= self.reset_seconds
+            return True
+    
+    def allow(self) -> bool:
+        """호출 가능 여부 (차단 시간이 지나면 시험 호출 하나만 허용, 실제로 호출을 시작할 때만 사용)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_seconds:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            # 시험 호출이 실제로 실행되지 않았을 수 있으므로 차단 시간이 지나면 다시 허용
+            if self.state == self.HALF_OPEN and (
+                not self._trial_in_flight or time.monotonic() - self._trial_started >= self.reset_seconds
+            ):
+                self._trial_in_flight = True
+                self._trial_started = time.monotonic()
+                return True
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+    
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.open_count += 1
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self._trial_in_flight = False
+    
+    def get_stats(self) -> Dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "open_count": self.open_count
+        }
+
+class LatencyHistogram:
+    """제공자별 응답 지연 히스토그램 (고정 구간, 백분위 근사)"""
+    
+    BUCKETS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, float("inf"))
+    
+    def __init__(self):
+        self.counts = [0] * len(self.BUCKETS)
+        self.total = 0
+        self.sum = 0.0
+        self.errors = 0
+        self._lock = threading.Lock()
+    
+    def observe(self, seconds: float):
+        with self._lock:
+            for index, upper in enumerate(self.BUCKETS):
+                if seconds <= upper:
+                    self.counts[index] += 1
+                    break
+            self.total += 1
+            self.sum += seconds
+    
+    def percentile(self, q: float) -> Optional[float]:
+        """백분위 근사치 (해당 구간의 상한값)"""
+        if not self.total:
+            return None
+        threshold = q * self.total
+        cumulative = 0
+        for upper, count in zip(self.BUCKETS, self.counts):
+            cumulative += count
+            if cumulative >= threshold:
+                return upper
+        return self.BUCKETS[-1]
+    
+    def get_stats(self) -> Dict:
+        return {
+            "count": self.total,
+            "errors": self.errors,
+            "avg_seconds": round(self.sum / self.total, 3) if self.total else None,
+            "p50_seconds": self.percentile(0.5),
+            "p95_seconds": self.percentile(0.95),
+            "buckets": {("+Inf" if upper == float("inf") else str(upper)): count for upper, count in zip(self.BUCKETS, self.counts)}
+        }
+
+class PromptCacheStats:
+    """제공자별 프롬프트 접두사 캐시 적중 통계 (응답 사용량의 cached tokens 기준)"""
+    
+    def __init__(self):
+        self.calls = 0
+        self.cached_calls = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self._lock = threading.Lock()
+    
+    def observe(self, prompt_tokens: int, cached_tokens: int):
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += prompt_tokens
+            self.cached_tokens += cached_tokens
+            if cached_tokens:
+                self.cached_calls += 1
+    
+    def get_stats(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "cached_calls": self.cached_calls,
+            "prompt_tokens": self.prompt_tokens,
+            "cached_tokens": self.cached_tokens,
+            "cached_token_ratio": round(self.cached_tokens / self.prompt_tokens, 3) if self.prompt_tokens else 0.0
+        }
 
 class AIService:
-    """AI 서비스 통합 관리 클래스"""
+    """AI 서비스 통합 관리 클래스 (우선순위 순서의 다중 제공자 지원)"""
     
     def __init__(self):
-        self.provider = AI_PROVIDER.lower()
+        # 1순위 제공자가 AI_PROVIDER 역할 (캐시 키, 모델 정보 기준)
+        self.providers: List[str] = AI_PROVIDERS or [AI_PROVIDER.lower()]
+        self.provider = self.providers[0]
+        self.completion_cache = CompletionCache()
+        self.single_flight = SingleFlight()
+        self.breakers = {name: CircuitBreaker() for name in self.providers}
+        self.latency = {name: LatencyHistogram() for name in self.providers}
+        self.first_token_latency = {name: LatencyHistogram() for name in self.providers}  # 스트리밍 첫 조각까지
+        self.prompt_cache = {name: PromptCacheStats() for name in self.providers}
+        self.hedged_requests = 0
+        self.failovers = 0
+        self.tool_calls = 0
+        # 동시 LLM 요청 제한 (초과 요청은 대기열에서 순서를 기다림)
+        self._async_semaphore = asyncio.Semaphore(AI_MAX_CONCURRENCY)
+        self._sync_semaphore = threading.BoundedSemaphore(AI_MAX_CONCURRENCY)
         self._setup_clients()
     
     def _setup_clients(self):
-        """AI 클라이언트 설정"""
-        if self.provider == "openai":
-            if not OPENAI_API_KEY:
-                raise ValueError("OpenAI API 키가 설정되지 않았습니다.")
-            self.openai_client = openai.OpenAI(api_key=OPENAI_API_KEY)
-        elif self.provider == "gemini":
-            if not GEMINI_API_KEY:
-                raise ValueError("Gemini API 키가 설정되지 않았습니다.")
-            genai.configure(api_key=GEMINI_API_KEY)
-            self.gemini_model = genai.GenerativeModel(GEMINI_MODEL)
+        """AI 클라이언트 준비 (SDK import와 클라이언트 생성은 첫 호출 시점으로 지연)"""
+        self._clients: Dict[str, AIProvider] = {}
+        self._client_errors: Dict[str, str] = {}
+        self._clients_lock = threading.Lock()
+    
+    def _get_client(self, name: str) -> Optional[AIProvider]:
+        """제공자 클라이언트 반환 (처음 요청될 때 레지스트리로 생성, 설정 오류가 있는 제공자는 None)"""
+        client = self._clients.get(name)
+        if client is not None or name in self._client_errors:
+            return client
+        with self._clients_lock:
+            if name not in self._clients and name not in self._client_errors:
+                started = time.perf_counter()
+                try:
+                    client = create_provider(name)
+                    client.usage_observer = self.prompt_cache[name].observe
+                    self._clients[name] = client
+                    print(f"AI 제공자 로드 완료 ({name}, {(time.perf_counter() - started) * 1000:.0f}ms)")
+                except Exception as e:
+                    print(f"AI 제공자 초기화 오류 ({name}): {e}")
+                    self._client_errors[name] = str(e)
+            return self._clients.get(name)
+    
+    def _get_cache_key(self, system_prompt: str, user_message: str) -> Optional[Tuple]:
+        """응답 캐시 키 생성 (캐시 비활성화 또는 temperature가 임계값보다 높으면 None)"""
+        if not AI_CACHE_ENABLED:
+            return None
+        provider_info = self.get_provider_info()
+        temperature = provider_info.get("temperature") or 0.0
+        if temperature > AI_CACHE_MAX_TEMPERATURE:
+            return None
+        return self._get_flight_key(system_prompt, user_message)
+    
+    def _get_flight_key(self, system_prompt: str, user_message: str) -> Tuple:
+        """동시 요청 병합 키 생성 (캐시 설정과 무관하게 항상 프롬프트 해시 사용)"""
+        provider_info = self.get_provider_info()
+        temperature = provider_info.get("temperature") or 0.0
+        return CompletionCache.make_key(self.provider, provider_info.get("model"), temperature, system_prompt, user_message)
+    
+    def load_providers(self) -> List[str]:
+        """설정된 제공자 클라이언트를 모두 생성하고 생성된 제공자 이름 반환 (서킷 상태는 바꾸지 않음)"""
+        return [name for name in self.providers if self._get_client(name) is not None]
+    
+    def _available_providers(self) -> List[str]:
+        """서킷이 열리지 않은 제공자 후보 (우선순위 순서, 클라이언트 생성과 시험 호출 허가는 _start_call에서)"""
+        available = [
+            name for name in self.providers
+            if name not in self._client_errors and self.breakers[name].available()
+        ]
+        if not available:
+            raise RuntimeError(NO_PROVIDER_MESSAGE)
+        return available
+    
+    def _start_call(self, name: str) -> bool:
+        """실제로 호출을 시작하기 직전에 클라이언트를 준비하고 서킷 허가를 받음 (반개방이면 이 호출이 시험 호출)"""
+        return self._get_client(name) is not None and self.breakers[name].allow()
+    
+    def _record_result(self, name: str, started: float, error: Optional[BaseException] = None):
+        """제공자 호출 결과를 지연 히스토그램과 서킷 브레이커에 기록"""
+        if error is None:
+            self.latency[name].observe(time.monotonic() - started)
+            self.breakers[name].record_success()
         else:
-            raise ValueError(f"지원하지 않는 AI 제공자입니다: {self.provider}")
+            self.latency[name].errors += 1
+            self.breakers[name].record_failure()
+    
+    def _estimate_tokens(self, name: str, system_prompt: str, user_message: str) -> int:
+        """TPM 한도 계산용 요청 토큰 수 추정 (프롬프트 + 최대 응답 토큰)"""
+        max_tokens = self.get_provider_info(name).get("max_tokens") or 0
+        return count_tokens(system_prompt) + count_tokens(user_message) + max_tokens
     
-    def get_response(self, system_prompt: str, user_message: str) -> str:
-        """AI 응답 생성"""
+    @staticmethod
+    def _penalize_if_rate_limited(name: str, error: BaseException):
+        """제공자가 한도 초과(429)를 응답하면 스케줄러가 retry-after 동안 요청을 보내지 않도록 기록"""
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            ai_scheduler.penalize(name, retry_after)
+    
+    @staticmethod
+    def _rate_limit_message(error: RateLimitWait) -> str:
+        """대기열이 길 때 실패 대신 예상 대기 시간 안내"""
+        return f"현재 AI 요청이 많아 바로 답변드리기 어렵습니다. 약 {int(error.estimated_wait) + 1}초 후에 다시 질문해주세요."
+    
+    def _call_provider(self, name: str, system_prompt: str, user_message: str, priority: int = PRIORITY_INTERACTIVE) -> str:
+        """지정한 제공자로 업스트림 호출 (RPM/TPM 스케줄러 허가 후 동시 요청 수 제한 적용)"""
+        ai_scheduler.acquire(name, self._estimate_tokens(name, system_prompt, user_message), priority)
+        with self._sync_semaphore:
+            try:
+                return self._clients[name].complete(system_prompt, user_message)
+            except Exception as e:
+                self._penalize_if_rate_limited(name, e)
+                raise
+    
+    async def _call_provider_async(self, name: str, system_prompt: str, user_message: str, priority: int = PRIORITY_INTERACTIVE) -> str:
+        """지정한 제공자로 비동기 업스트림 호출 (RPM/TPM 스케줄러 허가 후 동시 요청 수 제한 및 타임아웃 적용)"""
+        await ai_scheduler.acquire_async(name, self._estimate_tokens(name, system_prompt, user_message), priority)
+        async with self._async_semaphore:
+            try:
+                return await asyncio.wait_for(
+                    self._clients[name].complete_async(system_prompt, user_message),
+                    timeout=AI_REQUEST_TIMEOUT
+                )
+            except Exception as e:
+                self._penalize_if_rate_limited(name, e)
+                raise
+    
+    async def _timed_call_async(self, name: str, system_prompt: str, user_message: str, priority: int = PRIORITY_INTERACTIVE) -> str:
+        """지연 시간과 오류를 기록하며 비동기 호출 (헤지 경쟁에서 져서 취소된 호출, 대기열 거절은 기록하지 않음)"""
+        started = time.monotonic()
         try:
-            if self.provider == "openai":
-                return self._get_openai_response(system_prompt, user_message)
-            elif self.provider == "gemini":
-                return self._get_gemini_response(system_prompt, user_message)
-            else:
-                return "지원하지 않는 AI 제공자입니다."
+            response = await self._call_provider_async(name, system_prompt, user_message, priority)
+        except RateLimitWait:
+            raise
+        except Exception as e:
+            print(f"AI 제공자 오류 ({name}): {e}")
+            self._record_result(name, started, e)
+            raise
+        self._record_result(name, started)
+        return response
+    
+    def _failover_call(self, system_prompt: str, user_message: str, priority: int = PRIORITY_INTERACTIVE) -> str:
+        """우선순위 순서대로 호출하고 오류 시 다음 제공자로 넘김 (동기 경로)"""
+        last_error: Optional[BaseException] = None
+        for index, name in enumerate(self._available_providers()):
+            if not self._start_call(name):
+                continue
+            started = time.monotonic()
+            try:
+                response = self._call_provider(name, system_prompt, user_message, priority)
+            except RateLimitWait as e:
+                last_error = e
+                continue
+            except Exception as e:
+                print(f"AI 제공자 오류 ({name}): {e}")
+                self._record_result(name, started, e)
+                last_error = e
+                continue
+            self._record_result(name, started)
+            if index > 0:
+                self.failovers += 1
+            return response
+        raise last_error or RuntimeError(NO_PROVIDER_MESSAGE)
+    
+    async def _hedged_call_async(self, system_prompt: str, user_message: str, priority: int = PRIORITY_INTERACTIVE) -> str:
+        """헤지 요청: 1순위 제공자가 지연 예산 안에 응답하지 않거나 실패하면 다음 제공자에도 요청하고 먼저 온 응답 사용"""
+        candidates = self._available_providers()
+        tasks: Dict[asyncio.Task, str] = {}
+        next_index = 0
+        last_error: Optional[BaseException] = None
+        
+        def launch() -> bool:
+            """다음 후보 중 호출을 시작할 수 있는 제공자에 요청 (시작한 요청이 없으면 False)"""
+            nonlocal next_index
+            while next_index < len(candidates):
+                name = candidates[next_index]
+                next_index += 1
+                if self._start_call(name):
+                    tasks[asyncio.ensure_future(self._timed_call_async(name, system_prompt, user_message, priority))] = name
+                    return True
+            return False
+        
+        if not launch():
+            raise RuntimeError(NO_PROVIDER_MESSAGE)
+        try:
+            while tasks:
+                timeout = AI_HEDGE_DELAY if next_index < len(candidates) else None
+                done, _ = await asyncio.wait(list(tasks), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    # 지연 예산 초과: 기존 요청은 유지한 채 다음 제공자에 헤지 요청
+                    self.hedged_requests += 1
+                    launch()
+                    continue
+                for task in done:
+                    name = tasks.pop(task)
+                    if task.exception() is None:
+                        if name != candidates[0]:
+                            self.failovers += 1
+                        return task.result()
+                    last_error = task.exception()
+                if not tasks:
+                    # 진행 중인 요청이 모두 실패한 경우 즉시 다음 제공자로 전환
+                    launch()
+            raise last_error
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def get_response(self, system_prompt: str, user_message: str, priority: int = PRIORITY_INTERACTIVE) -> str:
+        """AI 응답 생성 (동일/유사 프롬프트는 캐시에서 반환, 동시 동일 요청은 한 번만 호출)"""
+        cache_key = self._get_cache_key(system_prompt, user_message)
+        if cache_key is not None:
+            cached = self.completion_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        try:
+            response = self.single_flight.do(
+                self._get_flight_key(system_prompt, user_message),
+                lambda: self._failover_call(system_prompt, user_message, priority)
+            )
+        except RateLimitWait as e:
+            print(f"AI 요청 대기열 초과: {e}")
+            return self._rate_limit_message(e)
         except Exception as e:
             print(f"AI 응답 생성 오류: {e}")
             return "죄송합니다. AI 응답 생성 중 오류가 발생했습니다."
+        
+        # 정상 응답만 캐시
+        if cache_key is not None and response:
+            self.completion_cache.set(cache_key, response)
+        return response
     
-    def _get_openai_response(self, system_prompt: str, user_message: str) -> str:
-        """OpenAI 응답 생성"""
-        response = self.openai_client.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message}
-            ],
-            max_tokens=OPENAI_MAX_TOKENS,
-            temperature=OPENAI_TEMPERATURE
-        )
-        return response.choices[0].message.content
-    
-    def _get_gemini_response(self, system_prompt: str, user_message: str) -> str:
-        """Gemini 응답 생성"""
-        # Gemini는 system prompt를 지원하지 않으므로 user message에 포함
-        full_prompt = f"{system_prompt}\n\n사용자 질문: {user_message}"
+    async def get_response_async(self, system_prompt: str, user_message: str, priority: int = PRIORITY_INTERACTIVE) -> str:
+        """AI 응답 비동기 생성 (이벤트 루프를 막지 않고, 동시 동일 요청은 하나의 호출 결과를 공유)"""
+        cache_key = self._get_cache_key(system_prompt, user_message)
+        if cache_key is not None:
+            cached = self.completion_cache.get(cache_key)
+            if cached is not None:
+                return cached
         
-        response = self.gemini_model.generate_content(
-            full_prompt,
-            generation_config=genai.types.GenerationConfig(
-                max_output_tokens=GEMINI_MAX_TOKENS,
-                temperature=GEMINI_TEMPERATURE
+        try:
+            response = await self.single_flight.do_async(
+                self._get_flight_key(system_prompt, user_message),
+                lambda: self._hedged_call_async(system_prompt, user_message, priority)
             )
-        )
-        return response.text
-    
-    def get_provider_info(self) -> Dict:
-        """현재 AI 제공자 정보 반환"""
-        if self.provider == "openai":
-            return {
-                "provider": "OpenAI",
-                "model": OPENAI_MODEL,
-                "max_tokens": OPENAI_MAX_TOKENS,
-                "temperature": OPENAI_TEMPERATURE
-            }
-        elif self.provider == "gemini":
-            return {
-                "provider": "Gemini",
-                "model": GEMINI_MODEL,
-                "max_tokens": GEMINI_MAX_TOKENS,
-                "temperature": GEMINI_TEMPERATURE
-            }
-        else:
-            return {"provider": "Unknown"}
+        except RateLimitWait as e:
+            print(f"AI 요청 대기열 초과: {e}")
+            return self._rate_limit_message(e)
+        except asyncio.TimeoutError:
+            print(f"AI 응답 시간 초과 ({AI_REQUEST_TIMEOUT}초)")
+            return "죄송합니다. AI 응답 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."
+        except Exception as e:
+            print(f"AI 응답 생성 오류: {e}")
+            return "죄송합니다. AI 응답 생성 중 오류가 발생했습니다."
+        
+        # 정상 응답만 캐시
+        if cache_key is not None and response:
+            self.completion_cache.set(cache_key, response)
+        return response
+    
+    async def complete_async(self, system_prompt: str, user_message: str, priority: int = PRIORITY_INTERACTIVE) -> str:
+        """응답 캐시 없이 호출하고 오류는 예외로 전달 (요약 등 백그라운드 작업용)"""
+        return await self._hedged_call_async(system_prompt, user_message, priority)
+    
+    async def get_response_with_tools_async(self, system_prompt: str, user_message: str, toolkit, priority: int = PRIORITY_INTERACTIVE) -> str:
+        """도구 호출 모드 AI 응답 (모델이 요청한 데이터만 조회하므로 응답 캐시/요청 병합 없이 제공자 순서대로 시도)"""
+        last_error: Optional[BaseException] = None
+        try:
+            candidates = self._available_providers()
+        except Exception as e:
+            print(f"AI 응답 생성 오류: {e}")
+            return "죄송합니다. AI 응답 생성 중 오류가 발생했습니다."
+        
+        for index, name in enumerate(candidates):
+            if not self._start_call(name):
+                continue
+            try:
+                await ai_scheduler.acquire_async(name, self._estimate_tokens(name, system_prompt, user_message), priority)
+            except RateLimitWait as e:
+                last_error = e
+                continue
+            started = time.monotonic()
+            try:
+                async with self._async_semaphore:
+                    # 도구 호출 왕복마다 업스트림 요청이 발생하므로 왕복 수만큼 타임아웃 확장
+                    response = await asyncio.wait_for(
+                        self._clients[name].complete_with_tools_async(system_prompt, user_message, toolkit),
+                        timeout=AI_REQUEST_TIMEOUT * (AI_TOOL_MAX_ROUNDS + 1)
+                    )
+            except Exception as e:
+                print(f"AI 제공자 도구 호출 오류 ({name}): {e}")
+                self._record_result(name, started, e)
+                self._penalize_if_rate_limited(name, e)
+                last_error = e
+                continue
+            self._record_result(name, started)
+            if index > 0:
+                self.failovers += 1
+            self.tool_calls += len(toolkit.calls)
+            return response
+        
+        if isinstance(last_error, RateLimitWait):
+            return self._rate_limit_message(last_error)
+        if isinstance(last_error, asyncio.TimeoutError):
+            return "죄송합니다. AI 응답 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."
+        return "죄송합니다. AI 응답 생성 중 오류가 발생했습니다."
+    
+    def stream_response(self, system_prompt: str, user_message: str, priority: int = PRIORITY_INTERACTIVE) -> Iterator[str]:
+        """AI 응답을 토큰 조각 단위로 스트리밍 (캐시 적중 시 한 번에 전송, 첫 조각 전 오류는 다음 제공자로 전환)"""
+        cache_key = self._get_cache_key(system_prompt, user_message)
+        if cache_key is not None:
+            cached = self.completion_cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+        
+        chunks = []
+        last_error: Optional[BaseException] = None
+        try:
+            for index, name in enumerate(self._available_providers()):
+                if not self._start_call(name):
+                    continue
+                try:
+                    ai_scheduler.acquire(name, self._estimate_tokens(name, system_prompt, user_message), priority)
+                except RateLimitWait as e:
+                    last_error = e
+                    continue
+                started = time.monotonic()
+                try:
+                    with self._sync_semaphore:
+                        for chunk in self._clients[name].stream(system_prompt, user_message):
+                            if not chunks:
+                                self.first_token_latency[name].observe(time.monotonic() - started)
+                            chunks.append(chunk)
+                            yield chunk
+                except Exception as e:
+                    self._record_result(name, started, e)
+                    self._penalize_if_rate_limited(name, e)
+                    if chunks:
+                        raise
+                    print(f"AI 제공자 스트리밍 오류 ({name}): {e}")
+                    last_error = e
+                    continue
+                self._record_result(name, started)
+                if index > 0:
+                    self.failovers += 1
+                break
+            else:
+                raise last_error or RuntimeError("모든 AI 제공자의 스트리밍 응답이 실패했습니다.")
+        except RateLimitWait as e:
+            print(f"AI 요청 대기열 초과: {e}")
+            yield self._rate_limit_message(e)
+            return
+        except Exception as e:
+            print(f"AI 스트리밍 응답 생성 오류: {e}")
+            yield "죄송합니다. AI 응답 생성 중 오류가 발생했습니다."
+            return
+        
+        # 끝까지 정상적으로 받은 응답만 캐시
+        if cache_key is not None and chunks:
+            self.completion_cache.set(cache_key, "".join(chunks))
+    
+    def get_provider_info(self, name: Optional[str] = None) -> Dict:
+        """AI 제공자 정보 반환 (이름 미지정 시 1순위 제공자)"""
+        return describe_provider(name or self.provider)
+    
+    def get_stats(self) -> Dict:
+        """AI 서비스 통계 반환"""
+        return {
+            "provider": self.get_provider_info(),
+            "cache": self.completion_cache.get_stats(),
+            "single_flight": self.single_flight.get_stats(),
+            "scheduler": ai_scheduler.get_stats(),
+            "tools": {
+                "enabled": AI_TOOLS_ENABLED,
+                "tool_calls": self.tool_calls
+            },
+            "failover": {
+                "providers": self.providers,
+                "loaded": list(self._clients),
+                "errors": dict(self._client_errors),
+                "hedge_delay": AI_HEDGE_DELAY,
+                "hedged_requests": self.hedged_requests,
+                "failovers": self.failovers
+            },
+            "providers": {
+                name: {
+                    "circuit": self.breakers[name].get_stats(),
+                    "latency": self.latency[name].get_stats(),
+                    "first_token_latency": self.first_token_latency[name].get_stats(),
+                    "prompt_cache": self.prompt_cache[name].get_stats()
+                }
+                for name in self.providers
+            },
+            "max_concurrency": AI_MAX_CONCURRENCY,
+            "request_timeout": AI_REQUEST_TIMEOUT
+        }
+    
+    async def aclose(self):
+        """제공자 클라이언트 연결 풀 정리"""
+        for client in self._clients.values():
+            await client.aclose()
 
 # 전역 AI 서비스 인스턴스
-ai_service = AIService() 
\ No newline at end of file
+ai_service = AIService()
@@ -0,0 +1,121 @@
+"""
+챗봇 결정적 응답 캐시
+일정/출결/성적처럼 DB 조회로 만들어지는 챗봇 응답을 (영역, 범위, 의도, 개체 ID, 날짜) 키로 캐시하고
+해당 데이터 쓰기(일정 등록/수정/삭제, 성적 입력, 출결 입력) 시 영역 단위로 무효화하는 기능
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+from config import ANSWER_CACHE_ENABLED, ANSWER_CACHE_MAX_SIZE, ANSWER_CACHE_TTL
+
+# 캐시 영역 (키의 첫 번째 요소)
+DOMAIN_CALENDAR = "calendar"
+DOMAIN_GRADE = "grade"
+DOMAIN_ATTENDANCE = "attendance"
+
+# 처리 함수가 오류를 문자열로 반환하는 경우 캐시하지 않음
+ERROR_MARKER = "오류가 발생했습니다"
+
+
+class AnswerCache:
+    """LRU + TTL 응답 캐시 (키 = (영역, 범위, ...), 범위는 일정의 user_id 또는 None)"""
+
+    def __init__(self, max_size: int = ANSWER_CACHE_MAX_SIZE, ttl_seconds: int = ANSWER_CACHE_TTL, enabled: bool = ANSWER_CACHE_ENABLED):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._entries: "OrderedDict[Tuple, Tuple[str, float]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}  # 영역별 무효화 세대 번호
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: Tuple) -> Optional[str]:
+        """캐시된 응답 반환 (없거나 만료된 경우 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            answer, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return answer
+
+    def get_or_build(self, key: Tuple, builder: Callable[[], str]) -> str:
+        """캐시된 응답이 있으면 반환, 없으면 builder로 생성 후 저장"""
+        if not self.enabled:
+            return builder()
+
+        answer = self.get(key)
+        if answer is not None:
+            self.hits += 1
+            return answer
+
+        self.misses += 1
+        domain = key[0]
+        generation = self._generations.get(domain, 0)
+        answer = builder()
+
+        # 오류 응답은 저장하지 않고, 생성 중 같은 영역이 무효화된 경우에도 저장하지 않음
+        if answer and ERROR_MARKER not in answer:
+            with self._lock:
+                if generation == self._generations.get(domain, 0):
+                    self._entries[key] = (answer, time.monotonic())
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_size:
+                        self._entries.popitem(last=False)
+        return answer
+
+    def invalidate(self, domain: str, scope: Optional[int] = None):
+        """영역의 응답 무효화 (scope 지정 시 해당 사용자 응답만)"""
+        with self._lock:
+            self._generations[domain] = self._generations.get(domain, 0) + 1
+            stale = [key for key in self._entries if key[0] == domain and (scope is None or key[1] == scope)]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += 1
+
+    def clear(self):
+        """전체 캐시 삭제"""
+        with self._lock:
+            for domain in list(self._generations):
+                self._generations[domain] += 1
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """캐시 적중 통계 반환"""
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "invalidations": self.invalidations
+        }
+
+
+# 전역 응답 캐시 인스턴스
+answer_cache = AnswerCache()
+
+
+def invalidate_calendar_answers(user_id: Optional[int] = None):
+    """일정 등록/수정/삭제 시 호출 (해당 사용자의 일정 응답만 무효화)"""
+    answer_cache.invalidate(DOMAIN_CALENDAR, user_id)
+
+
+def invalidate_grade_answers():
+    """성적 입력 시 호출"""
+    answer_cache.invalidate(DOMAIN_GRADE)
+
+
+def invalidate_attendance_answers():
+    """출결 입력 시 호출"""
+    answer_cache.invalidate(DOMAIN_ATTENDANCE)
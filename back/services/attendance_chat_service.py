@@ -8,6 +8,8 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text, func
 from models import User, Class, Student, Attendance, AttendanceType
 from services.attendance_service import get_student_attendance_by_name
+from services.entity_memo import find_student
+from services.intent_matcher import intent_matcher, ChatMatch
 import re
 
 
@@ -18,7 +20,7 @@ def get_student_attendance_by_grade(student_name: str) -> str:
         
         with DatabaseService.get_session() as session:
             # 학생 정보 조회
-            student = session.query(Student).filter(Student.name == student_name).first()
+            student = find_student(session, student_name)
             if not student:
                 return f"{student_name} 학생을 찾을 수 없습니다."
             
@@ -188,7 +190,7 @@ def get_student_attendance_info(student_name: str) -> str:
         
         with DatabaseService.get_session() as session:
             # 학생 정보 조회
-            student = session.query(Student).filter(Student.name == student_name).first()
+            student = find_student(session, student_name)
             if not student:
                 return f"{student_name} 학생을 찾을 수 없습니다."
             
@@ -253,29 +255,24 @@ def get_student_attendance_info(student_name: str) -> str:
         return "학생 출석 정보 조회 중 오류가 발생했습니다."
 
 
-def process_attendance_query(chat_request, context: Dict, db: Session) -> str:
+def process_attendance_query(chat_request, context: Dict, db: Session, match: Optional[ChatMatch] = None) -> str:
     """출석 관련 질문 처리"""
     try:
-        student_names = context.get('students', [])
-        student_name = None
-        
-        # 학생 이름이 포함된 경우
-        for name in student_names:
-            if name in chat_request.message:
-                student_name = name
-                break
+        if match is None:
+            match = intent_matcher.match(chat_request.message, context.get('students', []))
+        student_name = match.student
         
         if not student_name:
             # 출석률 비교 질문 처리
-            if any(keyword in chat_request.message for keyword in ["가장 안좋은", "제일 안좋은", "낮은", "최악"]):
+            if match.has("attendance_lowest"):
                 return get_lowest_attendance_students()
-            elif any(keyword in chat_request.message for keyword in ["가장 좋은", "제일 좋은", "높은", "최고"]):
+            elif match.has("attendance_highest"):
                 return get_highest_attendance_students()
             else:
                 return "어떤 학생의 출석 정보를 알고 싶으신가요? 학생 이름을 말씀해주세요."
         
         # 학년별 출석률 조회
-        if any(keyword in chat_request.message for keyword in ["1학년2학년3학년", "1학년 2학년 3학년", "학년별 출석률", "학년별 출결률"]):
+        if match.has("attendance_comparison"):
             return get_student_attendance_by_grade(student_name)
         
         # 일반 출석 정보 조회
@@ -283,4 +280,4 @@ def process_attendance_query(chat_request, context: Dict, db: Session) -> str:
         
     except Exception as e:
         print(f"출석 조회 처리 오류: {e}")
-        return "출석 정보 조회 중 오류가 발생했습니다." 
\ No newline at end of file
+        return "출석 정보 조회 중 오류가 발생했습니다."
@@ -2,41 +2,41 @@ from database_service import DatabaseService
 from datetime import datetime
 from sqlalchemy import func, and_, or_
 from models import Student, Class, Attendance, AttendanceType, AttendanceReason, MonthlyAttendance, YearlyAttendance
+from services.entity_memo import find_student
 
 def get_student_attendance_by_name(student_name):
     """학생 이름으로 출결 데이터 조회"""
     try:
         with DatabaseService.get_session() as session:
-            # 학생 정보 조회
-            student = session.query(Student).filter(
-                Student.name == student_name
-            ).first()
+            # 학생 정보 조회 (요청 범위 메모)
+            student = find_student(session, student_name)
             
             if not student:
                 return None
             
-            # 연도별 출결 통계 조회
-            yearly_attendance = session.query(YearlyAttendance).filter(
-                YearlyAttendance.student_id == student.id
-            ).order_by(YearlyAttendance.year.desc()).all()
-            
-            # 월별 출결 통계 조회 (최근 3개월)
-            monthly_attendance = session.query(MonthlyAttendance).filter(
-                MonthlyAttendance.student_id == student.id
-            ).order_by(MonthlyAttendance.year.desc(), MonthlyAttendance.month.desc()).limit(3).all()
-            
-            # 최근 출결 기록 조회 (최근 10일)
-            recent_attendance = session.query(
-                Attendance, AttendanceType, AttendanceReason
-            ).join(
-                AttendanceType, Attendance.type_id == AttendanceType.id
-            ).outerjoin(
-                AttendanceReason, Attendance.reason_id == AttendanceReason.id
-            ).filter(
-                Attendance.student_id == student.id
-            ).order_by(
-                Attendance.date.desc()
-            ).limit(10).all()
+            # 연도별/월별 통계와 최근 기록은 서로 독립적이므로 병렬 조회
+            yearly_attendance, monthly_attendance, recent_attendance = DatabaseService.fan_out(
+                # 연도별 출결 통계 조회
+                lambda s: s.query(YearlyAttendance).filter(
+                    YearlyAttendance.student_id == student.id
+                ).order_by(YearlyAttendance.year.desc()).all(),
+                # 월별 출결 통계 조회 (최근 3개월)
+                lambda s: s.query(MonthlyAttendance).filter(
+                    MonthlyAttendance.student_id == student.id
+                ).order_by(MonthlyAttendance.year.desc(), MonthlyAttendance.month.desc()).limit(3).all(),
+                # 최근 출결 기록 조회 (최근 10일)
+                lambda s: s.query(
+                    Attendance, AttendanceType, AttendanceReason
+                ).join(
+                    AttendanceType, Attendance.type_id == AttendanceType.id
+                ).outerjoin(
+                    AttendanceReason, Attendance.reason_id == AttendanceReason.id
+                ).filter(
+                    Attendance.student_id == student.id
+                ).order_by(
+                    Attendance.date.desc()
+                ).limit(10).all()
+            )
             
             return {
                 'student': {
@@ -207,52 +207,51 @@ def get_attendance_pattern_analysis(student_name):
     """학생의 출결 패턴 분석"""
     try:
         with DatabaseService.get_session() as session:
-            # 학생 정보 조회
-            student = session.query(Student).filter(
-                Student.name == student_name
-            ).first()
+            # 학생 정보 조회 (요청 범위 메모)
+            student = find_student(session, student_name)
             
             if not student:
                 return None
             
-            # 결석/지각/조퇴 사유 분석
-            attendance_reasons = session.query(
-                AttendanceReason.name,
-                func.count(Attendance.id).label('count')
-            ).join(
-                Attendance, Attendance.reason_id == AttendanceReason.id
-            ).filter(
-                Attendance.student_id == student.id
-            ).group_by(
-                AttendanceReason.name
-            ).order_by(
-                func.count(Attendance.id).desc()
-            ).all()
-            
-            # 월별 출결 패턴
-            monthly_pattern = session.query(
-                MonthlyAttendance.month,
-                MonthlyAttendance.attendance_rate,
-                MonthlyAttendance.absent_days,
-                MonthlyAttendance.late_days
-            ).filter(
-                MonthlyAttendance.student_id == student.id
-            ).order_by(
-                MonthlyAttendance.year.desc(),
-                MonthlyAttendance.month.desc()
-            ).limit(12).all()
-            
-            # 연도별 출결 변화
-            yearly_change = session.query(
-                YearlyAttendance.year,
-                YearlyAttendance.attendance_rate,
-                YearlyAttendance.absent_days,
-                YearlyAttendance.late_days
-            ).filter(
-                YearlyAttendance.student_id == student.id
-            ).order_by(
-                YearlyAttendance.year.desc()
-            ).all()
+            # 사유/월별/연도별 분석은 서로 독립적이므로 병렬 조회
+            attendance_reasons, monthly_pattern, yearly_change = DatabaseService.fan_out(
+                # 결석/지각/조퇴 사유 분석
+                lambda s: s.query(
+                    AttendanceReason.name,
+                    func.count(Attendance.id).label('count')
+                ).join(
+                    Attendance, Attendance.reason_id == AttendanceReason.id
+                ).filter(
+                    Attendance.student_id == student.id
+                ).group_by(
+                    AttendanceReason.name
+                ).order_by(
+                    func.count(Attendance.id).desc()
+                ).all(),
+                # 월별 출결 패턴
+                lambda s: s.query(
+                    MonthlyAttendance.month,
+                    MonthlyAttendance.attendance_rate,
+                    MonthlyAttendance.absent_days,
+                    MonthlyAttendance.late_days
+                ).filter(
+                    MonthlyAttendance.student_id == student.id
+                ).order_by(
+                    MonthlyAttendance.year.desc(),
+                    MonthlyAttendance.month.desc()
+                ).limit(12).all(),
+                # 연도별 출결 변화
+                lambda s: s.query(
+                    YearlyAttendance.year,
+                    YearlyAttendance.attendance_rate,
+                    YearlyAttendance.absent_days,
+                    YearlyAttendance.late_days
+                ).filter(
+                    YearlyAttendance.student_id == student.id
+                ).order_by(
+                    YearlyAttendance.year.desc()
+                ).all()
+            )
             
             return {
                 'student_name': student.name,
@@ -358,4 +357,4 @@ def get_perfect_attendance_students(grade=None):
             ]
     except Exception as e:
         print(f"완벽 출석 학생 조회 오류: {e}")
-        return [] 
\ No newline at end of file
+        return []
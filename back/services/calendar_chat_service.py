@@ -9,7 +9,10 @@ from sqlalchemy.orm import Session
 from models import CalendarEvent
 from services.calendar_service import CalendarService
 from database_service import DatabaseService
-import re
+from services.date_parser import date_parser, COMMAND_CREATE, COMMAND_DELETE
+from services.event_title_index import event_title_index
+
+INVALID_DATE_MESSAGE = "날짜 형식이 올바르지 않습니다. '8월 6일' 또는 '8/6' 형식으로 입력해주세요."
 
 
 def get_today_schedule(user_id: int) -> str:
@@ -97,23 +100,28 @@ def get_tomorrow_schedule(user_id: int) -> str:
 
 def get_weekly_schedule(user_id: int) -> str:
     """이번 주 일정 조회"""
+    today = date.today()
+    # 이번 주 시작일 (월요일) ~ 종료일 (일요일)
+    week_start = today - timedelta(days=today.weekday())
+    return get_date_range_schedule(week_start, week_start + timedelta(days=6), user_id, "이번 주")
+
+
+def get_date_range_schedule(start_date: date, end_date: date, user_id: int, label: Optional[str] = None) -> str:
+    """기간 일정 조회 ("다음 주", "8월 6일부터 8일까지" 등)"""
     try:
         with DatabaseService.get_session() as session:
             calendar_service = CalendarService(session)
-            today = date.today()
             
-            # 이번 주 시작일 (월요일)
-            week_start = today - timedelta(days=today.weekday())
-            # 이번 주 종료일 (일요일)
-            week_end = week_start + timedelta(days=6)
+            period = f"{start_date.strftime('%m월 %d일')} ~ {end_date.strftime('%m월 %d일')}"
+            heading = f"{label}({period})" if label else period
             
-            # 이번 주 이벤트 조회
-            events = calendar_service.get_events_by_user(user_id, week_start, week_end)
+            # 기간 이벤트 조회
+            events = calendar_service.get_events_by_user(user_id, start_date, end_date)
             
             if not events:
-                return f"이번 주({week_start.strftime('%m월 %d일')} ~ {week_end.strftime('%m월 %d일')})은 일정이 없습니다."
+                return f"{heading}은 일정이 없습니다."
             
-            result = f"📅 이번 주({week_start.strftime('%m월 %d일')} ~ {week_end.strftime('%m월 %d일')}) 일정입니다:\n\n"
+            result = f"📅 {heading} 일정입니다:\n\n"
             
             # 날짜별로 그룹화
             events_by_date = {}
@@ -157,47 +165,16 @@ def get_weekly_schedule(user_id: int) -> str:
             return result
             
     except Exception as e:
-        print(f"이번 주 일정 조회 오류: {e}")
-        return "이번 주 일정 조회 중 오류가 발생했습니다."
+        print(f"기간 일정 조회 오류: {e}")
+        return "기간 일정 조회 중 오류가 발생했습니다."
 
 
-def get_specific_date_schedule(date_str: str, user_id: int) -> str:
-    """특정 날짜의 일정 조회"""
+def get_specific_date_schedule(target_date: date, user_id: int) -> str:
+    """특정 날짜의 일정 조회 (날짜 해석은 호출 측에서 date_parser로 처리)"""
     try:
         with DatabaseService.get_session() as session:
             calendar_service = CalendarService(session)
             
-            # 날짜 파싱 (다양한 형식 지원)
-            try:
-                today = date.today()
-                
-                # 키워드 기반 날짜 처리
-                if date_str == "내일":
-                    target_date = today + timedelta(days=1)
-                elif date_str == "모레":
-                    target_date = today + timedelta(days=2)
-                elif date_str == "글피":
-                    target_date = today + timedelta(days=3)
-                elif "월" in date_str and "일" in date_str:
-                    # "8월 6일" 형식
-                    month_day = date_str.replace("월", " ").replace("일", "").strip()
-                    month, day = map(int, month_day.split())
-                    target_date = date(2025, month, day)
-                elif "/" in date_str:
-                    # "8/6" 형식
-                    month, day = map(int, date_str.split("/"))
-                    target_date = date(2025, month, day)
-                else:
-                    # 숫자만 있는 경우 (예: "8월 6일" -> "8 6")
-                    parts = date_str.split()
-                    if len(parts) >= 2:
-                        month, day = map(int, parts[:2])
-                        target_date = date(2025, month, day)
-                    else:
-                        return "날짜 형식을 인식할 수 없습니다. '8월 6일' 또는 '8/6' 형식으로 입력해주세요."
-            except ValueError:
-                return "날짜 형식이 올바르지 않습니다. '8월 6일' 또는 '8/6' 형식으로 입력해주세요."
-            
             # 해당 날짜의 이벤트 조회
             events = calendar_service.get_events_by_user(user_id, target_date, target_date)
             
@@ -240,66 +217,24 @@ def create_event_from_natural_language(message: str, user_id: int) -> str:
         with DatabaseService.get_session() as session:
             calendar_service = CalendarService(session)
             
-            # 날짜 추출
-            today = date.today()
-            target_date = today
-            
-            # "오늘", "내일", "모레" 등의 키워드 처리
-            if "오늘" in message:
-                target_date = today
-            elif "내일" in message:
-                target_date = today + timedelta(days=1)
-            elif "모레" in message:
-                target_date = today + timedelta(days=2)
-            elif "글피" in message:
-                target_date = today + timedelta(days=3)
-            
-            # 특정 날짜 패턴 (예: "8월 6일", "8/6")
-            date_patterns = [
-                r'(\d+)월\s*(\d+)일',
-                r'(\d+)/(\d+)',
-                r'(\d+)\s+(\d+)'
-            ]
-            
-            for pattern in date_patterns:
-                match = re.search(pattern, message)
-                if match:
-                    month, day = map(int, match.groups())
-                    target_date = date(2025, month, day)
-                    break
-            
-            # 시간 추출
-            time_pattern = r'(\d{1,2})시\s*(\d{0,2})?분?'
-            time_match = re.search(time_pattern, message)
+            # 날짜/시간/제목 추출 (날짜가 없으면 오늘, 시간이 없으면 종일 일정)
+            parsed = date_parser.parse(message, command=COMMAND_CREATE)
+            if parsed.invalid_date:
+                return INVALID_DATE_MESSAGE
+            if parsed.week_range:
+                return "어느 요일인지 함께 말씀해주세요. 예) \"다음 주 수요일 3시 회의 등록해줘\""
+            start_date, end_date = parsed.date_range or (date.today(), date.today())
             
             start_time = None
             end_time = None
             
-            if time_match:
-                hour = int(time_match.group(1))
-                minute = int(time_match.group(2)) if time_match.group(2) else 0
-                start_time = datetime.strptime(f"{hour:02d}:{minute:02d}", "%H:%M").time()
-                # 기본적으로 1시간 후 종료
-                end_hour = (hour + 1) % 24
-                end_time = datetime.strptime(f"{end_hour:02d}:{minute:02d}", "%H:%M").time()
-            
-            # 제목 추출 (시간 정보 제거 후 남은 텍스트)
-            title = message
-            # 시간 정보 제거
-            title = re.sub(time_pattern, '', title)
-            # 날짜 정보 제거
-            title = re.sub(r'오늘|내일|모레|글피', '', title)
-            title = re.sub(r'(\d+)월\s*(\d+)일', '', title)
-            title = re.sub(r'(\d+)/(\d+)', '', title)
-            # 등록 관련 키워드 제거
-            title = re.sub(r'등록해줘|등록|추가해줘|추가|일정\s*등록|일정\s*추가', '', title)
-            title = re.sub(r'에\s*', '', title)
-            title = re.sub(r'일정을\s*', '', title)
-            title = title.strip()
-            
-            # 제목이 비어있거나 의미없는 경우, 기본 제목 설정
-            if not title or title.strip() == "":
-                title = f"{event_type}"
+            if parsed.time_range:
+                start_time, end_time = parsed.time_range
+                if end_time is None:
+                    # 기본적으로 1시간 후 종료
+                    end_time = start_time.replace(hour=(start_time.hour + 1) % 24)
+            
+            title = parsed.title
             
             # 이벤트 타입 추정
             event_type = "개인일정"
@@ -312,6 +247,10 @@ def create_event_from_natural_language(message: str, user_id: int) -> str:
             elif any(keyword in title for keyword in ["행사", "축제", "대회", "식"]):
                 event_type = "행사"
             
+            # 제목이 비어있으면 일정 종류를 제목으로 사용
+            if not title:
+                title = event_type
+            
             # 색상 설정
             color_map = {
                 "수업": "#3788d8",
@@ -327,8 +266,8 @@ def create_event_from_natural_language(message: str, user_id: int) -> str:
                 "user_id": user_id,
                 "title": title,
                 "description": f"{event_type} 관련 일정입니다.",
-                "start_date": target_date,
-                "end_date": target_date,
+                "start_date": start_date,
+                "end_date": end_date,
                 "event_type": event_type,
                 "color": color,
                 "is_all_day": start_time is None,
@@ -347,7 +286,9 @@ def create_event_from_natural_language(message: str, user_id: int) -> str:
                 event = calendar_service.create_event(event_data)
                 
                 # 응답 메시지 생성
-                date_str = target_date.strftime('%m월 %d일')
+                date_str = start_date.strftime('%m월 %d일')
+                if end_date != start_date:
+                    date_str += f" ~ {end_date.strftime('%m월 %d일')}"
                 time_str = ""
                 if start_time and end_time:
                     time_str = f" {start_time.strftime('%H:%M')} - {end_time.strftime('%H:%M')}"
@@ -362,74 +303,45 @@ def create_event_from_natural_language(message: str, user_id: int) -> str:
         return "일정 등록 중 오류가 발생했습니다. 다시 시도해주세요."
 
 
+def delete_event_by_title(calendar_service: CalendarService, session: Session, user_id: int, title: str, target_time=None) -> str:
+    """날짜 없이 제목만 말한 일정 삭제 (제목 색인 후보 중 오늘과 가장 가까운 일정)"""
+    candidates = event_title_index.search(session, user_id, title, target_time=target_time)
+    for candidate in candidates:
+        if calendar_service.delete_event(candidate.id, user_id):
+            return f"✅ {candidate.start_date.strftime('%Y년 %m월 %d일')} '{candidate.title}' 일정이 성공적으로 삭제되었습니다."
+        # 다른 워커에서 이미 삭제된 일정은 색인에서 빼고 다음 후보 시도
+        event_title_index.remove(user_id, candidate.id)
+    return f"'{title}' 일정을 찾을 수 없습니다."
+
+
 def delete_event_from_natural_language(message: str, user_id: int) -> str:
     """자연어로 일정 삭제"""
     try:
         with DatabaseService.get_session() as session:
             calendar_service = CalendarService(session)
             
-            # 날짜 추출
-            today = date.today()
-            target_date = today
-            
-            # "오늘", "내일", "모레" 등의 키워드 처리
-            if "오늘" in message:
-                target_date = today
-            elif "내일" in message:
-                target_date = today + timedelta(days=1)
-            elif "모레" in message:
-                target_date = today + timedelta(days=2)
-            elif "글피" in message:
-                target_date = today + timedelta(days=3)
-            
-            # 특정 날짜 패턴 (예: "8월 6일", "8/6")
-            date_patterns = [
-                r'(\d+)월\s*(\d+)일',
-                r'(\d+)/(\d+)',
-                r'(\d+)\s+(\d+)'
-            ]
-            
-            for pattern in date_patterns:
-                match = re.search(pattern, message)
-                if match:
-                    month, day = map(int, match.groups())
-                    target_date = date(2025, month, day)
-                    break
-            
-            # 시간 추출
-            time_pattern = r'(\d{1,2})시\s*(\d{0,2})?분?'
-            time_match = re.search(time_pattern, message)
-            
-            target_time = None
-            if time_match:
-                hour = int(time_match.group(1))
-                minute = int(time_match.group(2)) if time_match.group(2) else 0
-                target_time = datetime.strptime(f"{hour:02d}:{minute:02d}", "%H:%M").time()
-            
-            # 제목 추출
-            title = message
-            # 시간 정보 제거
-            title = re.sub(time_pattern, '', title)
-            # 날짜 정보 제거
-            title = re.sub(r'오늘|내일|모레|글피', '', title)
-            title = re.sub(r'(\d+)월\s*(\d+)일', '', title)
-            title = re.sub(r'(\d+)/(\d+)', '', title)
-            # 삭제 관련 키워드 제거
-            title = re.sub(r'삭제해줘|삭제|취소해줘|취소|일정\s*삭제|일정\s*취소', '', title)
-            title = re.sub(r'에\s*', '', title)
-            title = re.sub(r'일정을\s*', '', title)
-            title = re.sub(r'일정이\s*', '', title)
-            title = re.sub(r'일정\s*', '', title)
-            title = re.sub(r'을\s*', '', title)
-            title = re.sub(r'이\s*', '', title)
-            title = re.sub(r'가\s*', '', title)
-            title = title.strip()
+            # 날짜/시간/제목 추출
+            parsed = date_parser.parse(message, command=COMMAND_DELETE)
+            if parsed.invalid_date:
+                return INVALID_DATE_MESSAGE
+            target_time = parsed.time_range[0] if parsed.time_range else None
+            title = parsed.title
             
-            # 해당 날짜의 이벤트 조회
-            events = calendar_service.get_events_by_user(user_id, target_date, target_date)
+            # 날짜 없이 제목만 말한 경우 ("회의 취소해줘") 제목 색인으로 찾음
+            if parsed.date_range is None and title:
+                return delete_event_by_title(calendar_service, session, user_id, title, target_time)
+            
+            # 날짜를 말하지 않았으면 (제목 없이 시간만 말한 경우) 오늘 일정에서 찾음
+            start_date, end_date = parsed.date_range or (date.today(), date.today())
+            
+            # 해당 날짜(기간)의 이벤트 조회
+            events = calendar_service.get_events_by_user(user_id, start_date, end_date)
+            period = start_date.strftime('%Y년 %m월 %d일')
+            if end_date != start_date:
+                period += f" ~ {end_date.strftime('%m월 %d일')}"
             
             if not events:
-                return f"{target_date.strftime('%Y년 %m월 %d일')}에는 삭제할 일정이 없습니다."
+                return f"{period}에는 삭제할 일정이 없습니다."
             
             # 제목과 시간으로 일치하는 이벤트 찾기
             matched_events = []
@@ -456,7 +368,7 @@ def delete_event_from_natural_language(message: str, user_id: int) -> str:
                             matched_events.append(event)
             
             if not matched_events:
-                return f"{target_date.strftime('%Y년 %m월 %d일')}에 '{title}' 일정을 찾을 수 없습니다."
+                return f"{period}에 '{title}' 일정을 찾을 수 없습니다."
             
             # 첫 번째 매칭된 이벤트 삭제
             event_to_delete = matched_events[0]
@@ -1,5 +1,9 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models import CalendarEvent
+from services.answer_cache import invalidate_calendar_answers
+from services.event_title_index import event_title_index
 from datetime import datetime, date
 from typing import List, Optional
 
@@ -31,6 +35,8 @@ class CalendarService:
         self.db.add(event)
         self.db.commit()
         self.db.refresh(event)
+        invalidate_calendar_answers(event.user_id)
+        event_title_index.add(event)
         return event
 
     def update_event(self, event_id: int, user_id: int, event_data: dict) -> Optional[CalendarEvent]:
@@ -46,6 +52,8 @@ class CalendarService:
         event.updated_at = datetime.now()
         self.db.commit()
         self.db.refresh(event)
+        invalidate_calendar_answers(user_id)
+        event_title_index.add(event)
         return event
 
     def delete_event(self, event_id: int, user_id: int) -> bool:
@@ -56,6 +64,8 @@ class CalendarService:
             
         self.db.delete(event)
         self.db.commit()
+        invalidate_calendar_answers(user_id)
+        event_title_index.remove(user_id, event_id)
         return True
 
     def get_events_by_month(self, user_id: int, year: int, month: int) -> List[CalendarEvent]:
@@ -66,4 +76,82 @@ class CalendarService:
         else:
             end_date = date(year, month + 1, 1) - date.resolution
             
-        return self.get_events_by_user(user_id, start_date, end_date) 
\ No newline at end of file
+        return self.get_events_by_user(user_id, start_date, end_date)
+
+
+class AsyncCalendarService:
+    """CalendarService의 비동기 버전 (AsyncSession 사용)"""
+
+    def __init__(self, db_session: AsyncSession):
+        self.db = db_session
+
+    async def get_events_by_user(self, user_id: int, start_date: Optional[date] = None, end_date: Optional[date] = None) -> List[CalendarEvent]:
+        """사용자의 이벤트 조회"""
+        query = select(CalendarEvent).where(CalendarEvent.user_id == user_id)
+        
+        if start_date:
+            query = query.where(CalendarEvent.start_date >= start_date)
+        if end_date:
+            query = query.where(CalendarEvent.end_date <= end_date)
+            
+        result = await self.db.execute(query.order_by(CalendarEvent.start_date))
+        return list(result.scalars().all())
+
+    async def get_event_by_id(self, event_id: int, user_id: int) -> Optional[CalendarEvent]:
+        """특정 이벤트 조회"""
+        result = await self.db.execute(
+            select(CalendarEvent).where(
+                CalendarEvent.id == event_id,
+                CalendarEvent.user_id == user_id
+            )
+        )
+        return result.scalars().first()
+
+    async def create_event(self, event_data: dict) -> CalendarEvent:
+        """새 이벤트 생성"""
+        event = CalendarEvent(**event_data)
+        self.db.add(event)
+        await self.db.commit()
+        await self.db.refresh(event)
+        invalidate_calendar_answers(event.user_id)
+        event_title_index.add(event)
+        return event
+
+    async def update_event(self, event_id: int, user_id: int, event_data: dict) -> Optional[CalendarEvent]:
+        """이벤트 수정"""
+        event = await self.get_event_by_id(event_id, user_id)
+        if not event:
+            return None
+            
+        for key, value in event_data.items():
+            if hasattr(event, key):
+                setattr(event, key, value)
+        
+        event.updated_at = datetime.now()
+        await self.db.commit()
+        await self.db.refresh(event)
+        invalidate_calendar_answers(user_id)
+        event_title_index.add(event)
+        return event
+
+    async def delete_event(self, event_id: int, user_id: int) -> bool:
+        """이벤트 삭제"""
+        event = await self.get_event_by_id(event_id, user_id)
+        if not event:
+            return False
+            
+        await self.db.delete(event)
+        await self.db.commit()
+        invalidate_calendar_answers(user_id)
+        event_title_index.remove(user_id, event_id)
+        return True
+
+    async def get_events_by_month(self, user_id: int, year: int, month: int) -> List[CalendarEvent]:
+        """특정 월의 이벤트 조회"""
+        start_date = date(year, month, 1)
+        if month == 12:
+            end_date = date(year + 1, 1, 1) - date.resolution
+        else:
+            end_date = date(year, month + 1, 1) - date.resolution
+            
+        return await self.get_events_by_user(user_id, start_date, end_date)
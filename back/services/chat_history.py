@@ -0,0 +1,168 @@
+"""
+대화 기록 관리자
+AI 응답에 전달할 사용자별 대화 기록을 최근 N개 질문/답변은 원문으로,
+그 이전 대화는 토큰 상한이 있는 누적 요약으로 유지하는 기능
+(요약은 응답 반환 후 백그라운드 작업으로 생성하므로 사용자 응답 지연에 포함되지 않음)
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Tuple
+from config import (
+    CHAT_HISTORY_TURNS, CHAT_SUMMARY_MAX_TOKENS,
+    CHAT_STATE_MAX_USERS, CHAT_STATE_IDLE_TTL
+)
+from services.ai_scheduler import PRIORITY_BACKGROUND
+from services.prompt_builder import compose_system_prompt, count_tokens
+
+SUMMARY_SYSTEM_PROMPT = (
+    "다음은 학교 관리 시스템 사용자와 AI 어시스턴트의 대화입니다.\n"
+    "이후 질문에 답하는 데 필요한 사실(언급된 학생 이름, 반, 날짜, 사용자의 요청과 결론)만 남겨 "
+    "{max_tokens}토큰 이내의 한국어 요약으로 작성하세요. 요약 외의 말은 쓰지 마세요."
+)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """토큰 상한을 넘으면 앞부분(오래된 내용)을 잘라 최근 내용 유지"""
+    if count_tokens(text) <= max_tokens:
+        return text
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high) // 2
+        if count_tokens(text[middle:]) <= max_tokens:
+            high = middle
+        else:
+            low = middle + 1
+    return text[low:].lstrip()
+
+
+class ConversationHistory:
+    """사용자 한 명의 대화 기록 (최근 질문/답변 쌍, 요약 대기 중인 이전 쌍, 누적 요약)"""
+
+    def __init__(self, max_turns: int):
+        self.recent: Deque[Tuple[str, str]] = deque()
+        self.max_turns = max_turns
+        self.pending: List[Tuple[str, str]] = []
+        self.summary = ""
+        self.summarizing = False
+        self.touched_at = time.monotonic()
+
+
+class ChatHistoryManager:
+    """사용자별 대화 기록 관리 (사용자 수 LRU 제한, 유휴 TTL 만료)"""
+
+    def __init__(
+        self,
+        max_turns: int = CHAT_HISTORY_TURNS,
+        summary_max_tokens: int = CHAT_SUMMARY_MAX_TOKENS,
+        max_users: int = CHAT_STATE_MAX_USERS,
+        idle_ttl: int = CHAT_STATE_IDLE_TTL
+    ):
+        self.max_turns = max_turns
+        self.summary_max_tokens = summary_max_tokens
+        self.max_users = max_users
+        self.idle_ttl = idle_ttl
+        self._histories: "OrderedDict[int, ConversationHistory]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.summaries = 0
+        self.summary_failures = 0
+
+    def _get(self, user_id: int, create: bool = False) -> ConversationHistory:
+        """사용자 기록 조회 (호출 측에서 잠금 보유)"""
+        history = self._histories.get(user_id)
+        if history is not None and time.monotonic() - history.touched_at > self.idle_ttl:
+            del self._histories[user_id]
+            history = None
+        if history is None and create:
+            history = self._histories[user_id] = ConversationHistory(self.max_turns)
+            while len(self._histories) > self.max_users:
+                self._histories.popitem(last=False)
+        if history is not None:
+            self._histories.move_to_end(user_id)
+        return history
+
+    def append_turn(self, user_id: int, user_message: str, answer: str):
+        """질문/답변 쌍 추가 (최근 N개를 넘는 쌍은 요약 대기열로 이동)"""
+        with self._lock:
+            history = self._get(user_id, create=True)
+            history.recent.append((user_message, answer))
+            while len(history.recent) > history.max_turns:
+                history.pending.append(history.recent.popleft())
+            history.touched_at = time.monotonic()
+
+    def build_system_prompt(self, system_prompt: str, user_id: int) -> str:
+        """시스템 프롬프트 뒤에 이전 대화 요약과 최근 대화 원문 추가"""
+        with self._lock:
+            history = self._get(user_id)
+            if history is None:
+                return system_prompt
+            summary = history.summary
+            # 아직 요약되지 않은 이전 쌍도 빠지지 않도록 함께 전달
+            turns = list(history.pending) + list(history.recent)
+
+        # 대화 기록은 매 턴 바뀌므로 시스템 프롬프트(고정 접두사) 뒤에만 추가
+        return compose_system_prompt(
+            system_prompt,
+            f"이전 대화 요약:\n{summary}" if summary else "",
+            "최근 대화:\n" + "\n".join(
+                f"사용자: {question}\n어시스턴트: {answer}" for question, answer in turns
+            ) if turns else ""
+        )
+
+    async def summarize_pending(self, user_id: int):
+        """요약 대기 중인 이전 대화를 누적 요약에 합침 (응답 반환 후 BackgroundTasks에서 실행)"""
+        from services.ai_service import ai_service
+
+        with self._lock:
+            history = self._get(user_id)
+            if history is None or not history.pending or history.summarizing:
+                return
+            history.summarizing = True
+            pending = list(history.pending)
+            previous_summary = history.summary
+
+        transcript = "\n".join(f"사용자: {question}\n어시스턴트: {answer}" for question, answer in pending)
+        if previous_summary:
+            transcript = f"기존 요약:\n{previous_summary}\n\n이어진 대화:\n{transcript}"
+
+        # 요약 실패나 작업 취소(서버 종료, 연결 끊김) 시에는 원문을 잘라 보관해 프롬프트 크기 상한은 유지
+        summary = transcript
+        try:
+            summary = await ai_service.complete_async(
+                SUMMARY_SYSTEM_PROMPT.format(max_tokens=self.summary_max_tokens),
+                transcript,
+                PRIORITY_BACKGROUND
+            )
+            self.summaries += 1
+        except Exception as e:
+            print(f"대화 요약 생성 오류: {e}")
+            self.summary_failures += 1
+            summary = transcript
+        finally:
+            # CancelledError는 Exception이 아니므로 정리는 항상 finally에서 (summarizing이 남으면 pending이 계속 쌓임)
+            summary = truncate_to_tokens((summary or "").strip(), self.summary_max_tokens)
+            with self._lock:
+                history.summary = summary
+                # 요약하는 동안 새로 밀려난 쌍은 다음 요약에서 처리
+                del history.pending[:len(pending)]
+                history.summarizing = False
+
+    def clear(self, user_id: int):
+        """사용자 대화 기록 삭제"""
+        with self._lock:
+            self._histories.pop(user_id, None)
+
+    def get_stats(self) -> Dict:
+        """대화 기록 통계 반환"""
+        return {
+            "users": len(self._histories),
+            "max_turns": self.max_turns,
+            "summary_max_tokens": self.summary_max_tokens,
+            "summaries": self.summaries,
+            "summary_failures": self.summary_failures
+        }
+
+
+# 전역 대화 기록 관리자 인스턴스
+chat_history = ChatHistoryManager()
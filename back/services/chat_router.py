@@ -3,153 +3,397 @@
 사용자 메시지를 분석하여 적절한 서비스로 분기하는 기능
 """
 
-from typing import Dict
+from typing import Dict, Iterator, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from services.calendar_chat_service import (
     get_today_schedule, get_tomorrow_schedule, get_weekly_schedule,
-    get_specific_date_schedule, create_event_from_natural_language,
-    delete_event_from_natural_language
+    get_specific_date_schedule, get_date_range_schedule, create_event_from_natural_language,
+    delete_event_from_natural_language, INVALID_DATE_MESSAGE
 )
 from services.student_chat_service import process_student_grade_query
 from services.attendance_chat_service import process_attendance_query
 from services.ai_service import ai_service
+from services.chat_tools import ChatToolkit, build_tool_system_prompt
+from config import AI_TOOLS_ENABLED, CHAT_HISTORY_ENABLED, STUDENT_SUMMARY_ENABLED, SessionLocal
+from db_executor import run_db, run_parallel
+from services.context_cache import context_cache
+from services.answer_cache import answer_cache, DOMAIN_CALENDAR, DOMAIN_GRADE, DOMAIN_ATTENDANCE
+from services.intent_matcher import intent_matcher
+from services.prompt_builder import prompt_builder
+from services.chat_state import chat_state_store, ChatTurnState
+from services.chat_history import chat_history
+from services.entity_memo import entity_memo
+from services.faq_router import faq_router
+from services.date_parser import date_parser
+from services.student_summary_service import find_student_summary, format_student_summary
+from datetime import date, timedelta
 
 
-def get_database_context(db: Session) -> Dict:
-    """데이터베이스 컨텍스트 수집 (2025년도 기준)"""
+def load_database_context(db: Session) -> Dict:
+    """데이터베이스 컨텍스트 수집 (2025년도 기준, 필요한 컬럼만 조회)"""
     try:
         from models import User, Class, Student
         
-        # 2025년도 학생 수
-        total_students = db.query(Student).filter(Student.academic_year == 2025).count()
-        
-        # 2025년도 반 수
-        total_classes = db.query(Class).filter(Class.academic_year == 2025).count()
-        
-        # 전체 선생님 수 (is_active가 True인 사용자)
-        total_teachers = db.query(User).filter(User.is_active == True).count()
-        
-        # 선생님 명단
-        teachers = db.query(User).filter(User.is_active == True).all()
-        teacher_names = [teacher.name for teacher in teachers]
+        # 선생님 명단 (is_active가 True인 사용자)
+        teacher_names = [name for (name,) in db.query(User.name).filter(User.is_active == True).all()]
         
         # 2025년도 반 정보
-        classes = db.query(Class).filter(Class.academic_year == 2025).all()
-        class_info = [f"{cls.grade}학년 {cls.class_num}반" for cls in classes]
+        classes = db.query(Class.grade, Class.class_num).filter(Class.academic_year == 2025).all()
+        class_info = [f"{grade}학년 {class_num}반" for grade, class_num in classes]
+        
+        # 2025년도 학생 명단 (후속 질문에서 재사용할 학생/반 ID 포함)
+        student_rows = db.query(Student.id, Student.name, Student.class_id).filter(Student.academic_year == 2025).all()
+        student_names = [name for _, name, _ in student_rows]
+        student_ids = {name: (student_id, class_id) for student_id, name, class_id in student_rows}
         
-        # 2025년도 학생 명단
-        students = db.query(Student).filter(Student.academic_year == 2025).all()
-        student_names = [student.name for student in students]
+        # 의도 매처의 공용 학생 명단도 함께 교체 (요청마다 context['students']를 넘기면 같은 명단 객체로 인식)
+        intent_matcher.set_roster(student_names)
         
         return {
-            'total_students': total_students,
-            'total_classes': total_classes,
-            'total_teachers': total_teachers,
+            'total_students': len(student_names),
+            'total_classes': len(class_info),
+            'total_teachers': len(teacher_names),
             'teachers': teacher_names,
             'classes': class_info,
-            'students': student_names
+            'students': student_names,
+            'student_ids': student_ids
         }
     except Exception as e:
         print(f"데이터베이스 컨텍스트 수집 오류: {e}")
         return {}
 
 
-def process_chat_message(chat_request, db: Session, user_id: int = 1) -> str:
-    """챗봇 메시지 처리 메인 함수"""
-    try:
-        # 데이터베이스 컨텍스트 수집
-        context = get_database_context(db)
-        
-        # AI 모델 정보 질문 처리
-        if any(keyword in chat_request.message.lower() for keyword in ["현재 연동", "연동된 모델", "어떤 모델", "ai 모델", "모델 정보"]):
-            provider_info = ai_service.get_provider_info()
-            if provider_info['provider'] == 'OpenAI':
-                return f"현재 {provider_info['provider']}의 {provider_info['model']} 모델을 사용하고 있습니다."
-            elif provider_info['provider'] == 'Gemini':
-                return f"현재 {provider_info['provider']}의 {provider_info['model']} 모델을 사용하고 있습니다."
-            else:
-                return "현재 사용 중인 AI 모델을 확인할 수 없습니다."
+def get_database_context(db: Session) -> Dict:
+    """데이터베이스 컨텍스트 조회 (캐시된 스냅샷 사용, 만료 시에만 재수집)"""
+    return context_cache.get(db, load_database_context)
 
-        # 일정 등록 질문 처리 (가장 먼저 체크)
-        if any(keyword in chat_request.message for keyword in ["등록해줘", "등록", "추가해줘", "추가", "일정 등록", "일정 추가"]):
-            return create_event_from_natural_language(chat_request.message, user_id)
-        
-        # 일정 삭제 질문 처리
-        if any(keyword in chat_request.message for keyword in ["삭제해줘", "삭제", "취소해줘", "취소", "일정 삭제", "일정 취소"]):
-            return delete_event_from_natural_language(chat_request.message, user_id)
-        
-        # 일정 조회 질문 처리
-        if any(keyword in chat_request.message for keyword in ["오늘 일정", "오늘의 일정", "오늘 스케줄", "오늘 일정이", "오늘 일정은"]):
-            return get_today_schedule(user_id)
-        
-        # 특정 날짜 일정 조회 (내일, 모레, 글피 등)
-        if any(keyword in chat_request.message for keyword in ["내일 일정", "내일의 일정", "내일 스케줄", "내일 일정이", "내일 일정은"]):
-            return get_tomorrow_schedule(user_id)
-        
-        if any(keyword in chat_request.message for keyword in ["모레 일정", "모레의 일정", "모레 스케줄"]):
-            return get_specific_date_schedule("모레", user_id)
-        
-        if any(keyword in chat_request.message for keyword in ["글피 일정", "글피의 일정", "글피 스케줄"]):
-            return get_specific_date_schedule("글피", user_id)
-        
-        if any(keyword in chat_request.message for keyword in ["이번 주 일정", "이번주 일정", "주간 일정", "이번 주 스케줄"]):
-            return get_weekly_schedule(user_id)
+
+def resolve_followup(user_id: int, match, context: Dict) -> ChatTurnState:
+    """직전 대화 상태로 빠진 개체를 채우고 이번 턴 상태 생성
+    학생 이름 없이 출결/성적을 물으면 ("그럼 출석은?") 직전에 확인된 학생을 재사용
+    """
+    state = chat_state_store.get(user_id)
+    turn = ChatTurnState()
+
+    if state is not None and not match.students and match.has("attendance", "grade") \
+            and not match.has("attendance_lowest", "attendance_highest"):
+        last_student = state.last_student
+        if last_student:
+            turn.student_id, turn.student_name = last_student
+            turn.class_id = state.last_class_id
+            match.students = [turn.student_name]
+            return turn
+
+    if match.student:
+        resolved = context.get('student_ids', {}).get(match.student)
+        if resolved:
+            turn.student_id, turn.class_id = resolved
+            turn.student_name = match.student
+    return turn
+
+
+def matched_intents(match, names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """응답 캐시 키에 쓸 세부 의도 (names 중 매칭된 의도 전체, 처리 함수의 분기를 모두 구분)"""
+    return tuple(name for name in names if match.has(name))
+
+
+def schedule_answer(user_id: int, intent: str, date_range: Tuple[date, date], builder) -> str:
+    """일정 응답 캐시 조회 (사용자/의도/날짜 범위 단위, 일정 쓰기 시 사용자 단위로 무효화)"""
+    return answer_cache.get_or_build((DOMAIN_CALENDAR, user_id, intent) + tuple(date_range), builder)
+
+
+def student_answer(domain: str, intent: Tuple[str, ...], match, turn: ChatTurnState, builder) -> str:
+    """출결/성적 응답 캐시 조회 (학생 ID와 날짜, 명단 세대 번호 단위, 입력 시 영역 단위로 무효화)"""
+    student_key = turn.student_id if turn.student_id is not None else match.student
+    key = (domain, None, intent, student_key, date.today(), context_cache.generation)
+    return answer_cache.get_or_build(key, builder)
+
+
+# 일정 조회 영역을 나타내는 의도 (병렬 처리 계획용)
+SCHEDULE_INTENTS = ("schedule_today", "schedule_tomorrow", "schedule_day_after", "schedule_two_days_after", "schedule_week")
+
+
+def answer_schedule_query(message: str, match, user_id: int, turn: ChatTurnState) -> Optional[str]:
+    """일정 조회 질문 처리 (일정 조회가 아니면 None, 조회한 날짜 범위는 turn에 기록)"""
+    today = date.today()
+    
+    if match.has("schedule_today"):
+        turn.date_range = (today, today)
+        return schedule_answer(user_id, "schedule_today", turn.date_range, lambda: get_today_schedule(user_id))
+    
+    # 특정 날짜 일정 조회 (내일, 모레, 글피 등)
+    if match.has("schedule_tomorrow"):
+        turn.date_range = (today + timedelta(days=1), today + timedelta(days=1))
+        return schedule_answer(user_id, "schedule_tomorrow", turn.date_range, lambda: get_tomorrow_schedule(user_id))
+    
+    if match.has("schedule_day_after"):
+        target = today + timedelta(days=2)
+        turn.date_range = (target, target)
+        return schedule_answer(user_id, "schedule_day_after", turn.date_range, lambda: get_specific_date_schedule(target, user_id))
+    
+    if match.has("schedule_two_days_after"):
+        target = today + timedelta(days=3)
+        turn.date_range = (target, target)
+        return schedule_answer(user_id, "schedule_two_days_after", turn.date_range, lambda: get_specific_date_schedule(target, user_id))
+    
+    if match.has("schedule_week"):
+        week_start = today - timedelta(days=today.weekday())
+        turn.date_range = (week_start, week_start + timedelta(days=6))
+        return schedule_answer(user_id, "schedule_week", turn.date_range, lambda: get_weekly_schedule(user_id))
+    
+    # "그날 일정은?" 같은 후속 질문은 직전에 조회한 날짜 범위 재사용
+    if match.has("schedule") and match.has("date_followup") and not match.has("date_hint"):
+        state = chat_state_store.get(user_id)
+        date_range = state.last_date_range if state else None
+        if date_range:
+            turn.date_range = date_range
+            start, end = date_range
+            if start == end:
+                return schedule_answer(user_id, "schedule_date", date_range, lambda: get_specific_date_schedule(start, user_id))
+            return schedule_answer(user_id, "schedule_range", date_range, lambda: get_date_range_schedule(start, end, user_id))
+    
+    # 특정 날짜 일정 조회 질문 처리 (등록/삭제는 위에서 이미 처리됨)
+    if match.has("schedule") and match.has("date_hint"):
+        # 날짜 추출 ("8월 6일", "8/6", "금요일", "다음 주" 등)
+        parsed = date_parser.parse(message)
+        if parsed.invalid_date:
+            # 잘못된 날짜는 안내 응답이므로 캐시하지 않음
+            return INVALID_DATE_MESSAGE
+        if parsed.date_range:
+            turn.date_range = parsed.date_range
+            start, end = parsed.date_range
+            if start == end:
+                return schedule_answer(user_id, "schedule_date", turn.date_range, lambda: get_specific_date_schedule(start, user_id))
+            return schedule_answer(user_id, "schedule_range", turn.date_range, lambda: get_date_range_schedule(start, end, user_id))
         
-        # 특정 날짜 일정 조회 질문 처리 (등록/삭제가 아닌 경우만)
-        if any(keyword in chat_request.message for keyword in ["일정", "스케줄"]) and any(keyword in chat_request.message for keyword in ["월", "/"]):
-            # 등록/삭제 키워드가 포함되어 있지 않은지 확인
-            if not any(keyword in chat_request.message for keyword in ["등록", "추가", "삭제", "취소"]):
-                # 날짜 추출 시도
-                import re
-                
-                # "8월 6일", "8월6일", "8/6" 등의 패턴 매칭
-                date_patterns = [
-                    r'(\d+)월\s*(\d+)일',
-                    r'(\d+)/(\d+)',
-                    r'(\d+)\s+(\d+)'
-                ]
-                
-                for pattern in date_patterns:
-                    match = re.search(pattern, chat_request.message)
-                    if match:
-                        month, day = map(int, match.groups())
-                        date_str = f"{month}월 {day}일"
-                        return get_specific_date_schedule(date_str, user_id)
-                
-                # 패턴이 매칭되지 않으면 기본 응답
-                return "어떤 날짜의 일정을 알고 싶으신가요? '8월 6일' 또는 '8/6' 형식으로 입력해주세요."
-
-        # 출석 관련 질문 처리
-        if "출결" in chat_request.message or "출석" in chat_request.message:
-            return process_attendance_query(chat_request, context, db)
-
-        # 성적 관련 질문 처리
-        if "성적" in chat_request.message or "점수" in chat_request.message:
-            return process_student_grade_query(chat_request, context, db)
+        # 패턴이 매칭되지 않으면 기본 응답
+        return "어떤 날짜의 일정을 알고 싶으신가요? '8월 6일' 또는 '8/6' 형식으로 입력해주세요."
+    
+    return None
 
-        # 기본 AI 응답 (오류 처리 강화)
-        try:
-            system_prompt = f"""당신은 학교 관리 시스템의 AI 어시스턴트입니다.
 
-현재 시스템 정보:
-- 전체 학생 수: {context.get('total_students', 0)}명
-- 전체 반 수: {context.get('total_classes', 0)}개
-- 전체 선생님 수: {context.get('total_teachers', 0)}명
+def answer_attendance_query(chat_request, match, context: Dict, db: Session, turn: ChatTurnState) -> str:
+    """출석 관련 질문 처리"""
+    turn.intent = "attendance"
+    intent = matched_intents(match, ("attendance_lowest", "attendance_highest", "attendance_comparison"))
+    return student_answer(DOMAIN_ATTENDANCE, intent, match, turn,
+                          lambda: process_attendance_query(chat_request, context, db, match))
 
-선생님 명단: {', '.join(context.get('teachers', []))}
 
-반 정보:
-{chr(10).join([f"- {cls}" for cls in context.get('classes', [])])}
+def answer_grade_query(chat_request, match, context: Dict, db: Session, turn: ChatTurnState) -> str:
+    """성적 관련 질문 처리"""
+    turn.intent = "grade"
+    intent = matched_intents(match, ("grade_comparison",))
+    return student_answer(DOMAIN_GRADE, intent, match, turn,
+                          lambda: process_student_grade_query(chat_request, context, db, match))
 
-학생 명단 (일부): {', '.join(context.get('students', [])[:10])}
 
-친근하고 도움이 되는 답변을 한국어로 제공해주세요."""
+def plan_chat_message(match) -> List[str]:
+    """메시지에 포함된 조회 영역을 메시지 등장 순서대로 반환 ("김철수 성적이랑 출석 알려줘" → grade, attendance)"""
+    positions = {}
+    schedule_positions = [match.intents[name] for name in SCHEDULE_INTENTS if name in match.intents]
+    if match.has("schedule") and match.has("date_hint", "date_followup"):
+        schedule_positions.append(match.intents["schedule"])
+    if schedule_positions:
+        positions["schedule"] = min(schedule_positions)
+    for domain in ("attendance", "grade"):
+        if domain in match.intents:
+            positions[domain] = match.intents[domain]
+    return sorted(positions, key=positions.get)
 
-            return ai_service.get_response(system_prompt, chat_request.message)
-        except Exception as ai_error:
-            print(f"AI 응답 생성 오류: {ai_error}")
-            return "죄송합니다. AI 응답 생성 중 오류가 발생했습니다."
+
+def run_planned_queries(plan: List[str], chat_request, match, context: Dict, user_id: int, turn: ChatTurnState) -> Optional[str]:
+    """여러 조회 영역을 스레드 풀에서 병렬 처리하고 메시지 순서대로 응답 병합
+    (요청 세션과 turn은 스레드 간 공유하지 않도록 작업마다 자체 세션과 turn 복사본을 사용하고,
+    작업이 끝난 뒤 메시지 순서대로 turn에 병합)
+    """
+    task_turns = [turn.copy() for _ in plan]
+    
+    def run_with_session(handler, task_turn):
+        def call():
+            db = SessionLocal()
+            try:
+                return handler(chat_request, match, context, db, task_turn)
+            except Exception as e:
+                print(f"병렬 조회 처리 오류: {e}")
+                return "죄송합니다. 조회 중 오류가 발생했습니다."
+            finally:
+                db.close()
+        return call
+    
+    calls = []
+    for domain, task_turn in zip(plan, task_turns):
+        if domain == "schedule":
+            calls.append(lambda task_turn=task_turn: answer_schedule_query(chat_request.message, match, user_id, task_turn))
+        elif domain == "attendance":
+            calls.append(run_with_session(answer_attendance_query, task_turn))
+        else:
+            calls.append(run_with_session(answer_grade_query, task_turn))
+    
+    results = run_parallel(calls)
+    for task_turn in task_turns:
+        turn.merge(task_turn)
+    answers = [answer for answer in results if answer]
+    return "\n\n".join(answers) if answers else None
+
+
+def dispatch_chat_message(chat_request, match, context: Dict, db: Session, user_id: int, turn: ChatTurnState, use_tools: bool = False) -> Tuple[Optional[str], Optional[str]]:
+    """매칭된 의도별 처리 (일정 조회 시 날짜 범위는 turn에 기록)
+    use_tools=True이면 AI 응답이 필요할 때 정적 컨텍스트 프롬프트를 만들지 않고 (None, None) 반환
+    """
+    message = chat_request.message
+    
+    # AI 모델 정보 질문 처리
+    if match.has("model_info"):
+        provider_info = ai_service.get_provider_info()
+        if provider_info['provider'] == 'OpenAI':
+            return f"현재 {provider_info['provider']}의 {provider_info['model']} 모델을 사용하고 있습니다.", None
+        elif provider_info['provider'] in ('Gemini', 'Fake'):
+            return f"현재 {provider_info['provider']}의 {provider_info['model']} 모델을 사용하고 있습니다.", None
+        else:
+            return "현재 사용 중인 AI 모델을 확인할 수 없습니다.", None
+
+    # "일정 등록은 어떻게 해?"처럼 사용법을 묻는 질문은 실제 등록/삭제로 처리되지 않도록 먼저 FAQ로 답변
+    # (어떻게/방법/뭐야 같은 표현이 있을 때만 확인하므로 "일정 추가해줘" 같은 명령은 아래 처리기로 전달)
+    faq = faq_router.match(message, require_cue=True)
+    if faq:
+        return faq.answer, None
+
+    # 일정 등록 질문 처리
+    if match.has("event_create"):
+        return create_event_from_natural_language(message, user_id), None
+    
+    # 일정 삭제 질문 처리
+    if match.has("event_delete"):
+        return delete_event_from_natural_language(message, user_id), None
+    
+    # 학생 종합 요약은 일괄 생성된 요약이 있으면 바로 사용 (없으면 아래 성적/출결/AI 응답으로 처리)
+    if STUDENT_SUMMARY_ENABLED and match.has("student_summary") and match.student:
+        summary = find_student_summary(db, match.student)
+        if summary:
+            return format_student_summary(match.student, summary), None
+    
+    # 여러 조회 영역이 함께 있으면 병렬 처리 후 병합 (지연 = 가장 느린 조회)
+    plan = plan_chat_message(match)
+    if len(plan) > 1:
+        answer = run_planned_queries(plan, chat_request, match, context, user_id, turn)
+        if answer:
+            return answer, None
+    
+    # 일정 조회 질문 처리
+    answer = answer_schedule_query(message, match, user_id, turn)
+    if answer is not None:
+        return answer, None
+
+    # 출석 관련 질문 처리
+    if match.has("attendance"):
+        return answer_attendance_query(chat_request, match, context, db, turn), None
+
+    # 성적 관련 질문 처리
+    if match.has("grade"):
+        return answer_grade_query(chat_request, match, context, db, turn), None
+
+    # 처리기에 해당하지 않는 기능 안내 질문 ("뭘 할 수 있어?", "도움말")은 AI 호출 전에 FAQ로 답변
+    faq = faq_router.match(message)
+    if faq:
+        return faq.answer, None
+
+    # 도구 호출 모드는 모델이 필요한 데이터만 함수로 조회하므로 정적 컨텍스트를 만들지 않음
+    if use_tools:
+        return None, None
+
+    # 기본 AI 응답용 시스템 프롬프트
+    return None, prompt_builder.build_system_prompt(db)
+
+
+def route_chat_message(chat_request, db: Session, user_id: int = 1, use_tools: bool = False) -> Tuple[Optional[str], Optional[str]]:
+    """챗봇 메시지 분기 처리
+    (결정적 응답, None) 또는 AI 응답이 필요한 경우 (None, 시스템 프롬프트) 반환
+    (use_tools=True이면 AI 응답이 필요한 경우 (None, None) 반환)
+    """
+    try:
+        # 같은 학생/반/과목/시험 조회는 이번 요청 안에서 한 번만 수행
+        with entity_memo.scope():
+            # 데이터베이스 컨텍스트 수집
+            context = get_database_context(db)
+            
+            # 의도/학생 이름을 한 번에 매칭
+            message = chat_request.message
+            match = intent_matcher.match(message, context.get('students', []))
+            
+            # 후속 질문 처리를 위해 직전 대화 상태 반영 (이번 턴의 개체는 응답 후 기록)
+            turn = resolve_followup(user_id, match, context)
+            try:
+                return dispatch_chat_message(chat_request, match, context, db, user_id, turn, use_tools)
+            finally:
+                chat_state_store.record(user_id, turn)
         
     except Exception as e:
         print(f"채팅 메시지 처리 오류: {e}")
-        return "죄송합니다. 메시지 처리 중 오류가 발생했습니다." 
\ No newline at end of file
+        return "죄송합니다. 메시지 처리 중 오류가 발생했습니다.", None
+
+
+def remember_turn(user_id: int, user_message: str, answer: str):
+    """대화 기록에 질문/답변 추가 (요약은 응답 반환 후 백그라운드 작업에서 생성)"""
+    if CHAT_HISTORY_ENABLED and answer:
+        chat_history.append_turn(user_id, user_message, answer)
+
+
+def with_history(system_prompt: str, user_id: int) -> str:
+    """시스템 프롬프트에 이전 대화 요약과 최근 대화 추가"""
+    if not CHAT_HISTORY_ENABLED:
+        return system_prompt
+    return chat_history.build_system_prompt(system_prompt, user_id)
+
+
+def process_chat_message(chat_request, db: Session, user_id: int = 1) -> str:
+    """챗봇 메시지 처리 메인 함수"""
+    answer, system_prompt = route_chat_message(chat_request, db, user_id)
+    if answer is None:
+        # 기본 AI 응답 (오류 처리 강화)
+        try:
+            answer = ai_service.get_response(with_history(system_prompt, user_id), chat_request.message)
+        except Exception as ai_error:
+            print(f"AI 응답 생성 오류: {ai_error}")
+            return "죄송합니다. AI 응답 생성 중 오류가 발생했습니다."
+    
+    remember_turn(user_id, chat_request.message, answer)
+    return answer
+
+
+async def process_chat_message_async(chat_request, db: Session, user_id: int = 1) -> str:
+    """챗봇 메시지 비동기 처리
+    DB 분기 처리는 DB 스레드 풀에서, AI 응답은 비동기 클라이언트로 생성해 DB 작업과 LLM 대기를 분리
+    """
+    # 분기 처리와 도구 호출이 같은 요청 범위 메모를 공유 (run_db가 컨텍스트를 복사해 전달)
+    with entity_memo.scope():
+        answer, system_prompt = await run_db(route_chat_message, chat_request, db, user_id, AI_TOOLS_ENABLED)
+        if answer is None:
+            if AI_TOOLS_ENABLED:
+                # 도구 호출 모드: 정적 컨텍스트 대신 모델이 필요한 데이터만 함수로 조회
+                toolkit = ChatToolkit(db, user_id)
+                answer = await ai_service.get_response_with_tools_async(
+                    with_history(build_tool_system_prompt(), user_id), chat_request.message, toolkit
+                )
+            else:
+                answer = await ai_service.get_response_async(with_history(system_prompt, user_id), chat_request.message)
+    
+    remember_turn(user_id, chat_request.message, answer)
+    return answer
+
+
+def stream_chat_message(chat_request, db: Session, user_id: int = 1) -> Iterator[Tuple[str, str]]:
+    """챗봇 메시지 스트리밍 처리
+    결정적 응답은 ("message", 전체 응답) 한 번, AI 응답은 ("delta", 토큰 조각) 여러 번 반환
+    """
+    answer, system_prompt = route_chat_message(chat_request, db, user_id)
+    if answer is not None:
+        remember_turn(user_id, chat_request.message, answer)
+        yield "message", answer
+        return
+    
+    chunks = []
+    for chunk in ai_service.stream_response(with_history(system_prompt, user_id), chat_request.message):
+        chunks.append(chunk)
+        yield "delta", chunk
+    remember_turn(user_id, chat_request.message, "".join(chunks))
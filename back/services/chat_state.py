@@ -0,0 +1,143 @@
+"""
+사용자별 대화 상태 저장소
+최근 대화에서 확인된 학생, 반, 날짜 범위를 사용자별 고정 크기 링 버퍼에 보관해
+"그럼 출석은?" 같은 후속 질문에서 다시 조회하지 않고 재사용하는 기능
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import date
+from typing import Deque, Dict, Optional, Tuple
+from config import CHAT_STATE_MAX_USERS, CHAT_STATE_IDLE_TTL, CHAT_STATE_TURNS
+
+
+class ChatTurnState:
+    """한 턴에서 확인된 의도와 개체 (학생/반 ID, 날짜 범위)"""
+
+    __slots__ = ("intent", "student_id", "student_name", "class_id", "date_range")
+
+    def __init__(
+        self,
+        intent: Optional[str] = None,
+        student_id: Optional[int] = None,
+        student_name: Optional[str] = None,
+        class_id: Optional[int] = None,
+        date_range: Optional[Tuple[date, date]] = None
+    ):
+        self.intent = intent
+        self.student_id = student_id
+        self.student_name = student_name
+        self.class_id = class_id
+        self.date_range = date_range
+
+    def copy(self) -> "ChatTurnState":
+        """같은 값을 가진 새 턴 (병렬 작업마다 따로 기록하기 위해 사용)"""
+        return ChatTurnState(*(getattr(self, name) for name in self.__slots__))
+
+    def merge(self, other: "ChatTurnState"):
+        """다른 턴에서 값이 있는 항목만 덮어쓰기 (순서대로 병합하면 나중 작업의 값이 남음)"""
+        for name in self.__slots__:
+            value = getattr(other, name)
+            if value is not None:
+                setattr(self, name, value)
+
+
+class UserChatState:
+    """사용자 한 명의 최근 턴 링 버퍼"""
+
+    def __init__(self, max_turns: int):
+        self.turns: Deque[ChatTurnState] = deque(maxlen=max_turns)
+        self.touched_at = time.monotonic()
+
+    def _latest(self, attribute: str):
+        for turn in reversed(self.turns):
+            value = getattr(turn, attribute)
+            if value is not None:
+                return turn
+        return None
+
+    @property
+    def last_student(self) -> Optional[Tuple[int, str]]:
+        """가장 최근에 확인된 학생 (ID, 이름)"""
+        turn = self._latest("student_id")
+        return (turn.student_id, turn.student_name) if turn else None
+
+    @property
+    def last_class_id(self) -> Optional[int]:
+        turn = self._latest("class_id")
+        return turn.class_id if turn else None
+
+    @property
+    def last_date_range(self) -> Optional[Tuple[date, date]]:
+        turn = self._latest("date_range")
+        return turn.date_range if turn else None
+
+    @property
+    def last_intent(self) -> Optional[str]:
+        turn = self._latest("intent")
+        return turn.intent if turn else None
+
+
+class ChatStateStore:
+    """user_id별 대화 상태 저장소 (최대 사용자 수 초과 시 LRU 제거, 유휴 TTL 만료)"""
+
+    def __init__(self, max_users: int = CHAT_STATE_MAX_USERS, idle_ttl: int = CHAT_STATE_IDLE_TTL, max_turns: int = CHAT_STATE_TURNS):
+        self.max_users = max_users
+        self.idle_ttl = idle_ttl
+        self.max_turns = max_turns
+        self._states: "OrderedDict[int, UserChatState]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, user_id: int) -> Optional[UserChatState]:
+        """사용자 상태 조회 (유휴 시간이 TTL을 넘었으면 제거 후 None)"""
+        with self._lock:
+            state = self._states.get(user_id)
+            if state is None:
+                return None
+            if time.monotonic() - state.touched_at > self.idle_ttl:
+                del self._states[user_id]
+                self.expirations += 1
+                return None
+            self._states.move_to_end(user_id)
+            return state
+
+    def record(self, user_id: int, turn: ChatTurnState):
+        """이번 턴에서 확인된 개체 기록 (확인된 개체가 없는 턴은 기록하지 않음)"""
+        if turn.student_id is None and turn.class_id is None and turn.date_range is None:
+            return
+        with self._lock:
+            state = self._states.get(user_id)
+            if state is None:
+                state = self._states[user_id] = UserChatState(self.max_turns)
+            state.turns.append(turn)
+            state.touched_at = time.monotonic()
+            self._states.move_to_end(user_id)
+            while len(self._states) > self.max_users:
+                self._states.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self, user_id: Optional[int] = None):
+        """사용자 상태 삭제 (user_id 미지정 시 전체)"""
+        with self._lock:
+            if user_id is None:
+                self._states.clear()
+            else:
+                self._states.pop(user_id, None)
+
+    def get_stats(self) -> Dict:
+        """저장소 통계 반환"""
+        return {
+            "users": len(self._states),
+            "max_users": self.max_users,
+            "idle_ttl": self.idle_ttl,
+            "max_turns": self.max_turns,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+
+
+# 전역 대화 상태 저장소 인스턴스
+chat_state_store = ChatStateStore()
@@ -0,0 +1,245 @@
+"""
+챗봇 도구 호출(Function Calling) 모듈
+LLM이 필요한 데이터만 직접 조회하도록 성적/출결/일정 읽기 전용 함수를 정의하고
+OpenAI/Gemini 도구 스펙 변환과 도구 실행을 담당하는 기능
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Union
+from sqlalchemy.orm import Session
+from config import AI_TOOL_MAX_ROWS
+from db_executor import run_db
+from services.grade_service import get_student_grades, get_class_grades_summary, get_top_students, get_bottom_students
+from services.attendance_service import get_student_attendance_by_name, get_class_attendance_summary
+from services.calendar_service import CalendarService
+from services.prompt_builder import compose_system_prompt
+
+CURRENT_ACADEMIC_YEAR = 2025
+
+
+class ChatTool:
+    """읽기 전용 도구 정의 (이름, 설명, JSON 스키마 파라미터, 실행 함수)"""
+
+    def __init__(self, name: str, description: str, parameters: Dict, handler: Callable[..., Any]):
+        self.name = name
+        self.description = description
+        self.parameters = parameters
+        self.handler = handler
+
+
+def _limit_rows(value: Any, max_rows: int = AI_TOOL_MAX_ROWS) -> Any:
+    """목록은 최대 행 수까지만 남겨 프롬프트에 들어가는 데이터 크기 제한"""
+    if isinstance(value, list):
+        return [_limit_rows(item, max_rows) for item in value[:max_rows]]
+    if isinstance(value, dict):
+        return {key: _limit_rows(item, max_rows) for key, item in value.items()}
+    return value
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _student_grades(db: Session, user_id: int, student_name: str, academic_year: int = CURRENT_ACADEMIC_YEAR):
+    return get_student_grades(db, student_name, int(academic_year))
+
+
+def _class_grades(db: Session, user_id: int, grade: int, class_num: int, academic_year: int = CURRENT_ACADEMIC_YEAR):
+    # Gemini는 정수 인자도 실수로 전달하므로 정수로 변환
+    grade, class_num, academic_year = int(grade), int(class_num), int(academic_year)
+    return get_class_grades_summary(db, grade, class_num, academic_year)
+
+
+def _ranked_students(db: Session, user_id: int, order: str = "top", limit: int = 5, grade: Optional[int] = None):
+    # Gemini는 정수 인자도 실수로 전달하므로 정수로 변환
+    limit = max(1, min(int(limit), AI_TOOL_MAX_ROWS))
+    grade = int(grade) if grade else None
+    if order == "bottom":
+        return get_bottom_students(db, limit, grade)
+    return get_top_students(db, limit, grade)
+
+
+def _student_attendance(db: Session, user_id: int, student_name: str):
+    return get_student_attendance_by_name(student_name)
+
+
+def _class_attendance(db: Session, user_id: int, grade: int, class_num: int, year: int = CURRENT_ACADEMIC_YEAR):
+    grade, class_num, year = int(grade), int(class_num), int(year)
+    return get_class_attendance_summary(grade, class_num, year)
+
+
+def _calendar_events(db: Session, user_id: int, start_date: str, end_date: Optional[str] = None):
+    start = _parse_date(start_date)
+    end = _parse_date(end_date) or start
+    events = CalendarService(db).get_events_by_user(user_id, start, end)
+    return [
+        {
+            "title": event.title,
+            "start_date": event.start_date.isoformat(),
+            "end_date": event.end_date.isoformat(),
+            "start_time": event.start_time.strftime("%H:%M") if event.start_time else None,
+            "event_type": event.event_type,
+            "location": event.location
+        } for event in events
+    ]
+
+
+CHAT_TOOLS: List[ChatTool] = [
+    ChatTool(
+        "get_student_grades",
+        "학생 이름으로 과목별/시험별 성적을 조회합니다.",
+        {
+            "type": "object",
+            "properties": {
+                "student_name": {"type": "string", "description": "학생 이름"},
+                "academic_year": {"type": "integer", "description": "학년도 (기본값: 현재 학년도)"}
+            },
+            "required": ["student_name"]
+        },
+        _student_grades
+    ),
+    ChatTool(
+        "get_class_grades_summary",
+        "특정 학년/반 학생들의 평균 성적을 조회합니다.",
+        {
+            "type": "object",
+            "properties": {
+                "grade": {"type": "integer", "description": "학년 (1~3)"},
+                "class_num": {"type": "integer", "description": "반 번호"},
+                "academic_year": {"type": "integer", "description": "학년도 (기본값: 현재 학년도)"}
+            },
+            "required": ["grade", "class_num"]
+        },
+        _class_grades
+    ),
+    ChatTool(
+        "get_ranked_students",
+        "평균 성적 기준 상위 또는 하위 학생 목록을 조회합니다.",
+        {
+            "type": "object",
+            "properties": {
+                "order": {"type": "string", "enum": ["top", "bottom"], "description": "top: 상위, bottom: 하위"},
+                "limit": {"type": "integer", "description": "조회할 학생 수"},
+                "grade": {"type": "integer", "description": "학년 필터 (선택)"}
+            },
+            "required": ["order"]
+        },
+        _ranked_students
+    ),
+    ChatTool(
+        "get_student_attendance",
+        "학생 이름으로 연도별/월별 출결 통계와 최근 출결 기록을 조회합니다.",
+        {
+            "type": "object",
+            "properties": {
+                "student_name": {"type": "string", "description": "학생 이름"}
+            },
+            "required": ["student_name"]
+        },
+        _student_attendance
+    ),
+    ChatTool(
+        "get_class_attendance_summary",
+        "특정 학년/반의 출석률 통계를 조회합니다.",
+        {
+            "type": "object",
+            "properties": {
+                "grade": {"type": "integer", "description": "학년 (1~3)"},
+                "class_num": {"type": "integer", "description": "반 번호"},
+                "year": {"type": "integer", "description": "연도 (기본값: 현재 학년도)"}
+            },
+            "required": ["grade", "class_num"]
+        },
+        _class_attendance
+    ),
+    ChatTool(
+        "get_calendar_events",
+        "사용자의 일정을 기간으로 조회합니다. 날짜는 YYYY-MM-DD 형식입니다.",
+        {
+            "type": "object",
+            "properties": {
+                "start_date": {"type": "string", "description": "시작 날짜 (YYYY-MM-DD)"},
+                "end_date": {"type": "string", "description": "종료 날짜 (YYYY-MM-DD, 생략 시 시작 날짜와 동일)"}
+            },
+            "required": ["start_date"]
+        },
+        _calendar_events
+    ),
+]
+
+
+# 도구 호출 모드 고정 지시문 (프롬프트 접두사 캐시용, 날짜 등 변하는 값은 뒤에 추가)
+TOOL_SYSTEM_PROMPT = (
+    "당신은 학교 관리 시스템의 AI 어시스턴트입니다.\n"
+    "성적, 출결, 일정에 관한 질문은 반드시 제공된 함수로 필요한 데이터만 조회한 뒤 그 결과에 근거해 답변하세요.\n"
+    "조회 결과가 없으면 추측하지 말고 데이터가 없다고 답변하세요.\n"
+    "친근하고 도움이 되는 답변을 한국어로 제공해주세요."
+)
+
+
+def build_tool_system_prompt() -> str:
+    """도구 호출 모드용 시스템 프롬프트 (데이터는 넣지 않고 조회 방법만 안내)"""
+    today = date.today()
+    return compose_system_prompt(
+        TOOL_SYSTEM_PROMPT,
+        f"오늘은 {today.isoformat()}이고, 현재 학년도는 {CURRENT_ACADEMIC_YEAR}년입니다."
+    )
+
+
+class ChatToolkit:
+    """요청 하나에 묶인 도구 실행기 (DB 세션과 사용자 ID를 바인딩, 호출 기록 유지)"""
+
+    def __init__(self, db: Session, user_id: int, tools: List[ChatTool] = CHAT_TOOLS):
+        self.db = db
+        self.user_id = user_id
+        self.tools = {tool.name: tool for tool in tools}
+        self.calls: List[str] = []
+
+    def openai_specs(self) -> List[Dict]:
+        """OpenAI tools 파라미터 형식"""
+        return [
+            {
+                "type": "function",
+                "function": {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": tool.parameters
+                }
+            } for tool in self.tools.values()
+        ]
+
+    def gemini_specs(self) -> List[Dict]:
+        """Gemini tools 파라미터 형식"""
+        return [{
+            "function_declarations": [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": tool.parameters
+                } for tool in self.tools.values()
+            ]
+        }]
+
+    def execute(self, name: str, arguments: Union[str, Dict, None]) -> str:
+        """도구 실행 후 결과를 JSON 문자열로 반환 (오류도 모델이 읽을 수 있게 JSON으로 전달)"""
+        self.calls.append(name)
+        tool = self.tools.get(name)
+        if tool is None:
+            return json.dumps({"error": f"알 수 없는 함수입니다: {name}"}, ensure_ascii=False)
+        try:
+            if isinstance(arguments, str):
+                arguments = json.loads(arguments) if arguments else {}
+            result = tool.handler(self.db, self.user_id, **dict(arguments or {}))
+        except Exception as e:
+            print(f"챗봇 도구 실행 오류 ({name}): {e}")
+            return json.dumps({"error": str(e)}, ensure_ascii=False)
+        if result is None or result == []:
+            return json.dumps({"result": None, "message": "조회 결과가 없습니다."}, ensure_ascii=False)
+        return json.dumps({"result": _limit_rows(result)}, ensure_ascii=False, default=str)
+
+    async def execute_async(self, name: str, arguments: Union[str, Dict, None]) -> str:
+        """DB 스레드 풀에서 도구 실행 (이벤트 루프를 막지 않음)"""
+        return await run_db(self.execute, name, arguments)
@@ -0,0 +1,84 @@
+"""
+데이터베이스 컨텍스트 스냅샷 캐시
+챗봇이 매 요청마다 사용하는 학생/반/선생님 명단을 프로세스 단위로 캐시하는 기능
+(TTL 만료 시 지연 재생성, 학생/반/사용자 쓰기 시 무효화)
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+from config import CONTEXT_CACHE_TTL
+
+
+class DatabaseContextCache:
+    """TTL 기반 컨텍스트 스냅샷 캐시"""
+
+    def __init__(self, ttl_seconds: int = CONTEXT_CACHE_TTL):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()  # 스냅샷/세대 번호 읽기·쓰기용 (조회 중에는 잡지 않음)
+        self._build_lock = threading.Lock()  # 동시에 만료를 본 요청들이 재생성을 한 번만 하도록 묶음
+        self._snapshot: Optional[Dict] = None
+        self._built_at = 0.0
+        self._generation = 0  # 무효화될 때마다 증가
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> int:
+        """무효화 세대 번호 (이 캐시에 의존하는 다른 캐시의 무효화 판단용)"""
+        return self._generation
+
+    def _is_fresh(self, snapshot: Optional[Dict], built_at: float) -> bool:
+        return snapshot is not None and time.monotonic() - built_at < self.ttl_seconds
+
+    def get(self, db, loader: Callable) -> Dict:
+        """스냅샷 반환 (없거나 만료된 경우 loader로 재생성)"""
+        # 확인과 반환 사이에 다른 스레드가 무효화해도 같은 스냅샷을 반환하도록 한 번만 읽음
+        snapshot, built_at = self._snapshot, self._built_at
+        if self._is_fresh(snapshot, built_at):
+            self.hits += 1
+            return snapshot
+
+        with self._build_lock:
+            with self._lock:
+                # 다른 스레드가 이미 재생성했는지 다시 확인
+                snapshot, built_at = self._snapshot, self._built_at
+                if self._is_fresh(snapshot, built_at):
+                    self.hits += 1
+                    return snapshot
+                self.misses += 1
+                generation = self._generation
+
+            # 명단 조회는 _lock 밖에서 실행하므로 쓰기 요청의 invalidate()는 재생성을 기다리지 않음
+            snapshot = loader(db)
+
+            with self._lock:
+                # 빈 결과(조회 오류)는 캐시하지 않고, 재생성 중 무효화된 경우에도 저장하지 않음
+                if snapshot and generation == self._generation:
+                    self._snapshot = snapshot
+                    self._built_at = time.monotonic()
+            return snapshot
+
+    def invalidate(self):
+        """스냅샷 무효화 (다음 요청에서 재생성, 진행 중인 재생성 결과는 저장되지 않음)"""
+        with self._lock:
+            self._snapshot = None
+            self._generation += 1
+
+    def get_stats(self) -> Dict:
+        """캐시 적중 통계 반환"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "ttl_seconds": self.ttl_seconds,
+            "cached": self._snapshot is not None
+        }
+
+
+# 전역 컨텍스트 캐시 인스턴스
+context_cache = DatabaseContextCache()
+
+
+def invalidate_database_context():
+    """학생/반/사용자 데이터 변경 시 호출"""
+    context_cache.invalidate()
@@ -0,0 +1,209 @@
+"""
+자연어 날짜/시간 파서
+캘린더 챗봇 메시지에서 날짜 범위, 시간 범위, 일정 제목(날짜/시간/명령어를 뺀 나머지)을
+미리 컴파일한 정규식 하나로 한 번만 훑어 추출하는 기능
+(오늘/내일/모레/글피, 요일, "이번 주"/"다음 주", "8월 6일", "8/6", "2025-08-06", "오후 3시 반", "15:30" 지원)
+"""
+
+import re
+from datetime import date, time, timedelta
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# 명령 종류 (제목에서 함께 제거할 명령어)
+COMMAND_CREATE = "create"
+COMMAND_DELETE = "delete"
+
+RELATIVE_DAYS = {"오늘": 0, "내일": 1, "모레": 2, "글피": 3}
+WEEKDAYS = {"월": 0, "화": 1, "수": 2, "목": 3, "금": 4, "토": 5, "일": 6}
+WEEK_OFFSETS = {"지난": -1, "저번": -1, "이번": 0, "다음": 1, "다다음": 2}
+PM_WORDS = ("오후", "저녁", "밤")
+
+# 날짜/시간 바로 뒤에 붙는 조사와 범위 구분자 ("내일에", "3시부터", "6일~")
+_SUFFIX = r"(?:에는|에서|에|의|부터|까지)?(?:\s*[~\-])?"
+_WEEK = r"(?P<{name}>지난|저번|이번|다음|다다음)\s*주"
+
+_TOKEN_PATTERNS = [
+    # 2025년 8월 6일, 8월 6일
+    r"(?P<ymd>(?:(?P<year>\d{4})\s*년\s*)?(?P<month>\d{1,2})\s*월\s*(?P<day>\d{1,2})\s*일)",
+    # 2025-08-06, 2025.8.6, 2025/8/6
+    r"(?P<iso>(?<!\d)(?P<iso_year>\d{4})[./-](?P<iso_month>\d{1,2})[./-](?P<iso_day>\d{1,2})(?!\d))",
+    # 8/6
+    r"(?P<slash>(?<![\d/])(?P<slash_month>\d{1,2})/(?P<slash_day>\d{1,2})(?![\d/]))",
+    # 내일모레 = 모레
+    r"(?P<relative>내일\s*모레|오늘|내일|모레|글피)",
+    # (다음 주) 금요일
+    r"(?P<weekday_token>(?:" + _WEEK.format(name="weekday_week") + r"\s*)?(?P<weekday>[월화수목금토일])요일)",
+    # 다음 주 (요일 없이 주 단위)
+    r"(?P<week_token>" + _WEEK.format(name="week") + r")",
+    # 15:30
+    r"(?P<clock>(?:(?P<clock_meridiem>오전|오후|아침|저녁|밤)\s*)?(?<!\d)(?P<clock_hour>\d{1,2}):(?P<clock_minute>\d{2})(?!\d))",
+    # 오후 3시 30분, 3시 반, 10시 ("2시간", "시험"은 제외)
+    r"(?P<hour_token>(?:(?P<meridiem>오전|오후|아침|저녁|밤)\s*)?(?<!\d)(?P<hour>\d{1,2})\s*시(?!간|험)"
+    r"(?:\s*(?P<minute>\d{1,2})\s*분|\s*(?P<half>반))?)",
+]
+
+# 제목에서 제거할 단어 (일정 자체를 가리키는 말, 명령어)
+_SCHEDULE_WORDS = r"(?P<noise>(?:일정|스케줄)(?:을|를|이|은|는)?(?=\s|$)"
+_COMMAND_WORDS = {
+    None: "",
+    COMMAND_CREATE: r"|(?:등록|추가)(?:해\s*주세요|해\s*줘|해|하기|할래)?",
+    COMMAND_DELETE: r"|(?:삭제|취소)(?:해\s*주세요|해\s*줘|해|하기|할래)?|지워\s*(?:주세요|줘)?",
+}
+
+
+# 토큰이 시작될 수 있는 글자 (대부분의 위치를 대안별 시도 없이 바로 건너뛰기 위한 전방 탐색)
+_TOKEN_START = r"(?=[\d오내모글월화수목금토일지저이다아밤스등추삭취])"
+
+
+def _compile(command: Optional[str]) -> "re.Pattern":
+    tokens = [pattern + _SUFFIX for pattern in _TOKEN_PATTERNS]
+    tokens.append(_SCHEDULE_WORDS + _COMMAND_WORDS[command] + ")")
+    return re.compile(_TOKEN_START + "(?:" + "|".join(tokens) + ")")
+
+
+# 명령 종류별로 모듈 로드 시 한 번만 컴파일
+_PATTERNS: Dict[Optional[str], "re.Pattern"] = {command: _compile(command) for command in _COMMAND_WORDS}
+_SPACES = re.compile(r"\s+")
+
+
+class ParsedDateTime(NamedTuple):
+    """파싱 결과"""
+    date_range: Optional[Tuple[date, date]]  # 날짜가 없으면 None
+    time_range: Optional[Tuple[time, Optional[time]]]  # (시작, 종료), 종료 시간이 없으면 None
+    title: str  # 날짜/시간/명령어를 뺀 나머지
+    week_range: bool = False  # 요일 없이 "다음 주"처럼 주 단위로만 지정된 경우
+    invalid_date: bool = False  # "2월 30일"처럼 존재하지 않는 날짜가 있었던 경우
+
+
+def _nearest_date(month: int, day: int, today: date) -> Optional[date]:
+    """연도 없는 월/일은 오늘과 가장 가까운 해로 해석 (12월에 말한 "1월 5일"은 다음 해)"""
+    candidates = []
+    for year in (today.year - 1, today.year, today.year + 1):
+        try:
+            candidates.append(date(year, month, day))
+        except ValueError:
+            continue
+    if not candidates:
+        return None
+    return min(candidates, key=lambda candidate: abs((candidate - today).days))
+
+
+def _explicit_date(year: int, month: int, day: int) -> Optional[date]:
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _week_start(today: date, offset_word: Optional[str]) -> date:
+    return today - timedelta(days=today.weekday()) + timedelta(weeks=WEEK_OFFSETS.get(offset_word, 0))
+
+
+def _weekday_date(weekday: str, week_word: Optional[str], today: date) -> date:
+    """요일 날짜 ("다음 주 금요일"은 다음 주 월요일 기준, 주 지정이 없으면 오늘 이후 가장 가까운 요일)"""
+    index = WEEKDAYS[weekday]
+    if week_word:
+        return _week_start(today, week_word) + timedelta(days=index)
+    return today + timedelta(days=(index - today.weekday()) % 7)
+
+
+def _clock(hour: int, minute: int, meridiem: Optional[str]) -> Optional[time]:
+    if meridiem in PM_WORDS and hour < 12:
+        hour += 12
+    elif meridiem in ("오전", "아침") and hour == 12:
+        hour = 0
+    if hour > 23 or minute > 59:
+        return None
+    return time(hour, minute)
+
+
+def _clean_title(fragments: List[str]) -> str:
+    title = _SPACES.sub(" ", " ".join(fragments)).strip(" ,.?!~")
+    # 명령어 앞 목적격 조사 제거 ("회의를 등록해줘" → "회의", "가을"처럼 두 글자 단어는 유지)
+    if title.endswith("를") or (title.endswith("을") and len(title.split(" ")[-1]) > 2):
+        title = title[:-1].rstrip()
+    return title
+
+
+class DateParser:
+    """캘린더 메시지 파서 (명령 종류별로 미리 컴파일한 정규식으로 한 번에 훑음)"""
+
+    def parse(self, message: str, today: Optional[date] = None, command: Optional[str] = None) -> ParsedDateTime:
+        """날짜 범위, 시간 범위, 제목 추출 (날짜가 둘 이상이면 처음~마지막 날짜 범위)"""
+        today = today or date.today()
+        days: List[date] = []
+        week: Optional[Tuple[date, date]] = None
+        times: List[Tuple[time, bool]] = []  # (시간, 오전/오후 지정 여부)
+        fragments: List[str] = []
+        invalid_date = False
+        position = 0
+
+        for token in _PATTERNS[command].finditer(message):
+            fragments.append(message[position:token.start()])
+            position = token.end()
+            group = token.group
+            # 토큰 종류 = 마지막으로 닫힌 이름 그룹 (각 대안의 바깥 그룹)
+            kind = token.lastgroup
+
+            if kind == "ymd":
+                year = group("year")
+                day = _explicit_date(int(year), int(group("month")), int(group("day"))) if year \
+                    else _nearest_date(int(group("month")), int(group("day")), today)
+            elif kind == "relative":
+                word = group("relative")
+                day = today + timedelta(days=RELATIVE_DAYS.get(word, 2))  # 내일모레 = 모레
+            elif kind == "hour_token":
+                meridiem = group("meridiem")
+                minute = 30 if group("half") else int(group("minute") or 0)
+                parsed_time = _clock(int(group("hour")), minute, meridiem)
+                if parsed_time:
+                    times.append((parsed_time, meridiem is not None))
+                continue
+            elif kind == "weekday_token":
+                day = _weekday_date(group("weekday"), group("weekday_week"), today)
+            elif kind == "slash":
+                day = _nearest_date(int(group("slash_month")), int(group("slash_day")), today)
+            elif kind == "iso":
+                day = _explicit_date(int(group("iso_year")), int(group("iso_month")), int(group("iso_day")))
+            elif kind == "week_token":
+                start = _week_start(today, group("week"))
+                week = (start, start + timedelta(days=6))
+                continue
+            elif kind == "clock":
+                meridiem = group("clock_meridiem")
+                parsed_time = _clock(int(group("clock_hour")), int(group("clock_minute")), meridiem)
+                if parsed_time:
+                    times.append((parsed_time, meridiem is not None))
+                continue
+            else:
+                continue  # 일정/명령어
+
+            if day is None:
+                invalid_date = True
+            else:
+                days.append(day)
+        fragments.append(message[position:])
+
+        date_range = (min(days), max(days)) if days else week
+        time_range = None
+        if times:
+            start_time = times[0][0]
+            end_time = None
+            if len(times) > 1:
+                end_time, end_meridiem = times[-1]
+                # "오후 3시부터 5시까지"처럼 종료 시간에 오전/오후가 없으면 시작 시간 기준으로 해석
+                if not end_meridiem and end_time <= start_time and end_time.hour + 12 <= 23:
+                    end_time = end_time.replace(hour=end_time.hour + 12)
+            time_range = (start_time, end_time)
+
+        return ParsedDateTime(
+            date_range=date_range,
+            time_range=time_range,
+            title=_clean_title(fragments),
+            week_range=not days and week is not None,
+            invalid_date=invalid_date
+        )
+
+
+# 전역 날짜 파서 인스턴스
+date_parser = DateParser()
@@ -0,0 +1,151 @@
+"""
+요청 단위 개체 조회 메모
+한 번의 챗봇 요청 안에서 같은 학생/반/과목/시험을 여러 번 조회하지 않도록
+contextvars로 요청 범위의 조회 결과를 보관하는 기능 (요청이 끝나면 폐기)
+조회 결과는 세션에 묶이지 않는 값 객체로 보관하므로 병렬 조회 스레드의 다른 세션에서도 사용 가능
+(run_parallel 작업은 같은 메모를 공유하므로 메모 접근은 잠금으로 보호)
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, List, NamedTuple, Optional
+from sqlalchemy.orm import Session
+from models import Student, Class, Subject, Exam
+
+
+class ClassRef(NamedTuple):
+    """반 조회 결과"""
+    id: int
+    academic_year: int
+    grade: int
+    class_num: int
+    teacher_id: Optional[int]
+
+
+class StudentRef(NamedTuple):
+    """학생 조회 결과 (반 정보 포함)"""
+    id: int
+    name: str
+    class_id: Optional[int]
+    academic_year: int
+    class_info: Optional[ClassRef]
+
+
+class NamedRef(NamedTuple):
+    """과목/시험 조회 결과"""
+    id: int
+    name: str
+
+
+class EntityMemo:
+    """요청 범위 조회 메모 (범위 밖에서는 메모 없이 매번 조회)"""
+
+    def __init__(self):
+        self._current: ContextVar[Optional[Dict]] = ContextVar("entity_memo", default=None)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @contextmanager
+    def scope(self):
+        """요청 범위 시작 (이미 범위 안이면 기존 메모 재사용)"""
+        if self._current.get() is not None:
+            yield
+            return
+        token = self._current.set({})
+        try:
+            yield
+        finally:
+            self._current.reset(token)
+
+    def get_or_load(self, key: tuple, loader: Callable):
+        """메모된 값 반환, 없으면 loader로 조회 후 메모 (없는 개체(None)도 메모)
+        조회는 잠금 밖에서 하므로 병렬 작업이 같은 개체를 동시에 처음 조회하면 각자 조회하고 먼저 저장된 값을 사용
+        """
+        memo = self._current.get()
+        if memo is None:
+            return loader()
+        with self._lock:
+            if key in memo:
+                self.hits += 1
+                return memo[key]
+            self.misses += 1
+        value = loader()
+        with self._lock:
+            return memo.setdefault(key, value)
+
+    def get_stats(self) -> Dict:
+        """메모 적중 통계 반환"""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+# 전역 요청 범위 메모 인스턴스
+entity_memo = EntityMemo()
+
+
+def _class_ref(class_obj: Optional[Class]) -> Optional[ClassRef]:
+    if class_obj is None:
+        return None
+    return ClassRef(class_obj.id, class_obj.academic_year, class_obj.grade, class_obj.class_num, class_obj.teacher_id)
+
+
+def _student_ref(student: Student, class_obj: Optional[Class]) -> StudentRef:
+    return StudentRef(student.id, student.name, student.class_id, student.academic_year, _class_ref(class_obj))
+
+
+def _student_query(db: Session, student_name: str):
+    # 학생과 반 정보를 한 번에 조회
+    return db.query(Student, Class).outerjoin(Class, Student.class_id == Class.id).filter(Student.name == student_name)
+
+
+def find_student(db: Session, student_name: str) -> Optional[StudentRef]:
+    """학생 이름으로 학생 조회 (첫 번째 일치 항목)"""
+    def load():
+        row = _student_query(db, student_name).first()
+        return _student_ref(*row) if row else None
+    return entity_memo.get_or_load(("student", student_name), load)
+
+
+def find_students(db: Session, student_name: str) -> List[StudentRef]:
+    """학생 이름으로 모든 학년도의 학생 조회"""
+    return entity_memo.get_or_load(
+        ("students", student_name),
+        lambda: [_student_ref(student, class_obj) for student, class_obj in _student_query(db, student_name).all()]
+    )
+
+
+def find_class(db: Session, grade: int, class_num: int, academic_year: Optional[int] = None) -> Optional[ClassRef]:
+    """학년/반 번호로 반 조회 (academic_year가 없으면 학년도 구분 없이 첫 번째 일치 항목)"""
+    def load():
+        query = db.query(Class).filter(Class.grade == grade, Class.class_num == class_num)
+        if academic_year is not None:
+            query = query.filter(Class.academic_year == academic_year)
+        return _class_ref(query.first())
+    return entity_memo.get_or_load(("class", grade, class_num, academic_year), load)
+
+
+def find_subject(db: Session, subject_name: str) -> Optional[NamedRef]:
+    """과목 이름으로 과목 조회"""
+    def load():
+        subject = db.query(Subject.id, Subject.name).filter(Subject.name == subject_name).first()
+        return NamedRef(*subject) if subject else None
+    return entity_memo.get_or_load(("subject", subject_name), load)
+
+
+def find_exam(db: Session, exam_name: str) -> Optional[NamedRef]:
+    """시험 이름으로 시험 조회"""
+    def load():
+        exam = db.query(Exam.id, Exam.name).filter(Exam.name == exam_name).first()
+        return NamedRef(*exam) if exam else None
+    return entity_memo.get_or_load(("exam", exam_name), load)
+
+
+def subject_names(db: Session) -> Dict[int, str]:
+    """과목 ID → 과목 이름"""
+    return entity_memo.get_or_load(("subjects",), lambda: dict(db.query(Subject.id, Subject.name).all()))
+
+
+def exam_names(db: Session) -> Dict[int, str]:
+    """시험 ID → 시험 이름"""
+    return entity_memo.get_or_load(("exams",), lambda: dict(db.query(Exam.id, Exam.name).all()))
@@ -0,0 +1,179 @@
+"""
+사용자별 일정 제목 색인
+일정 제목을 정규화한 문자 2-gram → 일정 ID 역색인으로 메모리에 보관해
+"회의 취소해줘"처럼 날짜 없이 제목만 말한 요청을 테이블 조회 없이 후보 일정으로 찾고
+오늘과 가까운 날짜 순으로 정렬하는 기능 (CalendarService의 등록/수정/삭제 시 함께 갱신)
+"""
+
+import re
+import threading
+import time as clock
+from collections import Counter, OrderedDict
+from datetime import date, time
+from typing import Dict, List, NamedTuple, Optional, Set
+from sqlalchemy.orm import Session
+from config import EVENT_TITLE_INDEX_MAX_USERS, EVENT_TITLE_INDEX_TTL, EVENT_TITLE_MIN_COVERAGE
+from models import CalendarEvent
+
+# 제목 비교 시 무시할 공백과 문장 부호
+_NOISE = re.compile(r"[\s\?\!\.\,~'\"\(\)\[\]\-_/]+")
+
+
+class EventRef(NamedTuple):
+    """색인에 보관하는 일정 정보"""
+    id: int
+    title: str
+    start_date: date
+    start_time: Optional[time]
+
+
+def title_grams(title: str) -> Set[str]:
+    """공백/문장 부호를 제거한 소문자 제목의 문자 2-gram (한 글자 제목은 그 글자)"""
+    compact = _NOISE.sub("", title.lower())
+    if len(compact) < 2:
+        return {compact} if compact else set()
+    return {compact[i:i + 2] for i in range(len(compact) - 1)}
+
+
+class UserTitleIndex:
+    """사용자 한 명의 제목 역색인"""
+
+    def __init__(self, events: List[EventRef]):
+        self.events: Dict[int, EventRef] = {}
+        self.postings: Dict[str, Set[int]] = {}
+        self.loaded_at = clock.monotonic()
+        for event in events:
+            self.add(event)
+
+    def add(self, event: EventRef):
+        self.remove(event.id)
+        self.events[event.id] = event
+        for gram in title_grams(event.title):
+            self.postings.setdefault(gram, set()).add(event.id)
+
+    def remove(self, event_id: int):
+        event = self.events.pop(event_id, None)
+        if event is None:
+            return
+        for gram in title_grams(event.title):
+            ids = self.postings.get(gram)
+            if ids is not None:
+                ids.discard(event_id)
+                if not ids:
+                    del self.postings[gram]
+
+
+class EventTitleIndex:
+    """사용자별 제목 색인 저장소 (첫 검색 시 사용자 일정을 한 번 적재, 사용자 수 LRU 제한)
+    다른 워커 프로세스에서 바뀐 일정도 반영되도록 적재 후 TTL이 지나면 다시 적재
+    """
+
+    def __init__(
+        self,
+        max_users: int = EVENT_TITLE_INDEX_MAX_USERS,
+        ttl_seconds: int = EVENT_TITLE_INDEX_TTL,
+        min_coverage: float = EVENT_TITLE_MIN_COVERAGE
+    ):
+        self.max_users = max_users
+        self.ttl_seconds = ttl_seconds
+        self.min_coverage = min_coverage
+        self._users: "OrderedDict[int, UserTitleIndex]" = OrderedDict()
+        self._versions: Dict[int, int] = {}  # 사용자별 쓰기 버전 (적재 중 변경된 색인은 저장하지 않음)
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.searches = 0
+
+    def _load(self, db: Session, user_id: int) -> UserTitleIndex:
+        """사용자 일정 제목을 한 번 조회해 색인 생성 (필요한 컬럼만 조회)"""
+        with self._lock:
+            version = self._versions.get(user_id, 0)
+        rows = db.query(
+            CalendarEvent.id, CalendarEvent.title, CalendarEvent.start_date, CalendarEvent.start_time
+        ).filter(CalendarEvent.user_id == user_id).all()
+        index = UserTitleIndex([EventRef(*row) for row in rows])
+        with self._lock:
+            self.loads += 1
+            if self._versions.get(user_id, 0) == version:
+                self._users[user_id] = index
+                self._users.move_to_end(user_id)
+                while len(self._users) > self.max_users:
+                    self._users.popitem(last=False)
+        return index
+
+    def _get(self, db: Session, user_id: int) -> UserTitleIndex:
+        with self._lock:
+            index = self._users.get(user_id)
+            if index is not None and clock.monotonic() - index.loaded_at <= self.ttl_seconds:
+                self._users.move_to_end(user_id)
+                return index
+        return self._load(db, user_id)
+
+    def search(
+        self,
+        db: Session,
+        user_id: int,
+        title: str,
+        today: Optional[date] = None,
+        target_time: Optional[time] = None,
+        limit: int = 5
+    ) -> List[EventRef]:
+        """제목과 비슷한 일정 후보 (제목 일치도 → 오늘과의 날짜 거리 → 다가오는 일정 순)
+        target_time이 있으면 시작 시간이 30분 이내인 일정만 (시작 시간이 없는 일정은 제목만으로 판단)
+        """
+        query = title_grams(title)
+        if not query:
+            return []
+        today = today or date.today()
+        index = self._get(db, user_id)
+
+        with self._lock:
+            self.searches += 1
+            hits = Counter()
+            for gram in query:
+                hits.update(index.postings.get(gram, ()))
+            candidates = [(index.events[event_id], count / len(query)) for event_id, count in hits.items()]
+
+        ranked = []
+        for event, coverage in candidates:
+            if coverage < self.min_coverage:
+                continue
+            if target_time and event.start_time:
+                time_diff = abs((event.start_time.hour * 60 + event.start_time.minute) -
+                                (target_time.hour * 60 + target_time.minute))
+                if time_diff > 30:
+                    continue
+            distance = abs((event.start_date - today).days)
+            ranked.append(((-round(coverage, 3), distance, event.start_date < today), event))
+        ranked.sort(key=lambda item: item[0])
+        return [event for _, event in ranked[:limit]]
+
+    def _write(self, user_id: int, update):
+        with self._lock:
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+            index = self._users.get(user_id)
+            # 아직 적재하지 않은 사용자는 다음 검색 때 DB에서 적재
+            if index is not None:
+                update(index)
+
+    def add(self, event: CalendarEvent):
+        """일정 등록/수정 시 호출"""
+        ref = EventRef(event.id, event.title, event.start_date, event.start_time)
+        self._write(event.user_id, lambda index: index.add(ref))
+
+    def remove(self, user_id: int, event_id: int):
+        """일정 삭제 시 호출"""
+        self._write(user_id, lambda index: index.remove(event_id))
+
+    def get_stats(self) -> Dict:
+        """색인 통계 반환"""
+        return {
+            "users": len(self._users),
+            "max_users": self.max_users,
+            "events": sum(len(index.events) for index in list(self._users.values())),
+            "loads": self.loads,
+            "searches": self.searches
+        }
+
+
+# 전역 일정 제목 색인 인스턴스
+event_title_index = EventTitleIndex()
@@ -0,0 +1,202 @@
+"""
+FAQ 라우터
+사용법/기능 안내처럼 반복되는 질문을 해시 문자 n-gram 벡터의 코사인 유사도로 로컬에서 매칭해
+LLM 호출 없이 답변하는 기능 (임계값 미만이면 기존 AI 응답으로 넘김)
+"""
+
+import json
+import re
+import threading
+import zlib
+from typing import Dict, List, NamedTuple, Optional
+import numpy as np
+from config import FAQ_ROUTER_ENABLED, FAQ_MATCH_THRESHOLD, FAQ_VECTOR_DIM, FAQ_FILE
+
+# 기본 FAQ (질문 예시 목록, 답변)
+DEFAULT_FAQS: List[Dict] = [
+    {
+        "questions": [
+            "뭘 할 수 있어?", "무엇을 할 수 있나요?", "어떤 기능이 있어?", "챗봇 기능 알려줘",
+            "너는 뭘 도와줄 수 있어?", "뭐 할 수 있니", "사용법 알려줘", "사용 방법", "도움말", "어떻게 사용해?"
+        ],
+        "answer": (
+            "저는 학교 관리 시스템 AI 어시스턴트입니다. 다음과 같은 일을 도와드릴 수 있어요.\n\n"
+            "📅 일정: \"오늘 일정 알려줘\", \"이번 주 일정\", \"8월 6일 일정\"\n"
+            "✏️ 일정 등록/삭제: \"내일 3시 회의 등록해줘\", \"내일 회의 삭제해줘\"\n"
+            "📊 성적: \"김철수 성적 알려줘\", \"김철수 학년별 성적\"\n"
+            "✅ 출결: \"김철수 출석 알려줘\", \"출석률 낮은 학생\"\n\n"
+            "그 밖의 질문은 AI가 답변해드립니다."
+        )
+    },
+    {
+        "questions": [
+            "일정 등록은 어떻게 해?", "일정은 어떻게 등록하나요?", "일정 추가하는 방법", "스케줄 등록 방법 알려줘",
+            "캘린더에 일정 넣는 법", "일정 어떻게 등록해?", "어떻게 일정 추가해?", "일정 등록 방법 알려줘"
+        ],
+        "answer": (
+            "날짜, 시간, 내용을 함께 말씀해주시면 일정이 등록됩니다.\n"
+            "예) \"내일 3시 학부모 상담 등록해줘\", \"8월 6일 10시 교직원 회의 추가해줘\"\n"
+            "날짜를 생략하면 오늘, 시간을 생략하면 종일 일정으로 등록됩니다."
+        )
+    },
+    {
+        "questions": [
+            "일정 삭제는 어떻게 해?", "일정은 어떻게 지우나요?", "일정 취소하는 방법", "스케줄 삭제 방법 알려줘",
+            "일정 어떻게 삭제해?"
+        ],
+        "answer": (
+            "삭제할 일정의 제목을 말씀해주세요. 날짜를 생략하면 오늘과 가장 가까운 일정이 삭제됩니다.\n"
+            "예) \"내일 학부모 상담 삭제해줘\", \"8월 6일 교직원 회의 취소해줘\", \"교직원 회의 취소해줘\""
+        )
+    },
+    {
+        "questions": [
+            "성적은 어떻게 조회해?", "학생 성적 보는 방법", "성적 확인하는 법 알려줘", "점수 조회 방법",
+            "성적 조회 어떻게 해?", "성적 조회는 어떻게 하나요?", "성적 조회 방법이 뭐야", "성적은 어떻게 봐?",
+            "점수 확인하는 방법"
+        ],
+        "answer": (
+            "학생 이름과 함께 성적을 물어보시면 됩니다.\n"
+            "예) \"김철수 성적 알려줘\", \"김철수 1학년 2학년 3학년 성적 비교\""
+        )
+    },
+    {
+        "questions": [
+            "출결은 어떻게 조회해?", "출석 확인하는 방법", "출결 조회 방법 알려줘", "출석률 보는 법",
+            "출석 조회 어떻게 해?", "출결 조회는 어떻게 하나요?", "출결 조회 방법이 뭐야", "출석률 조회 방법"
+        ],
+        "answer": (
+            "학생 이름과 함께 출석이나 출결을 물어보시면 됩니다.\n"
+            "예) \"김철수 출석 알려줘\", \"김철수 학년별 출석률\", \"출석률이 가장 낮은 학생\""
+        )
+    },
+    {
+        "questions": [
+            "로그인은 어떻게 해?", "로그인 방법", "로그인하는 법 알려줘", "로그인이 안돼요"
+        ],
+        "answer": (
+            "로그인 화면에서 발급받은 아이디와 비밀번호를 입력하면 로그인할 수 있습니다.\n"
+            "로그인이 되지 않으면 관리자에게 계정 등록 여부를 확인해주세요."
+        )
+    },
+]
+
+# 문장 부호와 공백 (n-gram 생성 전 제거)
+_NOISE = re.compile(r"[\s\?\!\.\,~'\"]+")
+
+# 사용법을 묻는 표현 (명령과 구분하는 기준이며, 유사도는 주제어로만 비교하도록 n-gram 생성 전 제거)
+_HOW_TO_CUES = re.compile(r"어떻게|방법|하는\s*법|는\s*법|뭐야|뭔가요|무엇인가요")
+
+
+class FAQMatch(NamedTuple):
+    """FAQ 매칭 결과"""
+    answer: str
+    question: str
+    score: float
+
+
+def has_how_to_cue(message: str) -> bool:
+    """"어떻게", "방법"처럼 사용법을 묻는 표현이 있는지"""
+    return _HOW_TO_CUES.search(message) is not None
+
+
+def _ngrams(text: str) -> List[str]:
+    """사용법 표현과 공백/문장 부호를 제거한 문자 2-gram, 3-gram (짧은 문장은 문자 단위 포함)"""
+    compact = _NOISE.sub("", _HOW_TO_CUES.sub("", text.lower()))
+    grams = [compact[i:i + n] for n in (2, 3) for i in range(len(compact) - n + 1)]
+    return grams or list(compact)
+
+
+class FAQRouter:
+    """해시 문자 n-gram 벡터 + 코사인 유사도 FAQ 매처 (FAQ 질문 행렬은 첫 매칭 시 생성)"""
+
+    def __init__(
+        self,
+        faqs: Optional[List[Dict]] = None,
+        threshold: float = FAQ_MATCH_THRESHOLD,
+        dim: int = FAQ_VECTOR_DIM,
+        enabled: bool = FAQ_ROUTER_ENABLED
+    ):
+        self.faqs = faqs
+        self.threshold = threshold
+        self.dim = dim
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._matrix: Optional[np.ndarray] = None
+        self._questions: List[str] = []
+        self._answers: List[str] = []
+        self.hits = 0
+        self.misses = 0
+
+    def _load_faqs(self) -> List[Dict]:
+        """FAQ 목록 (FAQ_FILE이 있으면 기본 FAQ에 추가)"""
+        if self.faqs is not None:
+            return self.faqs
+        faqs = list(DEFAULT_FAQS)
+        if FAQ_FILE:
+            try:
+                with open(FAQ_FILE, encoding="utf-8") as f:
+                    faqs.extend(json.load(f))
+            except Exception as e:
+                print(f"FAQ 파일 로드 오류: {e}")
+        return faqs
+
+    def vectorize(self, text: str) -> np.ndarray:
+        """문자 n-gram을 고정 차원으로 해시해 L2 정규화한 벡터 (crc32라 프로세스 간 동일)"""
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for gram in _ngrams(text):
+            vector[zlib.crc32(gram.encode("utf-8")) % self.dim] += 1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _build(self):
+        """FAQ 질문 예시 전체를 (질문 수, 차원) 행렬로 변환"""
+        with self._lock:
+            if self._matrix is not None:
+                return
+            questions, answers = [], []
+            for faq in self._load_faqs():
+                for question in faq["questions"]:
+                    questions.append(question)
+                    answers.append(faq["answer"])
+            matrix = np.zeros((len(questions), self.dim), dtype=np.float32)
+            for row, question in enumerate(questions):
+                matrix[row] = self.vectorize(question)
+            self._questions, self._answers = questions, answers
+            self._matrix = matrix
+
+    def match(self, message: str, require_cue: bool = False) -> Optional[FAQMatch]:
+        """가장 유사한 FAQ 질문이 임계값 이상이면 해당 답변 반환
+        require_cue=True이면 사용법을 묻는 표현이 있는 메시지만 매칭 (명령 처리보다 먼저 확인할 때)
+        """
+        if not self.enabled or not message.strip():
+            return None
+        if require_cue and not has_how_to_cue(message):
+            return None
+        if self._matrix is None:
+            self._build()
+        if not len(self._matrix):
+            return None
+
+        scores = self._matrix @ self.vectorize(message)
+        best = int(np.argmax(scores))
+        score = float(scores[best])
+        if score < self.threshold:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return FAQMatch(self._answers[best], self._questions[best], score)
+
+    def get_stats(self) -> Dict:
+        """FAQ 매칭 통계 반환"""
+        return {
+            "enabled": self.enabled,
+            "threshold": self.threshold,
+            "questions": len(self._questions),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+# 전역 FAQ 라우터 인스턴스
+faq_router = FAQRouter()
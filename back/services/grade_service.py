@@ -1,12 +1,14 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func, text
 from models import Student, Class, Grade, Subject, Exam
+from database_service import DatabaseService
+from services.entity_memo import find_student, find_students, find_class, find_subject, find_exam
 
 def get_student_grades(db: Session, student_name: str, academic_year: int = 2024):
     """특정 학생의 성적 조회"""
     try:
-        # 학생 조회
-        student = db.query(Student).filter(Student.name == student_name).first()
+        # 학생 조회 (요청 범위 메모)
+        student = find_student(db, student_name)
         if not student:
             return None
         
@@ -42,12 +44,8 @@ def get_student_grades(db: Session, student_name: str, academic_year: int = 2024
 def get_class_grades_summary(db: Session, grade: int, class_num: int, academic_year: int = 2024):
     """특정 반의 성적 요약 조회"""
     try:
-        # 반 조회
-        class_obj = db.query(Class).filter(
-            Class.academic_year == academic_year,
-            Class.grade == grade, 
-            Class.class_num == class_num
-        ).first()
+        # 반 조회 (요청 범위 메모)
+        class_obj = find_class(db, grade, class_num, academic_year)
         
         if not class_obj:
             return None
@@ -85,7 +83,7 @@ def get_subject_analysis(db: Session, subject_name: str):
     """특정 과목의 성적 분석"""
     try:
         # 과목 조회
-        subject = db.query(Subject).filter(Subject.name == subject_name).first()
+        subject = find_subject(db, subject_name)
         if not subject:
             return None
         
@@ -217,7 +215,7 @@ def get_exam_analysis(db: Session, exam_name: str, grade: int = None, class_num:
     """특정 시험의 성적 분석"""
     try:
         # 시험 조회
-        exam = db.query(Exam).filter(Exam.name == exam_name).first()
+        exam = find_exam(db, exam_name)
         if not exam:
             return None
         
@@ -286,12 +284,12 @@ def get_subject_exam_analysis(db: Session, exam_name: str, subject_name: str, gr
     """특정 시험의 특정 과목 성적 분석"""
     try:
         # 시험 조회
-        exam = db.query(Exam).filter(Exam.name == exam_name).first()
+        exam = find_exam(db, exam_name)
         if not exam:
             return None
         
         # 과목 조회
-        subject = db.query(Subject).filter(Subject.name == subject_name).first()
+        subject = find_subject(db, subject_name)
         if not subject:
             return None
         
@@ -347,34 +345,42 @@ def get_subject_exam_analysis(db: Session, exam_name: str, subject_name: str, gr
         print(f"과목별 시험 분석 조회 오류: {e}")
         return None 
 
+def _academic_year_grades_query(student_id: int, academic_year: int):
+    """해당 학년도의 성적 조회 쿼리 (DatabaseService.fan_out용)"""
+    def query(session: Session):
+        return session.query(
+            Subject.name.label('subject_name'),
+            Exam.name.label('exam_name'),
+            Grade.score,
+            Grade.academic_year
+        ).join(
+            Subject, Grade.subject_id == Subject.id
+        ).join(
+            Exam, Grade.exam_id == Exam.id
+        ).filter(
+            Grade.student_id == student_id,
+            Grade.academic_year == academic_year
+        ).all()
+    return query
+
 def get_student_academic_history(db: Session, student_name: str):
     """학생의 1학년, 2학년, 3학년 전체 성적 이력 조회"""
     try:
         # 학생 조회 (여러 학년도의 동일한 이름 학생들)
-        students = db.query(Student).filter(Student.name == student_name).all()
+        students = find_students(db, student_name)
         if not students:
             return None
         
         academic_history = {}
         
-        for student in students:
+        # 학년도별 성적은 서로 독립적이므로 병렬 조회
+        grades_by_student = DatabaseService.fan_out(
+            *[_academic_year_grades_query(student.id, student.academic_year) for student in students]
+        )
+        
+        for student, grades in zip(students, grades_by_student):
             academic_year = student.academic_year
             
-            # 해당 학년도의 성적 조회
-            grades = db.query(
-                Subject.name.label('subject_name'),
-                Exam.name.label('exam_name'),
-                Grade.score,
-                Grade.academic_year
-            ).join(
-                Subject, Grade.subject_id == Subject.id
-            ).join(
-                Exam, Grade.exam_id == Exam.id
-            ).filter(
-                Grade.student_id == student.id,
-                Grade.academic_year == academic_year
-            ).all()
-            
             if grades:
                 # 과목별 평균 계산
                 subject_averages = {}
@@ -417,11 +423,8 @@ def get_student_academic_history(db: Session, student_name: str):
 def get_student_grades_by_academic_year(db: Session, student_name: str, academic_year: int):
     """특정 학년도의 학생 성적 조회"""
     try:
-        # 해당 학년도의 학생 조회
-        student = db.query(Student).filter(
-            Student.name == student_name,
-            Student.academic_year == academic_year
-        ).first()
+        # 해당 학년도의 학생 조회 (요청 범위 메모의 전체 학년도 조회 결과 재사용)
+        student = next((s for s in find_students(db, student_name) if s.academic_year == academic_year), None)
         
         if not student:
             return None
@@ -540,4 +543,4 @@ def analyze_student_progress(db: Session, student_name: str):
         
     except Exception as e:
         print(f"학생 성적 변화 분석 오류: {e}")
-        return None 
\ No newline at end of file
+        return None
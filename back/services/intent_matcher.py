@@ -0,0 +1,208 @@
+"""
+챗봇 의도/개체 매처
+키워드 테이블과 학생 명단으로 Aho-Corasick 오토마톤을 만들어
+메시지를 한 번만 훑어 모든 의도와 학생 이름을 찾아내는 기능
+"""
+
+import threading
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# 의도별 키워드 테이블 (chat_router의 분기 순서와 동일한 의미)
+INTENT_KEYWORDS: Dict[str, List[str]] = {
+    "model_info": ["현재 연동", "연동된 모델", "어떤 모델", "ai 모델", "모델 정보"],
+    "event_create": ["등록해줘", "등록", "추가해줘", "추가", "일정 등록", "일정 추가"],
+    "event_delete": ["삭제해줘", "삭제", "취소해줘", "취소", "일정 삭제", "일정 취소"],
+    "schedule_today": ["오늘 일정", "오늘의 일정", "오늘 스케줄", "오늘 일정이", "오늘 일정은"],
+    "schedule_tomorrow": ["내일 일정", "내일의 일정", "내일 스케줄", "내일 일정이", "내일 일정은"],
+    "schedule_day_after": ["모레 일정", "모레의 일정", "모레 스케줄"],
+    "schedule_two_days_after": ["글피 일정", "글피의 일정", "글피 스케줄"],
+    "schedule_week": ["이번 주 일정", "이번주 일정", "주간 일정", "이번 주 스케줄"],
+    "schedule": ["일정", "스케줄"],
+    "date_hint": ["월", "/", "요일", "다음 주", "다음주", "지난 주", "지난주", "저번 주", "저번주"],
+    "date_followup": ["그날", "그 날", "그때", "그 때", "그 주", "그주"],
+    "attendance": ["출결", "출석"],
+    "grade": ["성적", "점수"],
+    "student_summary": ["요약", "종합"],
+    "grade_comparison": ["1학년2학년3학년", "1학년 2학년 3학년", "학년별 성적", "3년간 성적"],
+    "attendance_comparison": ["1학년2학년3학년", "1학년 2학년 3학년", "학년별 출석률", "학년별 출결률"],
+    "attendance_lowest": ["가장 안좋은", "제일 안좋은", "낮은", "최악"],
+    "attendance_highest": ["가장 좋은", "제일 좋은", "높은", "최고"],
+}
+
+INTENT = "intent"
+STUDENT = "student"
+
+
+class AhoCorasick:
+    """Aho-Corasick 다중 패턴 매칭 오토마톤 (패턴 추가/삭제 후 실패 링크는 지연 재계산)"""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[int, tuple]]] = [[]]  # 노드별 (패턴 길이, payload)
+        self._output_link: List[int] = [-1]  # 출력이 있는 가장 가까운 실패 링크 노드
+        self._dirty = False
+
+    def add(self, pattern: str, payload: tuple):
+        """패턴 추가 (트라이에 점진적으로 삽입)"""
+        node = 0
+        for ch in pattern:
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][ch] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+                self._output_link.append(-1)
+            node = next_node
+        entry = (len(pattern), payload)
+        if entry not in self._outputs[node]:
+            self._outputs[node].append(entry)
+            self._dirty = True
+
+    def remove(self, pattern: str, payload: tuple):
+        """패턴 삭제 (노드는 남기고 출력만 제거)"""
+        node = 0
+        for ch in pattern:
+            node = self._goto[node].get(ch)
+            if node is None:
+                return
+        entry = (len(pattern), payload)
+        if entry in self._outputs[node]:
+            self._outputs[node].remove(entry)
+            self._dirty = True
+
+    def _build_links(self):
+        """BFS로 실패 링크와 출력 링크 계산"""
+        queue = deque()
+        for node in self._goto[0].values():
+            self._fail[node] = 0
+            self._output_link[node] = -1
+            queue.append(node)
+
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail_target = self._goto[fail].get(ch, 0)
+                self._fail[child] = fail_target if fail_target != child else 0
+                target = self._fail[child]
+                self._output_link[child] = target if self._outputs[target] else self._output_link[target]
+                queue.append(child)
+
+        self._dirty = False
+
+    def search(self, text: str) -> List[Tuple[int, int, tuple]]:
+        """텍스트에서 모든 패턴 매칭 결과 (시작, 끝, payload) 반환"""
+        if self._dirty:
+            self._build_links()
+
+        matches = []
+        node = 0
+        for index, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+
+            output_node = node if self._outputs[node] else self._output_link[node]
+            while output_node > 0:
+                for length, payload in self._outputs[output_node]:
+                    matches.append((index - length + 1, index + 1, payload))
+                output_node = self._output_link[output_node]
+        return matches
+
+
+class ChatMatch:
+    """메시지 매칭 결과 (의도별 첫 등장 위치, 등장 순서대로의 학생 이름)"""
+
+    def __init__(self, intents: Dict[str, int], students: List[str]):
+        self.intents = intents
+        self.students = students
+
+    def has(self, *intents: str) -> bool:
+        """주어진 의도 중 하나라도 매칭되었는지 확인"""
+        return any(intent in self.intents for intent in intents)
+
+    @property
+    def student(self) -> Optional[str]:
+        """처음 등장한 학생 이름"""
+        return self.students[0] if self.students else None
+
+
+class IntentMatcher:
+    """키워드 테이블 + 학생 명단 통합 매처
+    공용 학생 명단은 컨텍스트 캐시가 재생성될 때 set_roster로만 바꾸고,
+    다른 명단을 넘긴 match 호출은 공용 오토마톤을 바꾸지 않고 별도 오토마톤으로 매칭
+    """
+
+    def __init__(self, intent_keywords: Dict[str, List[str]] = INTENT_KEYWORDS):
+        self._lock = threading.Lock()
+        self._automaton = AhoCorasick()
+        self._students = frozenset()
+        self._roster_source = None
+        self._adhoc_names = None  # 마지막으로 매칭한 별도 명단 (같은 명단이 반복되면 오토마톤 재사용)
+        self._adhoc_automaton = AhoCorasick()
+        for intent, keywords in intent_keywords.items():
+            for keyword in keywords:
+                self._automaton.add(keyword.lower(), (INTENT, intent))
+
+    def set_roster(self, student_names: Iterable[str]):
+        """공용 학생 명단 교체 (변경분만 오토마톤에 반영, 컨텍스트 캐시 재생성 시 호출)"""
+        names = frozenset(name for name in student_names if name)
+        with self._lock:
+            for name in names - self._students:
+                self._automaton.add(name.lower(), (STUDENT, name))
+            for name in self._students - names:
+                self._automaton.remove(name.lower(), (STUDENT, name))
+            self._students = names
+            self._roster_source = student_names
+
+    def _search_adhoc(self, text: str, student_names: Iterable[str]) -> List[Tuple[int, int, tuple]]:
+        """공용 명단이 아닌 명단의 학생 이름 매칭 (잠금 안에서 호출)"""
+        names = frozenset(name for name in student_names if name)
+        if names != self._adhoc_names:
+            self._adhoc_automaton = AhoCorasick()
+            for name in names:
+                self._adhoc_automaton.add(name.lower(), (STUDENT, name))
+            self._adhoc_names = names
+        return self._adhoc_automaton.search(text)
+
+    def match(self, message: str, student_names: Optional[Iterable[str]] = None) -> ChatMatch:
+        """메시지를 한 번 훑어 모든 의도와 학생 이름 반환
+        student_names가 없거나 공용 명단이면 공용 명단으로, 다른 명단이면 그 명단으로만 학생 이름 매칭
+        """
+        text = message.lower()
+        with self._lock:
+            matches = self._automaton.search(text)
+            if student_names is not None and student_names is not self._roster_source:
+                # 공용 명단의 학생 매칭은 버리고 넘겨받은 명단으로 다시 매칭
+                matches = [m for m in matches if m[2][0] == INTENT] + self._search_adhoc(text, student_names)
+
+        intents: Dict[str, int] = {}
+        student_spans = []
+        for start, end, (kind, value) in matches:
+            if kind == INTENT:
+                if value not in intents or start < intents[value]:
+                    intents[value] = start
+            else:
+                student_spans.append((start, end, value))
+
+        # 학생 이름은 왼쪽부터 가장 긴 이름 우선, 겹치지 않게 선택
+        students = []
+        covered_until = -1
+        for start, end, name in sorted(student_spans, key=lambda span: (span[0], -(span[1] - span[0]))):
+            if start >= covered_until:
+                if name not in students:
+                    students.append(name)
+                covered_until = end
+
+        return ChatMatch(intents, students)
+
+
+# 전역 의도 매처 인스턴스
+intent_matcher = IntentMatcher()
@@ -0,0 +1,166 @@
+"""
+토큰 예산 기반 프롬프트 컨텍스트 빌더
+기본 AI 응답용 시스템 프롬프트에 넣을 학교 정보를 토큰 예산 안에서 골라
+필요한 행만 조회(COUNT, LIMIT)해 구성하는 기능
+"""
+
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from models import User, Class, Student
+from config import (
+    AI_CONTEXT_TOKEN_BUDGET, AI_CONTEXT_MAX_TEACHERS, AI_CONTEXT_MAX_CLASSES,
+    AI_CONTEXT_SAMPLE_STUDENTS, CONTEXT_CACHE_TTL
+)
+from services.context_cache import context_cache
+
+ACADEMIC_YEAR = 2025
+
+PROMPT_HEADER = "당신은 학교 관리 시스템의 AI 어시스턴트입니다."
+PROMPT_FOOTER = "친근하고 도움이 되는 답변을 한국어로 제공해주세요."
+
+# 요청마다 바뀌지 않는 고정 지시문 (제공자의 프롬프트 접두사 캐시가 적중하도록 항상 맨 앞에 배치)
+STATIC_SYSTEM_PROMPT = (
+    f"{PROMPT_HEADER}\n"
+    "아래 '현재 시스템 정보'와 이전 대화를 참고해 질문에 답변하세요.\n"
+    "정보에 없는 학생 성적/출결/일정은 추측하지 말고 구체적으로 다시 질문해달라고 안내하세요.\n"
+    f"{PROMPT_FOOTER}"
+)
+
+_HANGUL_PATTERN = re.compile(r"[가-힣]")
+_tiktoken_encoding = None
+_tiktoken_checked = False
+
+
+def compose_system_prompt(static_prefix: str, *volatile_sections: str) -> str:
+    """고정 접두사 뒤에 요청마다 바뀌는 내용(수치, 명단, 날짜, 대화 기록)을 붙여 시스템 프롬프트 구성
+    접두사가 매번 같은 바이트로 시작해야 OpenAI/Gemini의 프롬프트 캐시가 적중하므로 변하는 값은 접두사에 넣지 않음
+    """
+    return "\n\n".join([static_prefix] + [section for section in volatile_sections if section])
+
+
+def count_tokens(text: str) -> int:
+    """프롬프트 토큰 수 계산 (tiktoken이 설치되어 있으면 사용, 없으면 근사치)"""
+    global _tiktoken_encoding, _tiktoken_checked
+    if not _tiktoken_checked:
+        _tiktoken_checked = True
+        try:
+            import tiktoken
+            _tiktoken_encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            _tiktoken_encoding = None
+
+    if _tiktoken_encoding is not None:
+        return len(_tiktoken_encoding.encode(text))
+
+    # 근사치: 한글 음절은 1토큰, 나머지 문자는 4자당 1토큰
+    hangul = len(_HANGUL_PATTERN.findall(text))
+    return hangul + (len(text) - hangul + 3) // 4
+
+
+class PromptContextBuilder:
+    """토큰 예산 안에서 시스템 프롬프트 컨텍스트 구성 (결과는 컨텍스트 캐시와 함께 무효화)"""
+
+    def __init__(self, token_budget: int = AI_CONTEXT_TOKEN_BUDGET, ttl_seconds: int = CONTEXT_CACHE_TTL):
+        self.token_budget = token_budget
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._cached: Optional[Tuple[int, float, str]] = None  # (캐시 세대, 생성 시각, 프롬프트)
+        self.last_token_count = 0
+
+    def _fetch_counts(self, db: Session) -> Dict[str, int]:
+        """COUNT(*)로 전체 수만 조회"""
+        return {
+            "students": db.query(func.count(Student.id)).filter(Student.academic_year == ACADEMIC_YEAR).scalar() or 0,
+            "classes": db.query(func.count(Class.id)).filter(Class.academic_year == ACADEMIC_YEAR).scalar() or 0,
+            "teachers": db.query(func.count(User.id)).filter(User.is_active == True).scalar() or 0,
+        }
+
+    @staticmethod
+    def _fit_items(items: List[str], remaining: int, separator: str) -> List[str]:
+        """남은 토큰 예산 안에 들어가는 항목만 선택"""
+        selected = []
+        used = 0
+        for item in items:
+            cost = count_tokens(item + separator)
+            if used + cost > remaining:
+                break
+            selected.append(item)
+            used += cost
+        return selected
+
+    @staticmethod
+    def _limit_for(remaining: int, cap: int, tokens_per_item: int = 5) -> int:
+        """남은 예산으로 들어갈 수 있는 최대 행 수만큼만 조회"""
+        return max(0, min(cap, remaining // tokens_per_item + 1))
+
+    def _build(self, db: Session) -> str:
+        counts = self._fetch_counts(db)
+        sections = [
+            "현재 시스템 정보:\n"
+            f"- 전체 학생 수: {counts['students']}명\n"
+            f"- 전체 반 수: {counts['classes']}개\n"
+            f"- 전체 선생님 수: {counts['teachers']}명"
+        ]
+        remaining = self.token_budget - count_tokens(compose_system_prompt(STATIC_SYSTEM_PROMPT, *sections))
+
+        # 선생님 명단
+        limit = self._limit_for(remaining, AI_CONTEXT_MAX_TEACHERS)
+        if limit:
+            names = [name for (name,) in db.query(User.name).filter(User.is_active == True).order_by(User.id).limit(limit).all()]
+            selected = self._fit_items(names, remaining - 10, ", ")
+            if selected:
+                suffix = f" 외 {counts['teachers'] - len(selected)}명" if counts['teachers'] > len(selected) else ""
+                section = f"선생님 명단: {', '.join(selected)}{suffix}"
+                sections.append(section)
+                remaining -= count_tokens(section)
+
+        # 반 정보
+        limit = self._limit_for(remaining, AI_CONTEXT_MAX_CLASSES)
+        if limit:
+            rows = db.query(Class.grade, Class.class_num).filter(
+                Class.academic_year == ACADEMIC_YEAR
+            ).order_by(Class.grade, Class.class_num).limit(limit).all()
+            selected = self._fit_items([f"- {grade}학년 {class_num}반" for grade, class_num in rows], remaining - 10, "\n")
+            if selected:
+                suffix = f"\n- 외 {counts['classes'] - len(selected)}개 반" if counts['classes'] > len(selected) else ""
+                section = "반 정보:\n" + "\n".join(selected) + suffix
+                sections.append(section)
+                remaining -= count_tokens(section)
+
+        # 학생 명단 (일부)
+        limit = self._limit_for(remaining, AI_CONTEXT_SAMPLE_STUDENTS)
+        if limit:
+            names = [name for (name,) in db.query(Student.name).filter(
+                Student.academic_year == ACADEMIC_YEAR
+            ).order_by(Student.id).limit(limit).all()]
+            selected = self._fit_items(names, remaining - 10, ", ")
+            if selected:
+                sections.append(f"학생 명단 (일부): {', '.join(selected)}")
+
+        # 고정 지시문을 앞에, 수치/명단은 뒤에 배치
+        return compose_system_prompt(STATIC_SYSTEM_PROMPT, *sections)
+
+    def build_system_prompt(self, db: Session) -> str:
+        """시스템 프롬프트 반환 (컨텍스트 캐시가 무효화되었거나 TTL이 지난 경우에만 재구성)"""
+        generation = context_cache.generation
+        cached = self._cached
+        if cached and cached[0] == generation and time.monotonic() - cached[1] < self.ttl_seconds:
+            return cached[2]
+
+        with self._lock:
+            try:
+                prompt = self._build(db)
+            except Exception as e:
+                print(f"프롬프트 컨텍스트 구성 오류: {e}")
+                return STATIC_SYSTEM_PROMPT
+            self.last_token_count = count_tokens(prompt)
+            self._cached = (generation, time.monotonic(), prompt)
+            return prompt
+
+
+# 전역 프롬프트 컨텍스트 빌더 인스턴스
+prompt_builder = PromptContextBuilder()
@@ -7,31 +7,14 @@ from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
 from models import User, Class, Student, Grade, Subject, Exam
 from services.grade_service import get_student_grades
-import re
+from services.intent_matcher import intent_matcher, ChatMatch
+from services.entity_memo import find_student, find_class, subject_names as load_subject_names, exam_names as load_exam_names
 
 
 def extract_student_name(message: str, student_names: List[str]) -> Optional[str]:
-    """메시지에서 학생 이름 추출"""
+    """메시지에서 학생 이름 추출 (Aho-Corasick 매처로 한 번에 탐색, 가장 긴 이름 우선)"""
     try:
-        # 학생 이름이 포함된 메시지인지 확인
-        for student_name in student_names:
-            if student_name in message:
-                return student_name
-        
-        # 정규식으로 더 정확한 매칭 시도
-        for student_name in student_names:
-            # "~학생의", "~의", "~학생" 패턴 매칭
-            patterns = [
-                rf"{student_name}학생",
-                rf"{student_name}의",
-                rf"{student_name}",
-                rf"{student_name} 학생"
-            ]
-            for pattern in patterns:
-                if re.search(pattern, message):
-                    return student_name
-        
-        return None
+        return intent_matcher.match(message, student_names).student
     except Exception as e:
         print(f"학생 이름 추출 오류: {e}")
         return None
@@ -40,9 +23,9 @@ def extract_student_name(message: str, student_names: List[str]) -> Optional[str
 def get_student_info(db: Session, student_name: str) -> Optional[Dict]:
     """학생 정보 조회"""
     try:
-        student = db.query(Student).filter(Student.name == student_name).first()
+        student = find_student(db, student_name)
         if student:
-            class_info = db.query(Class).filter(Class.id == student.class_id).first()
+            class_info = student.class_info
             return {
                 'name': student.name,
                 'class': f"{class_info.grade}학년 {class_info.class_num}반" if class_info else "알 수 없음",
@@ -57,7 +40,7 @@ def get_student_info(db: Session, student_name: str) -> Optional[Dict]:
 def get_class_info(db: Session, grade: int, class_num: int) -> Optional[Dict]:
     """반 정보 조회"""
     try:
-        class_info = db.query(Class).filter(Class.grade == grade, Class.class_num == class_num).first()
+        class_info = find_class(db, grade, class_num)
         if class_info:
             students = db.query(Student).filter(Student.class_id == class_info.id).all()
             return {
@@ -91,7 +74,7 @@ def get_teacher_info(db: Session, teacher_name: str) -> Optional[Dict]:
 def get_student_grades_by_year(db: Session, student_name: str, academic_year: int) -> Optional[Dict]:
     """특정 연도의 학생 성적 조회"""
     try:
-        student = db.query(Student).filter(Student.name == student_name).first()
+        student = find_student(db, student_name)
         if not student:
             return None
         
@@ -104,12 +87,10 @@ def get_student_grades_by_year(db: Session, student_name: str, academic_year: in
             return None
         
         # 과목별로 그룹화
-        subjects = db.query(Subject).all()
-        subject_names = {subject.id: subject.name for subject in subjects}
+        subject_names = load_subject_names(db)
         
         # 시험별로 그룹화
-        exams = db.query(Exam).all()
-        exam_names = {exam.id: exam.name for exam in exams}
+        exam_names = load_exam_names(db)
         
         grade_data = []
         for grade in grades:
@@ -137,7 +118,7 @@ def get_student_grades_by_year(db: Session, student_name: str, academic_year: in
 def get_student_grades_comparison(db: Session, student_name: str) -> Optional[str]:
     """학년별 성적 비교 조회"""
     try:
-        student = db.query(Student).filter(Student.name == student_name).first()
+        student = find_student(db, student_name)
         if not student:
             return f"{student_name} 학생을 찾을 수 없습니다."
         
@@ -151,8 +132,7 @@ def get_student_grades_comparison(db: Session, student_name: str) -> Optional[st
             
             if grades:
                 # 과목별 평균 계산
-                subjects = db.query(Subject).all()
-                subject_names = {subject.id: subject.name for subject in subjects}
+                subject_names = load_subject_names(db)
                 
                 subject_scores = {}
                 for grade in grades:
@@ -190,11 +170,13 @@ def get_student_grades_comparison(db: Session, student_name: str) -> Optional[st
         return "학년별 성적 비교 조회 중 오류가 발생했습니다."
 
 
-def process_student_grade_query(chat_request, context: Dict, db: Session) -> str:
+def process_student_grade_query(chat_request, context: Dict, db: Session, match: Optional[ChatMatch] = None) -> str:
     """학생 성적 관련 질문 처리"""
     try:
         student_names = context.get('students', [])
-        student_name = extract_student_name(chat_request.message, student_names)
+        if match is None:
+            match = intent_matcher.match(chat_request.message, student_names)
+        student_name = match.student
         
         if not student_name:
             print(f"학생 이름 추출 실패. 메시지: {chat_request.message}")
@@ -204,7 +186,7 @@ def process_student_grade_query(chat_request, context: Dict, db: Session) -> str
         print(f"학생 이름 추출 성공: {student_name}")
         
         # 학년별 성적 비교 질문 처리
-        if any(keyword in chat_request.message for keyword in ["1학년2학년3학년", "1학년 2학년 3학년", "학년별 성적", "3년간 성적"]):
+        if match.has("grade_comparison"):
             return get_student_grades_comparison(db, student_name)
         
         # 일반 성적 조회
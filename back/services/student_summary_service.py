@@ -0,0 +1,175 @@
+"""
+학생별 종합 요약 서비스
+학년도 전체 학생의 성적 이력과 출결을 모아 LLM으로 종합 요약을 만들고 버전별로 저장하는 기능
+(원본 데이터의 해시가 직전 버전과 같으면 다시 생성하지 않으며, 챗봇은 저장된 최신 요약을 바로 사용)
+"""
+
+import asyncio
+import hashlib
+import json
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from config import SessionLocal, STUDENT_SUMMARY_CONCURRENCY
+from db_executor import run_db
+from models import Student, StudentSummary
+from services.ai_scheduler import PRIORITY_BACKGROUND
+from services.ai_service import ai_service
+from services.attendance_service import get_student_attendance_by_name
+from services.entity_memo import entity_memo
+from services.grade_service import get_student_academic_history
+
+STUDENT_SUMMARY_SYSTEM_PROMPT = (
+    "당신은 학교 관리 시스템의 AI 어시스턴트입니다.\n"
+    "다음 JSON은 한 학생의 학년도별 성적과 출결 기록입니다.\n"
+    "담임 교사가 상담 전에 읽을 수 있도록 성적 추이(강점/약점 과목), 출결 특이사항, 지도 참고 사항을 "
+    "5문장 이내의 한국어로 요약하세요. 데이터에 없는 내용은 추측하지 마세요."
+)
+
+
+def build_summary_source(student_name: str) -> Optional[Dict]:
+    """요약에 사용할 학생 데이터 (성적 이력 + 출결), 둘 다 없으면 None"""
+    db = SessionLocal()
+    try:
+        # 성적/출결 조회에서 같은 학생 조회를 한 번만 하도록 메모 범위 안에서 실행
+        with entity_memo.scope():
+            history = get_student_academic_history(db, student_name)
+            attendance = get_student_attendance_by_name(student_name)
+    finally:
+        db.close()
+    academic_history = history["academic_history"] if history else {}
+    attendance_records = {
+        "yearly": attendance["yearly_attendance"],
+        "monthly": attendance["monthly_attendance"],
+        "recent": attendance["recent_attendance"]
+    } if attendance else {}
+    if not academic_history and not any(attendance_records.values()):
+        return None
+    return {
+        "student_name": student_name,
+        "academic_history": academic_history,
+        "attendance": attendance_records
+    }
+
+
+def serialize_source(source: Dict) -> str:
+    """정렬된 JSON 문자열 (해시와 프롬프트에 같은 문자열 사용, Decimal 점수는 문자열로 변환)"""
+    return json.dumps(source, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def source_hash(serialized: str) -> str:
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def get_latest_summary(db: Session, student_id: int) -> Optional[StudentSummary]:
+    """학생의 최신 버전 요약"""
+    return db.query(StudentSummary).filter(
+        StudentSummary.student_id == student_id
+    ).order_by(StudentSummary.version.desc()).first()
+
+
+def find_student_summary(db: Session, student_name: str) -> Optional[StudentSummary]:
+    """학생 이름으로 가장 최근 학년도의 최신 요약 조회 (챗봇 응답용)"""
+    try:
+        return db.query(StudentSummary).join(
+            Student, StudentSummary.student_id == Student.id
+        ).filter(
+            Student.name == student_name
+        ).order_by(
+            StudentSummary.academic_year.desc(), StudentSummary.version.desc()
+        ).first()
+    except Exception as e:
+        print(f"학생 요약 조회 오류: {e}")
+        return None
+
+
+def format_student_summary(student_name: str, summary: StudentSummary) -> str:
+    """챗봇 응답 문자열 (생성 시각을 함께 표시해 최신 데이터 반영 여부를 알 수 있도록 함)"""
+    created_at = summary.created_at.strftime("%Y-%m-%d %H:%M") if summary.created_at else "알 수 없음"
+    return f"📝 {student_name} 학생 종합 요약 ({summary.academic_year}학년도, {created_at} 기준)\n\n{summary.summary}"
+
+
+def _prepare_student(student_id: int, student_name: str, force: bool) -> Tuple[str, Optional[Dict]]:
+    """원본 데이터를 모으고 직전 버전과 해시 비교 → ("empty" | "unchanged" | "changed", 생성 정보)"""
+    source = build_summary_source(student_name)
+    if source is None:
+        return "empty", None
+    serialized = serialize_source(source)
+    digest = source_hash(serialized)
+
+    db = SessionLocal()
+    try:
+        latest = get_latest_summary(db, student_id)
+    finally:
+        db.close()
+    if latest is not None and latest.source_hash == digest and not force:
+        return "unchanged", None
+    return "changed", {
+        "serialized": serialized,
+        "source_hash": digest,
+        "version": latest.version + 1 if latest is not None else 1
+    }
+
+
+def _save_summary(student_id: int, academic_year: int, version: int, summary: str, digest: str, model: Optional[str]):
+    db = SessionLocal()
+    try:
+        db.add(StudentSummary(
+            student_id=student_id,
+            academic_year=academic_year,
+            version=version,
+            summary=summary,
+            source_hash=digest,
+            model=model
+        ))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _list_students(academic_year: int) -> List[tuple]:
+    db = SessionLocal()
+    try:
+        return db.query(Student.id, Student.name).filter(
+            Student.academic_year == academic_year
+        ).order_by(Student.id).all()
+    finally:
+        db.close()
+
+
+async def generate_student_summaries(academic_year: int, concurrency: int = STUDENT_SUMMARY_CONCURRENCY, force: bool = False) -> Dict:
+    """학년도 전체 학생 요약 일괄 생성 (동시 LLM 요청 수 제한, 데이터가 바뀐 학생만 재생성)
+    LLM 호출은 백그라운드 우선순위로 요청해 대화형 요청의 RPM/TPM을 먼저 보장
+    """
+    stats = {"academic_year": academic_year, "students": 0, "generated": 0, "unchanged": 0, "empty": 0, "failed": 0}
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    model = ai_service.get_provider_info().get("model")
+
+    async def summarize(student_id: int, student_name: str):
+        async with semaphore:
+            try:
+                status, prepared = await run_db(_prepare_student, student_id, student_name, force)
+                if prepared is None:
+                    stats[status] += 1
+                    return
+                summary = await ai_service.complete_async(
+                    STUDENT_SUMMARY_SYSTEM_PROMPT, prepared["serialized"], PRIORITY_BACKGROUND
+                )
+                summary = (summary or "").strip()
+                if not summary:
+                    raise ValueError("빈 요약 응답")
+                await run_db(
+                    _save_summary, student_id, academic_year, prepared["version"],
+                    summary, prepared["source_hash"], model
+                )
+                stats["generated"] += 1
+            except Exception as e:
+                print(f"학생 요약 생성 오류 ({student_name}): {e}")
+                stats["failed"] += 1
+
+    students = await run_db(_list_students, academic_year)
+    stats["students"] = len(students)
+    await asyncio.gather(*[summarize(student_id, name) for student_id, name in students])
+    return stats
@@ -2,7 +2,9 @@ from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from config import get_db
+from db_executor import run_db
 from models import User
+from services.context_cache import invalidate_database_context
 import hashlib
 import os
 from datetime import datetime, timedelta
@@ -59,6 +61,7 @@ def create_default_users(db: Session):
                 db.add(new_user)
         
         db.commit()
+        invalidate_database_context()
         print("✅ 기본 사용자 계정 생성 완료!")
         
     except Exception as e:
@@ -70,7 +73,7 @@ async def login(login_request: LoginRequest, db: Session = Depends(get_db)):
     """간단한 로그인"""
     try:
         # 사용자 조회
-        user = db.query(User).filter(User.login_id == login_request.login_id).first()
+        user = await run_db(lambda: db.query(User).filter(User.login_id == login_request.login_id).first())
         
         if not user:
             raise HTTPException(status_code=401, detail="로그인 ID 또는 비밀번호가 잘못되었습니다.")
@@ -102,10 +105,9 @@ async def login(login_request: LoginRequest, db: Session = Depends(get_db)):
 async def get_all_users(db: Session = Depends(get_db)):
     """모든 사용자 조회"""
     try:
-        users = db.query(User).filter(User.is_active == True).all()
-        return {
-            "success": True,
-            "users": [
+        def load_users():
+            users = db.query(User).filter(User.is_active == True).all()
+            return [
                 {
                     "id": user.id,
                     "login_id": user.login_id,
@@ -113,6 +115,10 @@ async def get_all_users(db: Session = Depends(get_db)):
                     "is_active": user.is_active
                 } for user in users
             ]
+        
+        return {
+            "success": True,
+            "users": await run_db(load_users)
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"사용자 조회 실패: {str(e)}")
@@ -121,7 +127,7 @@ async def get_all_users(db: Session = Depends(get_db)):
 async def initialize_users(db: Session = Depends(get_db)):
     """기본 사용자 초기화"""
     try:
-        create_default_users(db)
+        await run_db(create_default_users, db)
         return {"success": True, "message": "기본 사용자 계정이 생성되었습니다."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"사용자 초기화 실패: {str(e)}") 
\ No newline at end of file
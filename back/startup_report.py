@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+
+# 기본적으로 서버 기동 시 로드되는 모듈, --with-chat 옵션 시 첫 채팅 호출 경로까지 포함
+STARTUP_TARGET = "import main"
+CHAT_TARGET = (
+    "import main; "
+    "from services.chat_router import process_chat_message_async; "
+    "from services.ai_service import ai_service; "
+    "ai_service.load_providers()"
+)
+
+
+def collect_import_times(code: str):
+    """python -X importtime 출력을 (모듈, 자체 시간 us, 누적 시간 us, 깊이) 목록으로 파싱"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        print("모듈 로드 실패:")
+        print(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "알 수 없는 오류")
+        sys.exit(1)
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def print_report(entries, top: int):
+    """최상위 패키지별 import 비용과 가장 무거운 모듈 출력"""
+    by_package = defaultdict(int)
+    for name, self_us, _, _ in entries:
+        by_package[name.split(".")[0]] += self_us
+    total_us = sum(by_package.values())
+
+    print(f"전체 import 시간: {total_us / 1000:.1f}ms (모듈 {len(entries)}개)")
+    print()
+    print(f"=== 최상위 패키지별 import 시간 (상위 {top}개) ===")
+    for package, self_us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"  {package:<30} {self_us / 1000:>8.1f}ms  {self_us / total_us * 100:>5.1f}%")
+
+    print()
+    print(f"=== 누적 시간이 가장 긴 모듈 (상위 {top}개) ===")
+    for name, _, cumulative_us, depth in sorted(entries, key=lambda entry: entry[2], reverse=True)[:top]:
+        print(f"  {name:<50} {cumulative_us / 1000:>8.1f}ms  (깊이 {depth})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="백엔드 기동 시 import 비용 리포트")
+    parser.add_argument("--with-chat", action="store_true", help="첫 채팅 호출 시 지연 로드되는 AI 제공자까지 포함")
+    parser.add_argument("--top", type=int, default=15, help="출력할 항목 수")
+    args = parser.parse_args()
+
+    print("=== 기동 시 import 비용 (main) ===")
+    startup_entries = collect_import_times(STARTUP_TARGET)
+    print_report(startup_entries, args.top)
+
+    if args.with_chat:
+        print()
+        print("=== 첫 채팅 호출까지 포함한 import 비용 ===")
+        chat_entries = collect_import_times(CHAT_TARGET)
+        print_report(chat_entries, args.top)
+        startup_modules = {name for name, _, _, _ in startup_entries}
+        deferred_us = sum(self_us for name, self_us, _, _ in chat_entries if name not in startup_modules)
+        print()
+        print(f"첫 채팅 호출로 지연된 import 시간: {deferred_us / 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+from services.ai_scheduler import AIScheduler, RateLimitWait, PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND
+
+
+class FakeClock:
+    """직접 시간을 넘기는 시계 (실제로 기다리지 않고 버킷 충전을 확인)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+def make_scheduler(rpm: int = 0, tpm: int = 0, max_wait: float = 1000.0):
+    clock = FakeClock()
+    scheduler = AIScheduler(max_wait=max_wait, rate_limits=lambda provider: (rpm, tpm), clock=clock)
+    return scheduler, clock
+
+
+def grant_now(scheduler: AIScheduler, tokens: int = 1, priority: int = PRIORITY_INTERACTIVE):
+    """대기 없이 허가되는 요청 하나를 처리"""
+    ticket = scheduler._enqueue("fake", tokens, priority)
+    assert scheduler._try_grant("fake", ticket) is None
+
+
+def test_background_yields_to_interactive():
+    """먼저 들어온 백그라운드 요청보다 나중에 들어온 대화형 요청이 먼저 허가"""
+    scheduler, clock = make_scheduler(rpm=1)
+    grant_now(scheduler)  # 분당 1회 한도를 모두 사용
+
+    background = scheduler._enqueue("fake", 1, PRIORITY_BACKGROUND)
+    interactive = scheduler._enqueue("fake", 1, PRIORITY_INTERACTIVE)
+    assert scheduler._try_grant("fake", interactive) > 0  # 아직 버킷이 비어 있음
+
+    clock.advance(60)
+    # 대기열 맨 앞은 대화형 요청이므로 백그라운드 요청은 계속 대기
+    assert scheduler._try_grant("fake", background) is not None
+    assert scheduler._try_grant("fake", interactive) is None
+
+    clock.advance(60)
+    assert scheduler._try_grant("fake", background) is None
+
+
+def test_tpm_refill_unblocks_waiter():
+    """TPM 버킷이 요청 토큰만큼 다시 차면 대기 중인 요청이 허가"""
+    scheduler, clock = make_scheduler(tpm=600)  # 초당 10토큰
+    grant_now(scheduler, tokens=600)
+
+    waiter = scheduler._enqueue("fake", 100, PRIORITY_INTERACTIVE)
+    assert scheduler.estimate_wait("fake", 0) == pytest.approx(10.0)
+    clock.advance(5)
+    assert scheduler._try_grant("fake", waiter) > 0
+    clock.advance(5)
+    assert scheduler._try_grant("fake", waiter) is None
+
+
+def test_penalty_delays_acquisition():
+    """retry-after 동안은 버킷에 여유가 있어도 허가하지 않음"""
+    scheduler, clock = make_scheduler(rpm=60)  # 초당 1회
+    scheduler.penalize("fake", 30)
+
+    ticket = scheduler._enqueue("fake", 1, PRIORITY_INTERACTIVE)
+    clock.advance(30)
+    assert scheduler._try_grant("fake", ticket) > 0
+    clock.advance(1)
+    assert scheduler._try_grant("fake", ticket) is None
+
+
+def test_rate_limit_wait_estimation():
+    """예상 대기 시간이 max_wait를 넘으면 대기열에 넣지 않고 RateLimitWait"""
+    scheduler, clock = make_scheduler(rpm=60, max_wait=5)
+    scheduler.penalize("fake", 30)
+    assert scheduler.estimate_wait("fake", 0) == pytest.approx(31.0)
+
+    with pytest.raises(RateLimitWait) as error:
+        scheduler.acquire("fake", 1)
+    assert error.value.estimated_wait == pytest.approx(31.0)
+    assert scheduler.get_stats()["providers"]["fake"]["rejected"] == 1
+    assert scheduler.get_stats()["providers"]["fake"]["queued"] == 0
+
+    # 앞선 대기 요청도 예상 시간에 포함
+    clock.advance(31)
+    scheduler._enqueue("fake", 1, PRIORITY_INTERACTIVE)
+    assert scheduler.estimate_wait("fake", 0) == pytest.approx(1.0)
+
+
+def test_unlimited_provider_grants_immediately():
+    """한도가 0이면 제한 없이 바로 허가"""
+    scheduler, _ = make_scheduler()
+    scheduler.acquire("fake", 10 ** 6, PRIORITY_BACKGROUND)
+    assert scheduler.get_stats()["providers"]["fake"]["granted"] == 1
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from types import SimpleNamespace
+from unittest import mock
+from services import chat_router
+from services.chat_state import ChatTurnState
+from services.faq_router import DEFAULT_FAQS
+from services.intent_matcher import intent_matcher
+
+# 명령으로 처리되어야 하는 메시지 → 처리 함수 이름
+COMMAND_MESSAGES = [
+    ("일정 추가해줘", "create_event_from_natural_language"),
+    ("내일 3시 회의 등록해줘", "create_event_from_natural_language"),
+    ("스케줄 등록", "create_event_from_natural_language"),
+    ("일정 취소", "delete_event_from_natural_language"),
+    ("내일 회의 삭제해줘", "delete_event_from_natural_language"),
+    ("8월 6일 일정 어떻게 돼?", "answer_schedule_query"),
+    ("점수 조회", "answer_grade_query"),
+    ("출석 조회", "answer_attendance_query"),
+]
+
+# FAQ로 답변해야 하는 메시지 → FAQ 답변 (DEFAULT_FAQS 순서 기준)
+FAQ_MESSAGES = [
+    ("일정 등록은 어떻게 해?", DEFAULT_FAQS[1]["answer"]),
+    ("일정 삭제하는 법", DEFAULT_FAQS[2]["answer"]),
+    ("성적 조회 방법", DEFAULT_FAQS[3]["answer"]),
+    ("출결 조회 방법이 뭐야", DEFAULT_FAQS[4]["answer"]),
+    ("뭘 할 수 있어?", DEFAULT_FAQS[0]["answer"]),
+    ("도움말", DEFAULT_FAQS[0]["answer"]),
+]
+
+HANDLERS = [
+    "create_event_from_natural_language",
+    "delete_event_from_natural_language",
+    "answer_schedule_query",
+    "answer_attendance_query",
+    "answer_grade_query",
+]
+
+
+def dispatch(message: str, use_tools: bool = False):
+    """DB/AI 호출 없이 분기만 확인 (각 처리 함수는 자기 이름을 응답으로 반환)"""
+    context = {"students": [], "classes": [], "teachers": []}
+    match = intent_matcher.match(message, [])
+    with mock.patch.multiple(chat_router, **{
+        name: mock.Mock(return_value=name) for name in HANDLERS
+    }), mock.patch.object(chat_router.prompt_builder, "build_system_prompt", return_value="system") as build_prompt:
+        # 일정 조회가 아닌 메시지는 answer_schedule_query가 None을 반환하는 것과 같게 처리
+        if not match.has("schedule"):
+            chat_router.answer_schedule_query.return_value = None
+        result = chat_router.dispatch_chat_message(
+            SimpleNamespace(message=message), match, context, None, 1, ChatTurnState(), use_tools
+        )
+        # 도구 호출 모드에서는 정적 컨텍스트 프롬프트를 만들지 않아야 함
+        if use_tools:
+            build_prompt.assert_not_called()
+        return result
+
+
+def test_commands_reach_handlers():
+    """명령 표현은 FAQ에 가로채이지 않고 각 처리 함수로 전달되는지 확인"""
+    for message, handler in COMMAND_MESSAGES:
+        answer, system_prompt = dispatch(message)
+        print(f"  {message} -> {answer}")
+        assert answer == handler, f"{message}: {answer}"
+        assert system_prompt is None
+
+
+def test_how_to_questions_get_faq_answers():
+    """사용법 질문과 기능 안내 질문은 처리 함수 실행 없이 FAQ로 답변하는지 확인"""
+    for message, expected in FAQ_MESSAGES:
+        answer, system_prompt = dispatch(message)
+        print(f"  {message} -> {expected.splitlines()[0]}")
+        assert answer == expected, f"{message}: {answer}"
+        assert system_prompt is None
+
+
+def test_other_questions_fall_back_to_ai():
+    """FAQ와 처리 함수 모두 해당하지 않으면 AI 응답용 시스템 프롬프트 반환"""
+    answer, system_prompt = dispatch("우리 학교 교훈이 뭐야")
+    assert answer is None and system_prompt == "system"
+
+
+def test_tool_mode_skips_static_prompt():
+    """도구 호출 모드에서는 시스템 프롬프트 없이 (None, None) 반환"""
+    assert dispatch("우리 학교 교훈이 뭐야", use_tools=True) == (None, None)
+    # 결정적 응답은 도구 호출 모드에서도 그대로
+    assert dispatch("점수 조회", use_tools=True)[0] == "answer_grade_query"
+
+
+if __name__ == "__main__":
+    print("=== 1. 명령 분기 ===")
+    test_commands_reach_handlers()
+    print("\n=== 2. FAQ 답변 ===")
+    test_how_to_questions_get_faq_answers()
+    print("\n=== 3. AI 응답 ===")
+    test_other_questions_fall_back_to_ai()
+    test_tool_mode_skips_static_prompt()
+    print("\n✅ 모든 분기 테스트 통과")
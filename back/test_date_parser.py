@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from datetime import date, time
+from services.date_parser import date_parser, COMMAND_CREATE, COMMAND_DELETE
+
+# 기준 날짜 고정 (2025-08-10은 일요일)
+SUNDAY = date(2025, 8, 10)
+DECEMBER = date(2025, 12, 20)
+
+
+def parse(message: str, today: date = SUNDAY, command=None):
+    return date_parser.parse(message, today=today, command=command)
+
+
+def test_year_rollover():
+    """12월에 말한 "1월 3일"은 다음 해, 연도를 지정하면 그대로"""
+    assert parse("1월 3일 일정", DECEMBER).date_range == (date(2026, 1, 3), date(2026, 1, 3))
+    assert parse("1/3 일정", DECEMBER).date_range == (date(2026, 1, 3), date(2026, 1, 3))
+    assert parse("12월 24일 일정", DECEMBER).date_range == (date(2025, 12, 24), date(2025, 12, 24))
+    assert parse("2025년 1월 3일 일정", DECEMBER).date_range == (date(2025, 1, 3), date(2025, 1, 3))
+
+
+def test_weeks_and_weekdays():
+    """주 단위는 월요일 기준 ("다음 주 월요일"은 일요일 기준 바로 다음 날)"""
+    assert parse("다음 주 월요일 일정").date_range == (date(2025, 8, 11), date(2025, 8, 11))
+    assert parse("다음주 금요일 일정").date_range == (date(2025, 8, 15), date(2025, 8, 15))
+
+    this_week = parse("이번 주 일정")
+    assert this_week.date_range == (date(2025, 8, 4), date(2025, 8, 10))
+    assert this_week.week_range
+
+    next_week = parse("다음 주 일정")
+    assert next_week.date_range == (date(2025, 8, 11), date(2025, 8, 17))
+    assert next_week.week_range
+
+    # 주 지정이 없는 요일은 오늘 이후 가장 가까운 요일 (오늘이 그 요일이면 오늘)
+    assert parse("수요일 일정").date_range == (date(2025, 8, 13), date(2025, 8, 13))
+    assert parse("일요일 일정").date_range == (date(2025, 8, 10), date(2025, 8, 10))
+
+
+def test_relative_days_and_ranges():
+    """오늘/내일/모레/글피/내일모레, 날짜가 둘 이상이면 처음~마지막 범위"""
+    assert parse("오늘 일정").date_range == (SUNDAY, SUNDAY)
+    assert parse("내일 일정").date_range == (date(2025, 8, 11), date(2025, 8, 11))
+    assert parse("모레 일정").date_range == (date(2025, 8, 12), date(2025, 8, 12))
+    assert parse("내일모레 일정").date_range == (date(2025, 8, 12), date(2025, 8, 12))
+    assert parse("글피 일정").date_range == (date(2025, 8, 13), date(2025, 8, 13))
+    assert parse("8월 6일부터 8월 9일까지 일정").date_range == (date(2025, 8, 6), date(2025, 8, 9))
+    assert parse("2025-08-06 일정").date_range == (date(2025, 8, 6), date(2025, 8, 6))
+
+
+def test_invalid_date():
+    """존재하지 않는 날짜는 invalid_date로 표시"""
+    parsed = parse("2월 30일 일정")
+    assert parsed.invalid_date
+    assert parsed.date_range is None
+
+
+def test_time_ranges():
+    """오전/오후, 반, 분, HH:MM, 종료 시간의 오전/오후 생략"""
+    assert parse("내일 오후 3시 회의").time_range == (time(15, 0), None)
+    assert parse("10시 반 회의").time_range == (time(10, 30), None)
+    assert parse("오전 9시 20분 회의").time_range == (time(9, 20), None)
+    assert parse("15:30 회의").time_range == (time(15, 30), None)
+    assert parse("오후 3시부터 5시까지 회의").time_range == (time(15, 0), time(17, 0))
+    assert parse("10시~12시 회의").time_range == (time(10, 0), time(12, 0))
+    # "2시간", "시험"은 시간이 아님
+    assert parse("2시간 동안 시험 감독").time_range is None
+
+
+def test_title_remainder():
+    """날짜/시간/명령어와 목적격 조사를 뺀 나머지가 제목"""
+    assert parse("내일 오후 3시 학부모 상담을 등록해줘", command=COMMAND_CREATE).title == "학부모 상담"
+    assert parse("8월 6일 10시 교직원 회의 추가해줘", command=COMMAND_CREATE).title == "교직원 회의"
+    assert parse("다음 주 수요일에 동아리 발표회를 등록해줘", command=COMMAND_CREATE).title == "동아리 발표회"
+    assert parse("8월 6일 교직원 회의를 취소해줘", command=COMMAND_DELETE).title == "교직원 회의"
+    assert parse("내일 일정 삭제해줘", command=COMMAND_DELETE).title == ""
+    # 두 글자 단어의 "을"은 조사로 보지 않음
+    assert parse("내일 가을 등록해줘", command=COMMAND_CREATE).title == "가을"
+
+
+if __name__ == "__main__":
+    for test in (test_year_rollover, test_weeks_and_weekdays, test_relative_days_and_ranges,
+                 test_invalid_date, test_time_ranges, test_title_remainder):
+        test()
+        print(f"✅ {test.__doc__}")